@@ -2,19 +2,60 @@
 Main comic generation orchestrator
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import asyncio
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 import logging
-import json
+import os
+import socket
+import time
+import uuid
 from pathlib import Path
 
-from .services import ScriptGeneratorService, ArtworkGeneratorService
+from .services import ScriptGeneratorService, ArtworkGeneratorService, ImageDerivativeService
 from .models import ComicMetadata
+from .core import json_codec
+from .core.catalog import ComicCatalog
+from .core.compression import available_encodings, ensure_precompressed
+from .core.events import EventBus, SQLiteEventBus
+from .core.file_lock import InterProcessLock
 from .core.config import config
+from .core.http_cache import hash_bytes, hash_file
+from .core.image_codec import EXTENSION_FORMATS, ImageStageStats
+from .core.image_pool import image_pool
+from .core import job_store
+from .core.job_store import SQLiteJobStore
+from .core.metadata_store import SQLiteMetadataStore
+from .core.pipeline import StagedPipeline
 
 logger = logging.getLogger(__name__)
 
+# on_progress(topic index, topic status, comic, error) for batch generation
+BatchProgressCallback = Callable[[int, str, Optional[ComicMetadata], Optional[str]], None]
+
+
+class ComicBusyError(Exception):
+    """Another request is already changing the comic"""
+
+
+@dataclass
+class ComicJob:
+    """State for one comic as it moves through the generation stages"""
+    comic_id: str
+    topic: str
+    tone: str
+    target_audience: str
+    visual_style: str
+    use_cache: bool = True
+    start_time: float = field(default_factory=time.time)
+    generation_started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    script: Optional[Dict] = None
+    panels: Optional[List[Dict]] = None
+    panel_images: Optional[List[Any]] = None
+    image_stats: ImageStageStats = field(default_factory=ImageStageStats)
+    event_channels: List[str] = field(default_factory=list)  # Progress event channels besides comic:<id>
+
 
 class ComicGenerationEngine:
     """Main engine for orchestrating comic generation"""
@@ -22,153 +63,560 @@ class ComicGenerationEngine:
     def __init__(self):
         self.script_service = ScriptGeneratorService()
         self.artwork_service = ArtworkGeneratorService()
+        self.derivative_service = ImageDerivativeService()
         self.output_dir = Path("output/comics")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.metadata_store = SQLiteMetadataStore(config.comic.metadata_db_path)
+        self.catalog = ComicCatalog(self.output_dir, self.metadata_store,
+                                    config.comic.catalog_refresh_seconds)
+        self.catalog.build()
+        self.job_store = SQLiteJobStore(config.comic.jobs_db_path)
+        # Identity of this worker process in the shared job leases
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        # Serializes read-modify-write of comic metadata across worker processes
+        self._metadata_lock = InterProcessLock(self.output_dir.parent / ".metadata.lock")
+        self._batch_tasks: Dict[str, asyncio.Task] = {}
+        self._background_tasks: List[asyncio.Task] = []
+        # IDs of comics currently being generated, so concurrent requests never share a directory
+        self._active_comic_ids = set()
+        # Running generations by request key, so identical concurrent requests share one
+        self._inflight: Dict[tuple, tuple] = {}
+        # Most recent (or running) pipelined batch, for stage statistics
+        self._pipeline: Optional[StagedPipeline] = None
+        # Video jobs; each comic's video_status is the record, the queue only holds comic IDs
+        self._video_queue: Optional[asyncio.Queue] = None
+        self._video_workers: List[asyncio.Task] = []
+        self._queued_video_ids = set()
+        self._video_service = None
+        # Comics with a panel regeneration running in this process
+        self._regenerating_ids = set()
+        # Stage progress for the SSE stream (GET /api/events); shared through SQLite
+        # when several worker processes serve the API
+        if config.server.workers > 1:
+            self.events = SQLiteEventBus(config.comic.jobs_db_path, config.events.buffer_size,
+                                         config.events.poll_seconds)
+        else:
+            self.events = EventBus(config.events.buffer_size)
         logger.info("🎨 Comic generation engine initialized")
 
     async def generate_comic(self, topic: str, 
                            tone: str = "humorous",
                            target_audience: str = "general",
-                           visual_style: str = "modern digital comic") -> ComicMetadata:
+                           visual_style: str = "modern digital comic",
+                           use_cache: bool = True,
+                           event_channels: Optional[List[str]] = None,
+                           coalesce: bool = True) -> ComicMetadata:
         """
         Generate a complete comic from topic to final artwork
 
+        With config.comic.coalesce_requests, a request identical to one already running
+        (same topic, tone, audience and style) attaches to it and gets the same
+        ComicMetadata; with reuse_window_seconds, a comic finished within that window is
+        returned as is. use_cache=False or coalesce=False always starts a fresh generation.
+
         Args:
             topic: The topic/story to visualize
             tone: Comic tone (humorous, educational, dramatic, etc.)
             target_audience: Target audience
             visual_style: Visual art style
+            use_cache: Reuse cached upstream results for identical requests
+            event_channels: Extra channels that receive this comic's progress events
+            coalesce: Share an identical running or recent generation (see above)
 
         Returns:
             ComicMetadata with generation details and file paths
         """
-        import time
+        if not (config.comic.coalesce_requests and use_cache and coalesce):
+            job = self._create_job(topic, tone, target_audience, visual_style, use_cache, event_channels)
+            return await self._run_comic_job(job)
 
-        start_time = time.time()
-        generation_started_at = datetime.now().isoformat()
+        key = (topic.strip(), tone, target_audience, visual_style)
+        recent = self._find_recent_comic(*key)
+        if recent is not None:
+            logger.info("♻️ Reusing comic %s finished within the reuse window", recent.comic_id)
+            return recent
 
-        comic_id = self._generate_comic_id(topic=topic, tone=tone)
-        logger.info("🚀 Starting comic generation for: %s (ID: %s)", topic, comic_id)
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            job = self._create_job(topic, tone, target_audience, visual_style, use_cache, event_channels)
+            task = asyncio.create_task(self._run_comic_job(job))
+            self._inflight[key] = inflight = (task, job)
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            task, job = inflight
+            logger.info("🔗 Attaching to in-flight generation %s for: %s", job.comic_id, topic)
+            self._attach_channels(job, event_channels or [])
 
-        try:
-            # Step 1: Generate comic script using Gemini
-            logger.info("📝 Generating comic script...")
-            script = await self.script_service.generate_comic_script(
-                topic=topic,
-                tone=tone,
-                target_audience=target_audience
-            )
+        # Shielded, so one caller going away does not cancel the generation the others wait on
+        return await asyncio.shield(inflight[0])
 
-            # Step 2: Validate and prepare panels for artwork generation
-            logger.info("🔍 Validating panels for artwork generation...")
-            validated_panels = self._validate_panels(script.get('panels', []))
-            logger.info(f"✅ Validated {len(validated_panels)} panels")
-
-            # Step 3: Generate comic artwork using Imagen
-            logger.info("🎨 Generating comic artwork...")
-            comic_image_bytes = await self.artwork_service.generate_complete_comic(
-                panels=validated_panels,
-                style_theme=visual_style,
-                comic_id=comic_id
-            )
+    def _attach_channels(self, job: ComicJob, channels: List[str]) -> None:
+        """Add event channels to a running job, first replaying the events they missed"""
+        for channel in channels:
+            if channel in job.event_channels:
+                continue
+            self.events.copy_channel(f"comic:{job.comic_id}", channel)
+            job.event_channels.append(channel)
 
-            # Calculate processing time
-            end_time = time.time()
-            processing_time_seconds = end_time - start_time
-            generation_completed_at = datetime.now().isoformat()
-
-            logger.info("⏱️ Comic generation took %.2f seconds", processing_time_seconds)
-
-            # Step 4: Save outputs and create metadata
-            comic_metadata = await self._save_comic_outputs(
-                comic_id=comic_id,
-                script=script,
-                panels=validated_panels,
-                image_bytes=comic_image_bytes,
-                generation_params={
-                    'topic': topic,
-                    'tone': tone,
-                    'target_audience': target_audience,
-                    'visual_style': visual_style
-                },
-                processing_time_seconds=processing_time_seconds,
-                generation_started_at=generation_started_at,
-                generation_completed_at=generation_completed_at
-            )
+    def _find_recent_comic(self, topic: str, tone: str, target_audience: str,
+                           visual_style: str) -> Optional[ComicMetadata]:
+        """An identical comic finished within config.comic.reuse_window_seconds, if any"""
+        window = config.comic.reuse_window_seconds
+        if window <= 0:
+            return None
+        since = (datetime.now() - timedelta(seconds=window)).isoformat()
+        for comic in self.catalog.list(tone=tone, visual_style=visual_style, generated_after=since):
+            params = comic.generation_params or {}
+            if params.get('topic', '').strip() == topic and params.get('target_audience') == target_audience:
+                return comic
+        return None
 
-            logger.info("🎉 Comic generation completed successfully: %s", comic_id)
+    async def _run_comic_job(self, job: ComicJob) -> ComicMetadata:
+        """Run one comic through the script, artwork and compose/save stages"""
+        logger.info("🚀 Starting comic generation for: %s (ID: %s)", job.topic, job.comic_id)
+
+        try:
+            await self._script_stage(job)
+            await self._artwork_stage(job)
+            comic_metadata = await self._compose_stage(job)
+
+            logger.info("🎉 Comic generation completed successfully: %s", job.comic_id)
             return comic_metadata
 
         except Exception as e:
-            logger.error("❌ Comic generation failed for %s: %s", comic_id, str(e))
+            logger.error("❌ Comic generation failed for %s: %s", job.comic_id, str(e))
+            self._emit(job, "failed", error=str(e))
             raise
 
+        finally:
+            self._release_comic_id(job.comic_id)
+
+    def _create_job(self, topic: str, tone: str, target_audience: str, visual_style: str,
+                    use_cache: bool = True, event_channels: Optional[List[str]] = None) -> ComicJob:
+        """Reserve a comic ID and start timing a new generation"""
+        job = ComicJob(
+            comic_id=self._generate_comic_id(topic=topic, tone=tone),
+            topic=topic,
+            tone=tone,
+            target_audience=target_audience,
+            visual_style=visual_style,
+            use_cache=use_cache,
+            event_channels=list(event_channels or [])
+        )
+        self._emit(job, "started")
+        return job
+
+    def _emit(self, job: ComicJob, event: str, **data: Any) -> None:
+        """Publish a progress event for one comic to its own and any extra channels"""
+        payload = {"comic_id": job.comic_id, "topic": job.topic, **data}
+        for channel in [f"comic:{job.comic_id}", *job.event_channels]:
+            self.events.publish(channel, event, payload)
+
+    async def _script_stage(self, job: ComicJob) -> ComicJob:
+        """Generate the script with Gemini and validate its panels"""
+        # Step 1: Generate comic script using Gemini
+        logger.info("📝 Generating comic script...")
+        job.script = await self.script_service.generate_comic_script(
+            topic=job.topic,
+            tone=job.tone,
+            target_audience=job.target_audience,
+            use_cache=job.use_cache
+        )
+
+        # Step 2: Validate and prepare panels for artwork generation
+        logger.info("🔍 Validating panels for artwork generation...")
+        job.panels = self._validate_panels(job.script.get('panels', []))
+        logger.info(f"✅ Validated {len(job.panels)} panels")
+        self._emit(job, "script_done", title=job.script.get('title', 'Untitled Comic'),
+                   panel_count=len(job.panels))
+        return job
+
+    async def _artwork_stage(self, job: ComicJob) -> ComicJob:
+        """Render every panel with Imagen"""
+        # Step 3: Generate comic artwork using Imagen
+        logger.info("🎨 Generating comic artwork...")
+        job.panel_images = await self.artwork_service.render_panels(
+            panels=job.panels,
+            style_theme=job.visual_style,
+            comic_id=job.comic_id,
+            use_cache=job.use_cache,
+            on_panel_rendered=lambda i, total: self._emit(job, "panel_rendered", panel=i + 1, total=total),
+            stats=job.image_stats
+        )
+        return job
+
+    async def _compose_stage(self, job: ComicJob) -> ComicMetadata:
+        """Compose the final comic image, then save outputs and metadata"""
+        # Composition and encoding run in the image process pool, off the event loop
+        comic_image_bytes = await self.artwork_service.compose_comic(job.panel_images, job.image_stats)
+        job.panel_images = None
+        self._emit(job, "composed")
+
+        image_stats = job.image_stats.summary()
+        logger.info("📊 Image stages for %s: %s", job.comic_id, ", ".join(
+            f"{stage} {entry['ms']}ms/{entry['bytes']}B x{entry['count']}" for stage, entry in image_stats.items()
+        ))
+
+        # Calculate processing time
+        processing_time_seconds = time.time() - job.start_time
+        generation_completed_at = datetime.now().isoformat()
+
+        logger.info("⏱️ Comic generation took %.2f seconds", processing_time_seconds)
+
+        # Step 4: Save outputs and create metadata
+        comic_metadata = await self._save_comic_outputs(
+            comic_id=job.comic_id,
+            script=job.script,
+            panels=job.panels,
+            image_bytes=comic_image_bytes,
+            generation_params={
+                'topic': job.topic,
+                'tone': job.tone,
+                'target_audience': job.target_audience,
+                'visual_style': job.visual_style
+            },
+            processing_time_seconds=processing_time_seconds,
+            generation_started_at=job.generation_started_at,
+            generation_completed_at=generation_completed_at,
+            image_stats=image_stats
+        )
+        self._emit(job, "saved", comic=comic_metadata.to_dict())
+        return comic_metadata
+
     async def generate_batch_comics(self, topics: List[str], 
                                   tone: str = "humorous",
-                                  visual_style: str = "modern digital comic") -> List[ComicMetadata]:
+                                  visual_style: str = "modern digital comic",
+                                  pipelined: Optional[bool] = None,
+                                  on_progress: Optional[BatchProgressCallback] = None,
+                                  event_channels: Optional[List[str]] = None) -> List[ComicMetadata]:
         """
         Generate multiple comics for different topics
 
+        A topic listed more than once gets a comic per occurrence, in both modes: only its
+        first occurrence is coalesced with identical requests from other callers.
+
         Args:
             topics: List of topics to generate comics for
             tone: Comic tone
             visual_style: Visual art style
+            pipelined: Use the staged pipeline (defaults to config.pipeline.enabled)
+            on_progress: Called as each topic starts running, finishes or fails
+            event_channels: Extra channels that receive every comic's progress events
 
         Returns:
             List of ComicMetadata for successfully generated comics
         """
-        comics = []
         total_topics = len(topics)
+        if not total_topics:
+            return []
 
-        logger.info("🔄 Starting batch generation for %d topics", total_topics)
+        if pipelined is None:
+            pipelined = config.pipeline.enabled
+        if pipelined:
+            return await self._generate_batch_pipelined(topics, tone, visual_style, on_progress, event_channels)
 
-        for i, topic in enumerate(topics):
-            logger.info("📚 Generating comic %d/%d for topic: %s", i+1, total_topics, topic)
-            try:
-                comic = await self.generate_comic(
-                    topic=topic,
-                    tone=tone,
-                    visual_style=visual_style
-                )
-                comics.append(comic)
+        progress = on_progress or (lambda *args: None)
 
-                # Add delay to respect API rate limits
-                if i < total_topics - 1:  # Don't wait after the last comic
-                    await asyncio.sleep(2)
+        # Upstream quota is enforced by the shared Gemini/Imagen rate limiters,
+        # so topics only need a concurrency cap here
+        semaphore = asyncio.Semaphore(max(1, config.rate_limits.batch_concurrency))
 
-            except Exception as e:
-                logger.error("❌ Failed to generate comic for topic '%s': %s", topic, str(e))
-                continue
+        logger.info("🔄 Starting batch generation for %d topics (concurrency %d)",
+                   total_topics, config.rate_limits.batch_concurrency)
+
+        # Coalescing merges identical requests, not the repeats within this one
+        seen = set()
+        repeated = []
+        for topic in topics:
+            repeated.append(topic.strip() in seen)
+            seen.add(topic.strip())
+
+        async def generate_topic(i: int, topic: str) -> Optional[ComicMetadata]:
+            async with semaphore:
+                logger.info("📚 Generating comic %d/%d for topic: %s", i+1, total_topics, topic)
+                progress(i, job_store.TOPIC_RUNNING, None, None)
+                try:
+                    comic = await self.generate_comic(
+                        topic=topic,
+                        tone=tone,
+                        visual_style=visual_style,
+                        event_channels=event_channels,
+                        coalesce=not repeated[i]
+                    )
+                except Exception as e:
+                    logger.error("❌ Failed to generate comic for topic '%s': %s", topic, str(e))
+                    progress(i, job_store.TOPIC_FAILED, None, str(e))
+                    return None
+                progress(i, job_store.TOPIC_DONE, comic, None)
+                return comic
+
+        # gather keeps results in topic order; failed topics are dropped as before
+        results = await asyncio.gather(*(generate_topic(i, topic) for i, topic in enumerate(topics)))
+        comics = [comic for comic in results if comic is not None]
 
         success_rate = len(comics) / total_topics * 100
         logger.info("🏁 Batch generation completed: %d/%d comics (%.1f%% success rate)", 
                    len(comics), total_topics, success_rate)
         return comics
 
-    def list_generated_comics(self) -> List[ComicMetadata]:
-        """List all generated comics with their metadata"""
-        comics = []
+    async def _generate_batch_pipelined(self, topics: List[str], tone: str, visual_style: str,
+                                        on_progress: Optional[BatchProgressCallback] = None,
+                                        event_channels: Optional[List[str]] = None
+                                        ) -> List[ComicMetadata]:
+        """
+        Generate a batch through separate script, artwork and compose/save stages
+
+        Each stage has its own worker pool and bounded queue, so one comic's script
+        is written while another's panels render and a third is composed.
+        """
+        total_topics = len(topics)
+        progress = on_progress or (lambda *args: None)
+        # Topic index per comic ID, for progress reports from the later stages
+        topic_index: Dict[str, int] = {}
+
+        async def script_stage(item: tuple) -> ComicJob:
+            i, topic = item
+            job = self._create_job(topic, tone, "general", visual_style, event_channels=event_channels)
+            topic_index[job.comic_id] = i
+            logger.info("📚 Pipeline: starting comic for topic: %s (ID: %s)", topic, job.comic_id)
+            progress(i, job_store.TOPIC_RUNNING, None, None)
+            try:
+                return await self._script_stage(job)
+            except Exception as e:
+                # on_error only gets (i, topic) from this stage, so the job is cleaned up here
+                self._release_comic_id(job.comic_id)
+                self._emit(job, "failed", error=str(e))
+                raise
+
+        async def compose_stage(job: ComicJob) -> ComicMetadata:
+            try:
+                comic = await self._compose_stage(job)
+            finally:
+                self._release_comic_id(job.comic_id)
+            progress(topic_index[job.comic_id], job_store.TOPIC_DONE, comic, None)
+            return comic
+
+        def on_error(item: Any, stage_name: str, error: Exception) -> None:
+            if isinstance(item, ComicJob):
+                self._release_comic_id(item.comic_id)
+                self._emit(item, "failed", error=str(error))
+                i, topic = topic_index[item.comic_id], item.topic
+            else:
+                i, topic = item
+            progress(i, job_store.TOPIC_FAILED, None, str(error))
+            logger.error("❌ Failed to generate comic for topic '%s' at %s stage: %s",
+                         topic, stage_name, str(error))
 
+        pipeline_config = config.pipeline
+        self._pipeline = StagedPipeline(
+            stages=[
+                ("script", script_stage, pipeline_config.script_workers),
+                ("artwork", self._artwork_stage, pipeline_config.artwork_workers),
+                ("compose", compose_stage, pipeline_config.compose_workers),
+            ],
+            queue_size=pipeline_config.queue_size,
+            on_error=on_error
+        )
+
+        logger.info("🔄 Starting pipelined batch generation for %d topics", total_topics)
+        results = await self._pipeline.run(list(enumerate(topics)))
+        comics = [comic for comic in results if comic is not None]
+
+        logger.info("🏁 Pipelined batch completed: %d/%d comics (%.1f%% success rate)",
+                   len(comics), total_topics, len(comics) / total_topics * 100)
+        logger.info("📊 Pipeline stage stats: %s", self._pipeline.stats())
+        return comics
+
+    def create_batch_job(self, topics: List[str], tone: str, visual_style: str) -> str:
+        """Persist a new batch job with every topic queued and return its ID"""
+        return self.job_store.create_job(topics, tone, visual_style)
+
+    def start_batch_job(self, job_id: str, resume: bool = False) -> bool:
+        """
+        Run a stored batch job in the background if this process can take its lease
+
+        Returns:
+            False when the job already runs here or in another worker process
+        """
+        if job_id in self._batch_tasks or not self._acquire_lease(f"batch:{job_id}"):
+            return False
+
+        async def run() -> None:
+            try:
+                await self.run_batch_job(job_id, resume=resume)
+            finally:
+                self.job_store.release_lease(f"batch:{job_id}", self.instance_id)
+
+        self._batch_tasks[job_id] = asyncio.create_task(run())
+        self._batch_tasks[job_id].add_done_callback(lambda _: self._batch_tasks.pop(job_id, None))
+        return True
+
+    async def run_batch_job(self, job_id: str, resume: bool = False) -> None:
+        """
+        Generate a stored batch job's queued topics, recording each topic's progress
+
+        Args:
+            job_id: Batch job ID from create_batch_job
+            resume: The job was interrupted by a restart; topics left running are
+                requeued, and topics whose comic was already saved are marked done
+        """
+        store = self.job_store
+        if resume:
+            requeued = store.requeue_interrupted(job_id)
+            logger.info("♻️ Resuming batch job %s (%d interrupted topics requeued)", job_id, requeued)
+
+        job = store.get_job(job_id)
+        if job is None:
+            logger.error("❌ Batch job %s not found", job_id)
+            return
+
+        tone, visual_style = job['tone'], job['visual_style']
+        pending = []
+        for topic in job['topics']:
+            if topic['status'] != job_store.TOPIC_QUEUED:
+                continue
+            finished = self._find_batch_comic(topic['topic'], tone, visual_style, job['created_at']) if resume else None
+            if finished is not None:
+                logger.info("⏭️ Topic '%s' already has comic %s, skipping", topic['topic'], finished.comic_id)
+                store.set_topic_status(job_id, topic['position'], job_store.TOPIC_DONE, comic_id=finished.comic_id)
+            else:
+                pending.append(topic)
+
+        def on_progress(i: int, status: str, comic: Optional[ComicMetadata], error: Optional[str]) -> None:
+            store.set_topic_status(job_id, pending[i]['position'], status,
+                                   comic_id=comic.comic_id if comic else None, error=error)
+            self._emit_batch_status(job_id)
+
+        store.set_job_status(job_id, job_store.JOB_IN_PROGRESS)
+        self._emit_batch_status(job_id)
         try:
-            for comic_dir in self.output_dir.iterdir():
-                if comic_dir.is_dir():
-                    metadata_file = comic_dir / "metadata.json"
-                    if metadata_file.exists():
-                        try:
-                            with open(metadata_file, 'r', encoding='utf-8') as f:
-                                metadata_dict = json.load(f)
-                                comics.append(ComicMetadata.from_dict(metadata_dict))
-                        except Exception as e:
-                            logger.warning("Could not read metadata for %s: %s", comic_dir.name, str(e))
-
-            # Sort by generation time (newest first)
-            comics.sort(key=lambda x: x.generated_at, reverse=True)
-            return comics
+            await self.generate_batch_comics(
+                topics=[topic['topic'] for topic in pending],
+                tone=tone,
+                visual_style=visual_style,
+                on_progress=on_progress,
+                event_channels=[f"batch:{job_id}"]
+            )
+            store.set_job_status(job_id, job_store.JOB_COMPLETED)
+        except Exception as e:
+            logger.error(f"Batch generation failed: {str(e)}")
+            store.set_job_status(job_id, job_store.JOB_FAILED, error=str(e))
+        self._emit_batch_status(job_id)
+
+    def _emit_batch_status(self, job_id: str) -> None:
+        """Publish the full batch status, so a client can render it without polling"""
+        status = self.get_batch_job(job_id)
+        if status is not None:
+            self.events.publish(f"batch:{job_id}", "batch_status", status)
+
+    def _find_batch_comic(self, topic: str, tone: str, visual_style: str,
+                          since: str) -> Optional[ComicMetadata]:
+        """A comic saved for this batch topic since the job was created, if any"""
+        for comic in self.catalog.list(tone=tone, visual_style=visual_style, generated_after=since):
+            if (comic.generation_params or {}).get('topic') == topic:
+                return comic
+        return None
+
+    def _acquire_lease(self, resource: str) -> bool:
+        return self.job_store.acquire_lease(resource, self.instance_id, config.server.lease_ttl_seconds)
 
+    def get_batch_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Status of a batch job in the shape served by the batch status endpoint
+
+        Returns:
+            Dict with overall status and counts, finished comics, errors and per-topic progress
+        """
+        job = self.job_store.get_job(job_id)
+        if job is None:
+            return None
+
+        topics = job['topics']
+        comics = []
+        for topic in topics:
+            if topic['status'] == job_store.TOPIC_DONE and topic['comic_id']:
+                comic = self.catalog.get(topic['comic_id'])
+                if comic is not None:
+                    comics.append(comic.to_dict())
+
+        status = {
+            "task_id": job_id,
+            "status": job['status'],
+            "total": len(topics),
+            "completed": sum(1 for topic in topics if topic['status'] == job_store.TOPIC_DONE),
+            "failed": sum(1 for topic in topics if topic['status'] == job_store.TOPIC_FAILED),
+            "comics": comics,
+            "started_at": job['created_at'],
+            "errors": [
+                {"topic": topic['topic'], "error": topic['error']}
+                for topic in topics if topic['status'] == job_store.TOPIC_FAILED
+            ],
+            "topics": topics
+        }
+        if job['completed_at']:
+            status["completed_at"] = job['completed_at']
+        if job['error']:
+            status["error"] = job['error']
+        return status
+
+    def get_pipeline_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage queue depth and utilization for the current or last pipelined batch"""
+        if self._pipeline is None:
+            return {}
+        return self._pipeline.stats()
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters for the upstream result caches"""
+        stats = {}
+        if self.script_service.script_cache is not None:
+            stats['script'] = self.script_service.script_cache.stats()
+        if self.artwork_service.image_cache is not None:
+            stats['imagen'] = self.artwork_service.image_cache.stats()
+        return stats
+
+    def list_generated_comics(self) -> List[ComicMetadata]:
+        """List all generated comics with their metadata (newest first)"""
+        try:
+            return list(self.catalog.list())
         except Exception as e:
             logger.error(f"Failed to list generated comics: {str(e)}")
             return []
 
+    def list_comics_page(self, limit: int, cursor: Optional[str] = None,
+                         tone: Optional[str] = None,
+                         visual_style: Optional[str] = None,
+                         video_status: Optional[str] = None,
+                         generated_from: Optional[str] = None,
+                         generated_to: Optional[str] = None) -> Dict[str, Any]:
+        """
+        List one page of comics (newest first) with server-side filters
+
+        Args:
+            limit: Page size
+            cursor: next_cursor from the previous page
+            tone: Only comics generated with this tone
+            visual_style: Only comics generated with this visual style
+            video_status: Only comics with this video status
+            generated_from: Inclusive lower bound on generated_at (ISO 8601)
+            generated_to: Exclusive upper bound on generated_at (ISO 8601)
+
+        Returns:
+            Dict with 'comics', 'total' and 'next_cursor'
+        """
+        return self.catalog.page(
+            limit,
+            cursor=cursor,
+            tone=tone,
+            visual_style=visual_style,
+            video_status=video_status,
+            generated_after=generated_from,
+            generated_before=generated_to
+        )
+
+    async def get_comic(self, comic_id: str) -> Optional[ComicMetadata]:
+        """Get one comic's metadata by ID (from memory; a miss is looked up in a worker thread)"""
+        return self.catalog.cached(comic_id) or await asyncio.to_thread(self.catalog.load, comic_id)
+
     def _validate_panels(self, panels: List[Dict]) -> List[Dict]:
         """Validate and fix panel data for artwork generation"""
         validated_panels = []
@@ -198,7 +646,8 @@ class ComicGenerationEngine:
                                 generation_params: Dict,
                                 processing_time_seconds: float = None,
                                 generation_started_at: str = None,
-                                generation_completed_at: str = None) -> ComicMetadata:
+                                generation_completed_at: str = None,
+                                image_stats: Optional[Dict[str, Dict[str, float]]] = None) -> ComicMetadata:
         """Save comic outputs and return metadata"""
 
         # Create comic-specific directory
@@ -207,13 +656,20 @@ class ComicGenerationEngine:
 
         # Save script as JSON
         script_path = comic_dir / "script.json"
-        with open(script_path, 'w', encoding='utf-8') as f:
-            json.dump(script, f, indent=2, ensure_ascii=False)
+        script_bytes = json_codec.dumps(script, indent=True)
+        await asyncio.to_thread(script_path.write_bytes, script_bytes)
+
+        # The script endpoint serves these compressed copies as-is
+        await asyncio.to_thread(
+            lambda: [ensure_precompressed(script_path, encoding) for encoding in available_encodings()]
+        )
 
         # Save comic image
         image_path = comic_dir / f"comic.{config.comic.output_format.lower()}"
-        with open(image_path, 'wb') as f:
-            f.write(image_bytes)
+        await asyncio.to_thread(image_path.write_bytes, image_bytes)
+
+        # Gallery thumbnails are requested right away, so create them now rather than on first view
+        await asyncio.to_thread(self.derivative_service.pregenerate, image_path)
 
         # Create panel image paths list
         panel_image_paths = []
@@ -222,6 +678,10 @@ class ComicGenerationEngine:
             if panel_image_path.exists():
                 panel_image_paths.append(str(panel_image_path))
 
+        panel_hashes = await asyncio.to_thread(
+            lambda: {Path(p).stem: hash_file(Path(p)) for p in panel_image_paths}
+        )
+
         # Create and save metadata
         metadata = ComicMetadata(
             comic_id=comic_id,
@@ -237,30 +697,473 @@ class ComicGenerationEngine:
             processing_time_seconds=processing_time_seconds,
             generation_started_at=generation_started_at,
             generation_completed_at=generation_completed_at,
-            panel_image_paths=panel_image_paths
+            panel_image_paths=panel_image_paths,
+            image_stats=image_stats,
+            # Content hashes back the strong ETags on the asset endpoints
+            file_hashes={
+                'script': hash_bytes(script_bytes),
+                'image': hash_bytes(image_bytes),
+                **panel_hashes
+            }
         )
 
-        metadata_path = comic_dir / "metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata.to_dict(), f, indent=2, ensure_ascii=False)
-
+        await self.update_comic_metadata(metadata)
         return metadata
 
-    def update_comic_metadata(self, comic_metadata: ComicMetadata) -> None:
-        """Update comic metadata file"""
+    def start_background_workers(self) -> None:
+        """
+        Start the image process pool, video workers, lease renewal and recovery of
+        orphaned batch/video jobs
+
+        Must be called from the running event loop (at application startup).
+        """
+        if self._video_queue is not None:
+            return
+        image_pool.start()
+        self._video_queue = asyncio.Queue()
+        self._video_workers = [
+            asyncio.create_task(self._video_worker())
+            for _ in range(max(1, config.video.job_workers))
+        ]
+        self._background_tasks = [
+            asyncio.create_task(self._renew_leases()),
+            asyncio.create_task(self._recover_orphaned_jobs()),
+            asyncio.create_task(self._refresh_catalog()),
+        ]
+
+    async def stop_background_workers(self) -> None:
+        """Cancel background work and hand this process's jobs over to the other workers"""
+        tasks = [*self._video_workers, *self._background_tasks, *self._batch_tasks.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.job_store.release_leases(self.instance_id)
+        await asyncio.to_thread(image_pool.shutdown)
+
+    async def _renew_leases(self) -> None:
+        """Keep this process's batch and video leases alive"""
+        while True:
+            await asyncio.sleep(config.server.lease_ttl_seconds / 3)
+            try:
+                self.job_store.renew_leases(self.instance_id, config.server.lease_ttl_seconds)
+            except Exception as e:
+                logger.error(f"Failed to renew job leases: {str(e)}")
+
+    async def _refresh_catalog(self) -> None:
+        """Pick up comics changed by other worker processes or on disk, off the request path"""
+        while True:
+            await asyncio.sleep(self.catalog.refresh_seconds)
+            await asyncio.to_thread(self.catalog.refresh)
+
+    async def _recover_orphaned_jobs(self) -> None:
+        """
+        Periodically take over batch jobs and videos whose worker died or restarted
+
+        A job is orphaned once its lease expires; whichever worker acquires the lease
+        first resumes it.
+        """
+        while True:
+            try:
+                for job_id in self.job_store.unfinished_jobs():
+                    if self.start_batch_job(job_id, resume=True):
+                        logger.info(f"♻️ Recovered batch job {job_id}")
+
+                for comic in self.catalog.list(video_status="generating"):
+                    if comic.comic_id in self._queued_video_ids:
+                        continue
+                    if self._acquire_lease(f"video:{comic.comic_id}"):
+                        logger.info(f"♻️ Recovering interrupted video job for comic {comic.comic_id}")
+                        self._enqueue_video_job(comic.comic_id)
+            except Exception as e:
+                logger.error(f"Job recovery failed: {str(e)}")
+            await asyncio.sleep(config.server.recovery_interval_seconds)
+
+    async def submit_video_job(self, comic_metadata: ComicMetadata) -> Dict[str, Any]:
+        """
+        Queue video generation for a comic unless its video exists or is already queued
+
+        Returns:
+            The job status, as from get_video_job
+        """
+        comic_id = comic_metadata.comic_id
+
+        def claim() -> tuple:
+            with self._metadata_lock:
+                comic = self.catalog.load(comic_id) or comic_metadata
+                if comic.video_status == "completed" and comic.video_url:
+                    return comic, False
+                # Already queued here or running in another worker process
+                if comic_id in self._queued_video_ids or not self._acquire_lease(f"video:{comic_id}"):
+                    return comic, False
+                # Marked under the lock so a concurrent request in this process sees it
+                self._queued_video_ids.add(comic_id)
+
+                comic.video_status = "generating"
+                comic.video_error = None
+                self.catalog.save(comic)
+                return comic, True
+
+        # The lock can wait on other worker processes
+        comic_metadata, claimed = await asyncio.to_thread(claim)
+        if not claimed:
+            return self.get_video_job(comic_metadata)
+
+        self._enqueue_video_job(comic_id)
+        logger.info(f"🎬 Queued video generation for comic {comic_id}")
+        self._emit_video_status(comic_metadata)
+        return self.get_video_job(comic_metadata)
+
+    def _emit_video_status(self, comic_metadata: ComicMetadata) -> None:
+        self.events.publish(f"comic:{comic_metadata.comic_id}", "video_status",
+                            self.get_video_job(comic_metadata))
+
+    def get_video_job(self, comic_metadata: ComicMetadata) -> Dict[str, Any]:
+        """Video job status derived from the comic's video fields"""
+        return {
+            "job_id": f"video_{comic_metadata.comic_id}",
+            "comic_id": comic_metadata.comic_id,
+            "status": comic_metadata.video_status,
+            "video_url": comic_metadata.video_url,
+            "panel_video_uris": comic_metadata.panel_video_uris,
+            "generated_at": comic_metadata.video_generated_at,
+            "processing_time_seconds": comic_metadata.video_processing_time_seconds,
+            "error": comic_metadata.video_error
+        }
+
+    def _enqueue_video_job(self, comic_id: str) -> None:
+        if self._video_queue is None:
+            raise RuntimeError("Video workers are not running")
+        self._queued_video_ids.add(comic_id)
+        self._video_queue.put_nowait(comic_id)
+
+    async def _video_worker(self) -> None:
+        """Run queued video jobs one at a time"""
+        while True:
+            comic_id = await self._video_queue.get()
+            try:
+                await self._run_video_job(comic_id)
+            except Exception as e:
+                logger.error(f"Video job for comic {comic_id} crashed: {str(e)}")
+            finally:
+                self._queued_video_ids.discard(comic_id)
+                self.job_store.release_lease(f"video:{comic_id}", self.instance_id)
+                self._video_queue.task_done()
+
+    async def _run_video_job(self, comic_id: str) -> None:
+        """Generate, join and record one comic's video, marking the comic failed on any error"""
+        comic = await self.get_comic(comic_id)
+        if comic is None:
+            logger.warning(f"Comic {comic_id} disappeared before its video job ran")
+            return
+
         try:
-            comic_dir = self.output_dir / comic_metadata.comic_id
-            metadata_file = comic_dir / "metadata.json"
+            if self._video_service is None:
+                # Imported here so the Veo client is only created once videos are requested
+                from .services.video_service import VideoGenerationService
+                self._video_service = VideoGenerationService()
+
+            script_path = Path(comic.files["script"])
+            script = json_codec.loads(await asyncio.to_thread(script_path.read_bytes))
+
+            start_time = time.time()
+            logger.info(f"Starting video generation for comic {comic_id}")
+            video_result = await self._video_service.generate_video_from_script(
+                script, comic.title, comic_id,
+                on_panel_done=lambda panel, total: self.events.publish(
+                    f"comic:{comic_id}", "video_panel_done",
+                    {"comic_id": comic_id, "panel": panel, "total": total}
+                )
+            )
+            processing_time = time.time() - start_time
+
+            if not video_result or not isinstance(video_result, dict):
+                raise RuntimeError("no video result returned")
+            final_video_path = video_result.get('final_video_path')
+            if not final_video_path:
+                raise RuntimeError("no final video path")
+            video_hash = await asyncio.to_thread(hash_file, Path(final_video_path))
+
+            def record_video(comic: ComicMetadata) -> None:
+                comic.video_url = final_video_path
+                comic.video_status = "completed"
+                comic.video_error = None
+                comic.video_generated_at = datetime.now().isoformat()
+                comic.video_processing_time_seconds = processing_time
+                comic.panel_video_uris = video_result.get('panel_video_uris', [])
+                comic.files["video"] = final_video_path
+                # Panel videos were rewritten too, so drop their stale hashes
+                comic.file_hashes = {
+                    **{key: value for key, value in (comic.file_hashes or {}).items()
+                       if not key.endswith("_video")},
+                    "video": video_hash
+                }
+
+            comic = await self.modify_comic_metadata(comic_id, record_video) or comic
+            logger.info(f"Video generated successfully for comic {comic_id} in {processing_time:.2f}s")
+            self._emit_video_status(comic)
+
+        except Exception as e:
+            logger.error(f"Video generation failed for comic {comic_id}: {str(e)}")
+            error = str(e)
+
+            def record_failure(comic: ComicMetadata) -> None:
+                comic.video_status = "failed"
+                comic.video_error = error
+
+            comic = await self.modify_comic_metadata(comic_id, record_failure) or comic
+            self._emit_video_status(comic)
+
+    async def regenerate_panel(self, comic_id: str, panel_number: int) -> Optional[ComicMetadata]:
+        """
+        Render one panel again from the stored script and recompose the comic from the saved panels
+
+        Costs one Imagen call instead of a full regeneration (script plus every panel).
+        The comic image, its derivatives and the hashes behind the asset ETags are updated.
+
+        Args:
+            comic_id: Comic to fix
+            panel_number: 1-based panel to render again
+
+        Returns:
+            The updated metadata, or None if the comic does not exist
+
+        Raises:
+            ValueError: panel_number is out of range
+            ComicBusyError: A panel of the comic is already being regenerated (by any worker)
+        """
+        comic = await self.get_comic(comic_id)
+        if comic is None:
+            return None
+        if not 1 <= panel_number <= comic.panel_count:
+            raise ValueError(f"Panel number must be between 1 and {comic.panel_count}")
+
+        lease = f"regenerate:{comic_id}"
+        if comic_id in self._regenerating_ids or not self._acquire_lease(lease):
+            raise ComicBusyError(f"A panel of comic {comic_id} is already being regenerated")
+        self._regenerating_ids.add(comic_id)
+        try:
+            return await self._regenerate_panel(comic, panel_number)
+        finally:
+            self._regenerating_ids.discard(comic_id)
+            self.job_store.release_lease(lease, self.instance_id)
+
+    async def _regenerate_panel(self, comic: ComicMetadata, panel_number: int) -> ComicMetadata:
+        comic_id = comic.comic_id
+        start_time = time.time()
+        script = json_codec.loads(await asyncio.to_thread(Path(comic.files["script"]).read_bytes))
+        panels = self._validate_panels(script.get('panels', []))
+        if panel_number > len(panels):
+            raise ValueError(f"Script of comic {comic_id} has no panel {panel_number}")
+
+        image_path = Path(comic.files["image"])
+        comic_dir = image_path.parent
+        stats = ImageStageStats()
+
+        logger.info(f"🔁 Regenerating panel {panel_number} of comic {comic_id}")
+        new_panel = await self.artwork_service.rerender_panel(
+            panels[panel_number - 1],
+            panel_number,
+            style_theme=(comic.generation_params or {}).get('visual_style', "modern digital comic"),
+            comic_id=comic_id,
+            stats=stats
+        )
 
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(comic_metadata.to_dict(), f, indent=2, ensure_ascii=False)
+        # Every other panel comes from disk; keep the image's original format
+        panel_images = await self.artwork_service.load_saved_panels(
+            comic_dir, panels, stats, loaded={panel_number: new_panel}
+        )
+        del new_panel
+        image_bytes = await self.artwork_service.compose_comic(
+            panel_images, stats, image_format=EXTENSION_FORMATS.get(image_path.suffix.lower())
+        )
+        del panel_images
+
+        def replace_image() -> None:
+            tmp_path = image_path.with_name(f".{image_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(image_bytes)
+            os.replace(tmp_path, image_path)
+            # Cached resizes show the old panel
+            self.derivative_service.invalidate(image_path)
+
+        await asyncio.to_thread(replace_image)
+        await asyncio.to_thread(self.derivative_service.pregenerate, image_path)
+
+        panel_path = comic_dir / f"panel_{panel_number}_image.png"
+        panel_hash = await asyncio.to_thread(hash_file, panel_path)
+
+        def record_panel(comic: ComicMetadata) -> None:
+            paths = set(comic.panel_image_paths or [])
+            if not any(Path(p).name == panel_path.name for p in paths):
+                paths.add(str(panel_path))
+            comic.panel_image_paths = sorted(paths, key=lambda p: int(Path(p).stem.split('_')[1]))
+            comic.file_hashes = {
+                **(comic.file_hashes or {}),
+                'image': hash_bytes(image_bytes),
+                f"panel_{panel_number}_image": panel_hash
+            }
+
+        comic = await self.modify_comic_metadata(comic_id, record_panel) or comic
+        logger.info("📊 Image stages for panel %s of %s: %s", panel_number, comic_id, stats.summary())
+        logger.info(f"✅ Regenerated panel {panel_number} of comic {comic_id} in {time.time() - start_time:.2f}s")
+        self.events.publish(f"comic:{comic_id}", "panel_regenerated",
+                            {"comic_id": comic_id, "panel": panel_number,
+                             "image_hash": comic.file_hashes.get('image')})
+        return comic
+
+    async def update_comic_metadata(self, comic_metadata: ComicMetadata) -> None:
+        """Update comic metadata in the store and its metadata.json export"""
+        def save() -> None:
+            with self._metadata_lock:
+                self.catalog.save(comic_metadata)
 
+        try:
+            await asyncio.to_thread(save)
             logger.info(f"Updated metadata for comic {comic_metadata.comic_id}")
 
         except Exception as e:
             logger.error(f"Failed to update comic metadata {comic_metadata.comic_id}: {str(e)}")
             raise
 
+    async def modify_comic_metadata(self, comic_id: str,
+                                    update: Callable[[ComicMetadata], None]) -> Optional[ComicMetadata]:
+        """
+        Read-modify-write one comic's metadata under the cross-process metadata lock
+
+        The comic is re-read inside the lock, so changes saved by other workers
+        (file hashes, video status) are never overwritten with a stale copy. The
+        lock is taken in a worker thread, since it can wait on other processes;
+        update runs there too.
+
+        Args:
+            comic_id: Comic to change
+            update: Mutates the freshly read ComicMetadata in place
+
+        Returns:
+            The saved metadata, or None if the comic does not exist
+        """
+        def modify() -> Optional[ComicMetadata]:
+            with self._metadata_lock:
+                comic_metadata = self.catalog.load(comic_id)
+                if comic_metadata is None:
+                    return None
+                update(comic_metadata)
+                self.catalog.save(comic_metadata)
+            return comic_metadata
+
+        return await asyncio.to_thread(modify)
+
+    def get_panel_asset_path(self, comic_metadata: ComicMetadata, panel_number: int,
+                             kind: str) -> Optional[Path]:
+        """
+        Locate one panel's image or video on disk
+
+        Args:
+            comic_metadata: The comic
+            panel_number: 1-based panel number
+            kind: 'image' or 'video'
+
+        Returns:
+            Path of the file, or None if it does not exist
+        """
+        if panel_number < 1 or panel_number > comic_metadata.panel_count:
+            return None
+
+        path = None
+        if kind == 'image' and comic_metadata.panel_image_paths:
+            # panel_image_paths only lists panels that were saved, so match by file name
+            name = f"panel_{panel_number}_image.png"
+            path = next((Path(p) for p in comic_metadata.panel_image_paths if Path(p).name == name), None)
+        if path is None:
+            comic_dir = Path(comic_metadata.files['image']).parent
+            path = comic_dir / f"panel_{panel_number}_{kind}.{'png' if kind == 'image' else 'mp4'}"
+
+        return path if path.exists() else None
+
+    async def get_panel_manifest(self, comic_metadata: ComicMetadata) -> List[Dict[str, Any]]:
+        """
+        Describe every panel's image and video: byte size, pixel size and content hash
+
+        Args:
+            comic_metadata: The comic
+
+        Returns:
+            One entry per panel, in panel order
+        """
+        def locate() -> Dict[str, Path]:
+            paths = {}
+            for panel_number in range(1, comic_metadata.panel_count + 1):
+                for kind in ('image', 'video'):
+                    path = self.get_panel_asset_path(comic_metadata, panel_number, kind)
+                    if path is not None:
+                        paths[f"panel_{panel_number}_{kind}"] = path
+            return paths
+
+        paths = await asyncio.to_thread(locate)
+        # Hashes missing from older comics are saved in one metadata write, not one per panel
+        hashes = await self.ensure_file_hashes(comic_metadata, paths)
+
+        manifest = []
+        for panel_number in range(1, comic_metadata.panel_count + 1):
+            entry = {'panel_number': panel_number, 'image': None, 'video': None}
+            for kind in ('image', 'video'):
+                key = f"panel_{panel_number}_{kind}"
+                if key not in paths:
+                    continue
+                asset = {'bytes': paths[key].stat().st_size, 'hash': hashes[key]}
+                if kind == 'image':
+                    asset['width'], asset['height'] = await asyncio.to_thread(self._image_dimensions, paths[key])
+                entry[kind] = asset
+            manifest.append(entry)
+        return manifest
+
+    @staticmethod
+    def _image_dimensions(path: Path) -> tuple:
+        """Read pixel dimensions from the image header without decoding it"""
+        from PIL import Image
+
+        with Image.open(path) as img:
+            return img.size
+
+    async def ensure_file_hash(self, comic_metadata: ComicMetadata, file_key: str, path: Path) -> str:
+        """
+        Get the stored content hash of one of a comic's files, computing and saving it if missing
+
+        Args:
+            comic_metadata: The comic
+            file_key: Key in file_hashes ('image', 'script', 'video')
+            path: Path of the file to hash when no hash is stored
+
+        Returns:
+            SHA-256 hex digest
+        """
+        return (await self.ensure_file_hashes(comic_metadata, {file_key: path}))[file_key]
+
+    async def ensure_file_hashes(self, comic_metadata: ComicMetadata,
+                                 paths: Dict[str, Path]) -> Dict[str, str]:
+        """
+        Get the stored content hashes of several of a comic's files, saving the missing ones in one write
+
+        Args:
+            comic_metadata: The comic
+            paths: Path to hash, per file_hashes key, for when no hash is stored
+
+        Returns:
+            SHA-256 hex digest per key of paths
+        """
+        hashes = comic_metadata.file_hashes or {}
+        missing = {key: path for key, path in paths.items() if key not in hashes}
+        if missing:
+            # Comics saved before hashes were recorded get theirs on first request
+            computed = await asyncio.to_thread(lambda: {key: hash_file(path) for key, path in missing.items()})
+            hashes = {**hashes, **computed}
+            comic_metadata.file_hashes = hashes
+
+            def record_hashes(comic: ComicMetadata) -> None:
+                comic.file_hashes = {**(comic.file_hashes or {}), **computed}
+
+            await self.modify_comic_metadata(comic_metadata.comic_id, record_hashes)
+        return {key: hashes[key] for key in paths}
+
     def _generate_comic_id(self, topic: str = "", tone: str = "general") -> str:
         """Generate a unique ID for the comic based on input parameters"""
         import re
@@ -279,8 +1182,33 @@ class ComicGenerationEngine:
         # Construct ID with meaningful components
         if sanitized_topic:
             if sanitized_tone and sanitized_tone != "general":
-                return f"{sanitized_topic}_{sanitized_tone}_{timestamp}"
+                base_id = f"{sanitized_topic}_{sanitized_tone}_{timestamp}"
             else:
-                return f"{sanitized_topic}_{timestamp}"
+                base_id = f"{sanitized_topic}_{timestamp}"
         else:
-            return f"daily_comic_{timestamp}"
+            base_id = f"daily_comic_{timestamp}"
+
+        # Disambiguate identical topics started within the same second. Creating the
+        # directory reserves the ID atomically, also against other worker processes.
+        comic_id = base_id
+        suffix = 2
+        while True:
+            if comic_id not in self._active_comic_ids:
+                try:
+                    (self.output_dir / comic_id).mkdir()
+                    break
+                except FileExistsError:
+                    pass
+            comic_id = f"{base_id}_{suffix}"
+            suffix += 1
+
+        self._active_comic_ids.add(comic_id)
+        return comic_id
+
+    def _release_comic_id(self, comic_id: str) -> None:
+        """Forget a reserved comic ID; its directory is removed if generation left it empty"""
+        self._active_comic_ids.discard(comic_id)
+        try:
+            (self.output_dir / comic_id).rmdir()
+        except OSError:
+            pass
@@ -0,0 +1,120 @@
+"""
+HTTP byte-range parsing and streaming (RFC 9110 section 14)
+"""
+
+import secrets
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+CHUNK_SIZE = 256 * 1024
+# Ranges beyond this count are treated as abusive and answered with the full body
+MAX_RANGES = 16
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when none of the requested ranges overlap the file"""
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse a Range header into inclusive (start, end) byte offsets
+
+    Args:
+        header: The Range header value
+        size: File size in bytes
+
+    Returns:
+        Sorted, merged ranges, or None when the header is absent, malformed or
+        not worth honoring (the full body should be sent)
+
+    Raises:
+        RangeNotSatisfiable: If the header is valid but no range overlaps the file
+    """
+    if not header or not header.strip().lower().startswith("bytes="):
+        return None
+
+    ranges = []
+    for part in header.strip()[6:].split(","):
+        part = part.strip()
+        if not part or "-" not in part:
+            return None
+        start_text, end_text = (piece.strip() for piece in part.split("-", 1))
+        try:
+            if start_text == "":
+                # Suffix range: last N bytes
+                length = int(end_text)
+                if length <= 0:
+                    continue
+                start, end = max(0, size - length), size - 1
+            else:
+                start = int(start_text)
+                end = int(end_text) if end_text else size - 1
+                if end_text and end < start:
+                    return None
+                end = min(end, size - 1)
+        except ValueError:
+            return None
+        if start < size and start <= end:
+            ranges.append((start, end))
+
+    if not ranges:
+        raise RangeNotSatisfiable()
+    if len(ranges) > MAX_RANGES:
+        return None
+
+    # Merge overlapping or adjacent ranges
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def iter_file_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of a file in chunks"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def multipart_byteranges(path: Path, ranges: List[Tuple[int, int]], size: int,
+                         media_type: str) -> Tuple[str, int, Iterator[bytes]]:
+    """
+    Build a multipart/byteranges body for several ranges
+
+    Returns:
+        (Content-Type header value, Content-Length, body iterator)
+    """
+    boundary = secrets.token_hex(16)
+    headers = [
+        (f"--{boundary}\r\nContent-Type: {media_type}\r\n"
+         f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n").encode('ascii')
+        for start, end in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode('ascii')
+    content_length = (
+        sum(len(h) for h in headers)
+        + sum(end - start + 1 for start, end in ranges)
+        + 2 * (len(ranges) - 1)  # CRLF before each subsequent boundary
+        + len(closing)
+    )
+
+    def body() -> Iterator[bytes]:
+        for index, ((start, end), part_header) in enumerate(zip(ranges, headers)):
+            if index:
+                yield b"\r\n"
+            yield part_header
+            yield from iter_file_range(path, start, end)
+        yield closing
+
+    return f"multipart/byteranges; boundary={boundary}", content_length, body()
@@ -0,0 +1,199 @@
+"""
+Catalog of generated comics, backed by the SQLite metadata store
+"""
+
+import base64
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import ComicMetadata
+from .metadata_store import SQLiteMetadataStore
+
+logger = logging.getLogger(__name__)
+
+
+class ComicCatalog:
+    """
+    Query path for ComicMetadata keyed by comic_id
+
+    Queries go to the SQLite store. The per-comic metadata.json files are kept as
+    an export format: the engine writes both, and out-of-band changes to the
+    files are imported by comparing their mtimes with the mtime recorded in the
+    store.
+
+    Comics looked up by ID are kept in memory, so a cache hit costs neither a
+    stat() nor a query. Saves through this catalog update it at once; changes
+    from other worker processes or to the files on disk are picked up by
+    refresh(), which the engine runs every refresh_seconds in a worker thread.
+    """
+
+    def __init__(self, output_dir: Path, store: SQLiteMetadataStore, refresh_seconds: float = 5.0):
+        self.output_dir = Path(output_dir)
+        self.store = store
+        self.refresh_seconds = refresh_seconds
+        # comic_id -> (metadata, source_mtime of the store row it was read from)
+        self._cache: Dict[str, Tuple[ComicMetadata, float]] = {}
+        self._cache_lock = threading.Lock()
+
+    def build(self) -> None:
+        """Import any comic directories the store does not know about yet"""
+        self.refresh()
+        logger.info(f"📚 Comic catalog ready with {self.store.count()} comics")
+
+    def list(self, **filters) -> List[ComicMetadata]:
+        """Comics newest first, filtered as in SQLiteMetadataStore.list_comics"""
+        return self.store.list_comics(**filters)
+
+    def page(self, limit: int, cursor: Optional[str] = None, **filters) -> Dict[str, Any]:
+        """
+        One page of comics newest first
+
+        Args:
+            limit: Page size
+            cursor: next_cursor from the previous page, or None for the first page
+            **filters: As in SQLiteMetadataStore.list_comics
+
+        Returns:
+            Dict with 'comics', 'total' (matching filters) and 'next_cursor' (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = self._decode_cursor(cursor) if cursor else None
+
+        # Fetch one extra row to learn whether another page exists
+        comics = self.store.list_page(limit + 1, after=after, **filters)
+        next_cursor = None
+        if len(comics) > limit:
+            comics = comics[:limit]
+            next_cursor = self._encode_cursor(comics[-1])
+
+        return {
+            'comics': comics,
+            'total': self.store.count(**filters),
+            'next_cursor': next_cursor
+        }
+
+    @staticmethod
+    def _encode_cursor(metadata: ComicMetadata) -> str:
+        payload = json.dumps([metadata.generated_at, metadata.comic_id]).encode('utf-8')
+        return base64.urlsafe_b64encode(payload).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        try:
+            generated_at, comic_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        except Exception:
+            raise ValueError("Invalid cursor")
+        return str(generated_at), str(comic_id)
+
+    def count(self, **filters) -> int:
+        """Number of comics matching the filters"""
+        return self.store.count(**filters)
+
+    def cached(self, comic_id: str) -> Optional[ComicMetadata]:
+        """The in-memory copy of one comic, if it was looked up or saved before (never blocks)"""
+        entry = self._cache.get(comic_id)
+        return entry[0] if entry else None
+
+    def get(self, comic_id: str) -> Optional[ComicMetadata]:
+        """Look up one comic, from memory or else (blocking) through load()"""
+        return self.cached(comic_id) or self.load(comic_id)
+
+    def load(self, comic_id: str) -> Optional[ComicMetadata]:
+        """
+        Read one comic afresh, re-importing it if its metadata.json changed on disk
+
+        Blocking: stats the file and queries the store. Use it where a copy up to
+        refresh_seconds old will not do, e.g. inside a read-modify-write.
+        """
+        source = self.store.source_of(comic_id)
+        source_dir, known_mtime = source if source else (comic_id, None)
+        metadata_file = self.output_dir / source_dir / "metadata.json"
+        mtime = self._mtime(metadata_file)
+        if mtime is None:
+            if known_mtime is not None:
+                self.store.delete_source(source_dir)
+            self._forget(comic_id)
+            return None
+
+        if known_mtime != mtime:
+            try:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = ComicMetadata.from_dict(json.load(f))
+            except Exception as e:
+                logger.warning("Could not read metadata for %s: %s", comic_id, str(e))
+                return self.store.get(comic_id)
+            if metadata.comic_id != comic_id:
+                return None
+            self.store.upsert(metadata, source_mtime=mtime, source_dir=source_dir)
+            self._remember(metadata, mtime)
+            return metadata
+
+        metadata = self.store.get(comic_id)
+        if metadata is not None:
+            self._remember(metadata, known_mtime)
+        return metadata
+
+    def save(self, metadata: ComicMetadata) -> None:
+        """Write metadata to the store and export it to the comic's metadata.json"""
+        source = self.store.source_of(metadata.comic_id)
+        source_dir = source[0] if source else metadata.comic_id
+        comic_dir = self.output_dir / source_dir
+        comic_dir.mkdir(parents=True, exist_ok=True)
+        metadata_file = comic_dir / "metadata.json"
+
+        # Write atomically so readers never see a half-written export
+        tmp_file = metadata_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(metadata.to_dict(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, metadata_file)
+
+        source_mtime = self._mtime(metadata_file) or 0.0
+        self.store.upsert(metadata, source_mtime=source_mtime, source_dir=source_dir)
+        self._remember(metadata, source_mtime)
+
+    def refresh(self) -> None:
+        """
+        Reconcile the store with the output directory, then the in-memory copies with the store
+
+        Blocking: stats every comic directory. Run it off the event loop.
+        """
+        try:
+            self.store.import_directory(self.output_dir)
+            on_disk = {d.name for d in self.output_dir.iterdir() if (d / "metadata.json").exists()}
+            for source_dir in set(self.store.source_mtimes()) - on_disk:
+                self.store.delete_source(source_dir)
+
+            # Other worker processes save through the store; reload what they changed
+            versions = self.store.comic_mtimes()
+            with self._cache_lock:
+                cached = list(self._cache.items())
+            for comic_id, (_, cached_mtime) in cached:
+                if comic_id not in versions:
+                    self._forget(comic_id)
+                elif versions[comic_id] != cached_mtime:
+                    metadata = self.store.get(comic_id)
+                    if metadata is not None:
+                        self._remember(metadata, versions[comic_id])
+        except Exception as e:
+            logger.error(f"Failed to refresh comic catalog: {str(e)}")
+
+    def _remember(self, metadata: ComicMetadata, source_mtime: float) -> None:
+        with self._cache_lock:
+            self._cache[metadata.comic_id] = (metadata, source_mtime)
+
+    def _forget(self, comic_id: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(comic_id, None)
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[float]:
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
@@ -0,0 +1,113 @@
+"""
+Content-Encoding negotiation and gzip/brotli compression for API responses
+"""
+
+import gzip
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .config import config
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# File suffix of the pre-compressed copy kept next to a static file, per encoding
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a Content-Encoding from an Accept-Encoding header
+
+    Brotli is preferred over gzip when both are acceptable and the brotli module
+    is installed. Codings with q=0 are refused.
+
+    Returns:
+        'br', 'gzip' or None for identity
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    def allowed(coding: str) -> bool:
+        return accepted.get(coding, accepted.get('*', 0.0)) > 0
+
+    if brotli is not None and allowed('br'):
+        return 'br'
+    if allowed('gzip'):
+        return 'gzip'
+    return None
+
+
+def compress(data: bytes, encoding: str, static: bool = False) -> bytes:
+    """
+    Compress a response body
+
+    Args:
+        data: Uncompressed bytes
+        encoding: 'br' or 'gzip'
+        static: Use the slower, stronger settings meant for files compressed once and reused
+
+    Returns:
+        Compressed bytes
+    """
+    settings = config.compression
+    if encoding == 'br':
+        quality = settings.static_brotli_quality if static else settings.brotli_quality
+        return brotli.compress(data, quality=quality)
+    if encoding == 'gzip':
+        level = settings.static_gzip_level if static else settings.gzip_level
+        # mtime=0 keeps the output byte-identical for identical input
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    raise ValueError(f"Unsupported encoding '{encoding}'")
+
+
+def precompressed_path(source_path: Path, encoding: str) -> Path:
+    """Location of a file's pre-compressed copy, e.g. script.json.gz"""
+    return source_path.with_name(source_path.name + SUFFIXES[encoding])
+
+
+def ensure_precompressed(source_path: Path, encoding: str) -> Path:
+    """
+    Return the pre-compressed copy of a file, (re)writing it if missing or older than the source
+
+    The copy is written atomically, so concurrent readers never see a partial file.
+    """
+    target = precompressed_path(source_path, encoding)
+    try:
+        if target.stat().st_mtime >= source_path.stat().st_mtime:
+            return target
+    except FileNotFoundError:
+        pass
+
+    data = compress(source_path.read_bytes(), encoding, static=True)
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return target
+
+
+def available_encodings():
+    """Encodings that can be produced in this environment, strongest first"""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
@@ -18,6 +18,9 @@ class GeminiConfig:
     model_name: str = "gemini-2.5-flash"
     temperature: float = 0.7
     max_tokens: int = 10000
+    script_cache_enabled: bool = True  # Reuse scripts for repeated (topic, tone, audience)
+    script_cache_ttl_seconds: int = 24 * 60 * 60
+    script_cache_max_entries: int = 256
 
 
 @dataclass
@@ -29,6 +32,11 @@ class ImagenConfig:
     image_size: str = "1024x1024"
     aspect_ratio: str = "1:1"  # Square panels work best for comics
     guidance_scale: int = 100  # Imagen 4 guidance scale (0-100)
+    concurrent_panels: bool = True  # Render all panels of a comic at once
+    max_concurrent_panels: int = 4  # Per-comic limit on in-flight Imagen requests
+    cache_enabled: bool = True  # Reuse renders of byte-identical prompts
+    cache_dir: str = "output/cache/imagen"
+    cache_max_mb: int = 512  # Least recently used renders are evicted past this size
 
 
 @dataclass
@@ -39,6 +47,30 @@ class VideoConfig:
     model_name: str = "veo-3.0-generate-001"
     aspect_ratio: str = "16:9"
     video_duration: int = 8  # seconds per panel
+    poll_initial_interval: float = 10.0  # seconds between Veo operation polls
+    poll_max_interval: float = 60.0  # upper bound for the adaptive poll interval
+    poll_backoff: float = 1.5  # interval multiplier while no operation finishes
+    max_wait_seconds: float = 1800.0  # Panels whose operation runs longer fail with a timeout (0: no limit)
+    job_workers: int = 1  # Background workers running queued video jobs
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration for shared upstream rate limits and batch concurrency"""
+    gemini_requests_per_minute: int = 60  # 0 disables the Gemini limiter
+    imagen_requests_per_minute: int = 20  # 0 disables the Imagen limiter
+    burst: int = 5  # Requests allowed back-to-back before the per-minute rate applies
+    batch_concurrency: int = 3  # Comics generated at once during a batch
+
+
+@dataclass
+class PipelineConfig:
+    """Configuration for the staged batch pipeline (script -> panel art -> compose/save)"""
+    enabled: bool = False  # Use the staged pipeline for batch generation
+    script_workers: int = 2
+    artwork_workers: int = 2
+    compose_workers: int = 1
+    queue_size: int = 2  # Bounded queue in front of each stage
 
 
 @dataclass
@@ -49,7 +81,16 @@ class ComicConfig:
     font_family: str = "Comic Sans MS"
     font_size: int = 12
     speech_bubble_style: str = "rounded"
-    output_format: str = "PNG"
+    output_format: str = "PNG"  # Composed comic: PNG, WEBP or JPEG (panel images are always PNG)
+    layout: str = "grid"  # grid, strip, vertical (long-form) or a layout_templates name
+    layout_columns: int = 0  # Columns of the grid layout (0: ceil(sqrt(panel count)))
+    panel_margin: int = 15  # Gutter between panels and around the page, in pixels
+    layout_templates: Dict[str, List[List[int]]] = None  # name -> [column, row] of each panel slot
+    catalog_refresh_seconds: float = 5.0  # Interval of the background refresh picking up other workers' saves and out-of-band changes
+    metadata_db_path: str = "output/comics.db"  # SQLite metadata store (WAL mode)
+    jobs_db_path: str = "output/jobs.db"  # Batch jobs and per-topic progress, survives restarts
+    coalesce_requests: bool = True  # Identical concurrent requests share one generation
+    reuse_window_seconds: float = 0.0  # Also return an identical comic finished this recently (0 disables)
 
     # Character consistency settings
     maintain_consistent_cast: bool = True
@@ -59,7 +100,13 @@ class ComicConfig:
     example_characters: Dict[str, str] = None
 
     def __post_init__(self):
-        """Initialize example characters if not provided"""
+        """Initialize example characters and layout templates if not provided"""
+        if self.layout_templates is None:
+            # Panels past the last slot repeat the template further down the page
+            self.layout_templates = {
+                "staircase": [[0, 0], [1, 1], [2, 2]],
+                "zigzag": [[0, 0], [1, 0], [1, 1], [0, 1]],
+            }
         if self.example_characters is None:
             self.example_characters = {
                 "Hero": "Named Lukas, A young adventurer with short brown hair, green eyes, wearing a blue tunic and brown leather boots. Always has a determined expression and carries a wooden staff.",
@@ -70,6 +117,59 @@ class ComicConfig:
             }
 
 
+@dataclass
+class DerivativeConfig:
+    """Configuration for resized/re-encoded comic image derivatives"""
+    sizes: Dict[str, int] = None  # Preset name -> max width in pixels
+    pregenerate_sizes: List[str] = None  # Presets created when a comic is saved
+    webp_quality: int = 80
+    avif_quality: int = 60
+    jpeg_quality: int = 85
+
+    def __post_init__(self):
+        """Initialize default presets if not provided"""
+        if self.sizes is None:
+            self.sizes = {"thumb": 480, "medium": 1024}
+        if self.pregenerate_sizes is None:
+            self.pregenerate_sizes = ["thumb"]
+
+
+@dataclass
+class EventsConfig:
+    """Configuration for the Server-Sent Events progress stream"""
+    buffer_size: int = 2000  # Recent events kept for replay after a reconnect
+    heartbeat_seconds: float = 15.0  # Keep-alive comment interval on idle streams
+    poll_seconds: float = 0.5  # With several workers: how often a stream checks for other workers' events
+
+
+@dataclass
+class ServerConfig:
+    """Configuration for running the API under one or several worker processes"""
+    workers: int = 1  # Worker processes serving the API (WEB_CONCURRENCY)
+    lease_ttl_seconds: float = 30.0  # A dead worker's batch/video jobs are taken over after this
+    recovery_interval_seconds: float = 15.0  # How often workers look for orphaned jobs
+    image_workers: int = 0  # Processes for resize/compose/encode per API worker (0: cores / workers)
+
+
+@dataclass
+class CompressionConfig:
+    """Configuration for gzip/brotli response compression"""
+    min_size: int = 1024  # Smaller JSON responses are sent uncompressed
+    gzip_level: int = 6  # Per-request compression of dynamic responses
+    brotli_quality: int = 4
+    static_gzip_level: int = 9  # Pre-compressed files (script.json.gz/.br), encoded once
+    static_brotli_quality: int = 11
+
+
+@dataclass
+class ImageEncodingConfig:
+    """Encoder settings for panel images and the composed comic (each is encoded once)"""
+    png_compress_level: int = 6  # 0-9: lower encodes faster, larger files (PNG is lossless either way)
+    webp_quality: int = 90  # Used when the comic output_format is WEBP
+    webp_method: int = 4  # 0-6: higher is slower and smaller
+    jpeg_quality: int = 90  # Used when the comic output_format is JPEG
+
+
 class AppConfig:
     """Main application configuration"""
 
@@ -84,9 +184,42 @@ class AppConfig:
 
         self.video = VideoConfig(
             project_id=os.getenv("GOOGLE_CLOUD_PROJECT", ""),
+            max_wait_seconds=float(os.getenv("VIDEO_MAX_WAIT_SECONDS", "1800")),
         )
 
-        self.comic = ComicConfig()
+        self.comic = ComicConfig(
+            output_format=os.getenv("COMIC_OUTPUT_FORMAT", "PNG").upper(),
+            layout=os.getenv("COMIC_LAYOUT", "grid"),
+            layout_columns=int(os.getenv("COMIC_LAYOUT_COLUMNS", "0")),
+            coalesce_requests=os.getenv("COALESCE_REQUESTS", "true").lower() == "true",
+            reuse_window_seconds=float(os.getenv("REUSE_WINDOW_SECONDS", "0")),
+        )
+
+        self.rate_limits = RateLimitConfig(
+            gemini_requests_per_minute=int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60")),
+            imagen_requests_per_minute=int(os.getenv("IMAGEN_REQUESTS_PER_MINUTE", "20")),
+            burst=int(os.getenv("RATE_LIMIT_BURST", "5")),
+            batch_concurrency=int(os.getenv("BATCH_CONCURRENCY", "3")),
+        )
+
+        self.derivatives = DerivativeConfig()
+
+        self.compression = CompressionConfig()
+
+        self.images = ImageEncodingConfig(
+            png_compress_level=int(os.getenv("PNG_COMPRESS_LEVEL", "6")),
+        )
+
+        self.events = EventsConfig()
+
+        self.server = ServerConfig(
+            workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+            image_workers=int(os.getenv("IMAGE_WORKERS", "0")),
+        )
+
+        self.pipeline = PipelineConfig(
+            enabled=os.getenv("BATCH_PIPELINE_ENABLED", "false").lower() == "true",
+        )
 
         # Validate required environment variables
         self._validate_config()
@@ -99,6 +232,12 @@ class AppConfig:
         if not self.imagen.project_id:
             raise ValueError("GOOGLE_CLOUD_PROJECT environment variable is required")
 
+        if self.comic.layout not in ("grid", "strip", "vertical", *self.comic.layout_templates):
+            raise ValueError(f"Unknown COMIC_LAYOUT: {self.comic.layout}")
+
+        if self.comic.layout_columns < 0:
+            raise ValueError(f"COMIC_LAYOUT_COLUMNS must be 0 or more, got {self.comic.layout_columns}")
+
 
 # Global configuration instance
 config = AppConfig()
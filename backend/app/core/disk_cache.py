@@ -0,0 +1,124 @@
+"""
+Content-addressed on-disk cache with a size cap and LRU eviction
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLRUCache:
+    """Byte cache stored as one file per entry, evicting least recently used entries past max_bytes"""
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".bin"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> size in bytes, ordered from least to most recently used
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Hash the given parts into a stable cache key"""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for key, or None on a miss"""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                data = path.read_bytes()
+            except OSError:
+                self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # Persist recency across restarts
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store bytes under key, evicting old entries if over the size cap"""
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with self._lock:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def discard(self, key: str) -> None:
+        """Remove an entry, e.g. one whose bytes turned out to be unusable"""
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def _drop(self, key: str) -> None:
+        self._total_bytes -= self._entries.pop(key, 0)
+        self._path(key).unlink(missing_ok=True)
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU order from file modification times"""
+        files = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.name[:-len(self.suffix)], stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+        logger.info(f"💾 Cache at {self.directory}: {len(self._entries)} entries, {self._total_bytes} bytes")
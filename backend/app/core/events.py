@@ -0,0 +1,250 @@
+"""
+Progress events with replay, streamed to clients as Server-Sent Events
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS event_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel TEXT NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_event_log_channel ON event_log (channel, seq);
+CREATE TABLE IF NOT EXISTS event_log_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class EventBus:
+    """
+    Bounded log of progress events, each published to one channel
+
+    Event IDs are '<epoch>:<sequence>'. The epoch changes on every restart, so an
+    ID from a previous process replays the whole buffer instead of skipping events.
+    Publish from the event loop thread only.
+    """
+
+    # Seconds between checks for events published by other processes (None: local only)
+    poll_seconds: Optional[float] = None
+
+    def __init__(self, buffer_size: int = 1000):
+        self.epoch = str(int(time.time()))
+        self._sequence = 0
+        self._events = deque(maxlen=buffer_size)
+        self._waiters = set()
+
+    def publish(self, channel: str, event: str, data: Dict[str, Any]) -> None:
+        """
+        Append an event and wake every subscriber
+
+        Args:
+            channel: Channel name, e.g. 'comic:<comic_id>' or 'batch:<task_id>'
+            event: Event type, e.g. 'script_done'
+            data: JSON-serializable payload
+        """
+        self._append(channel, event, data)
+        self._wake()
+
+    def copy_channel(self, source: str, target: str) -> None:
+        """Publish every buffered event of source to target, ahead of anything published after this call"""
+        for record in [e for e in self._events if e["channel"] == source]:
+            self._append(target, record["event"], record["data"])
+        self._wake()
+
+    def _wake(self) -> None:
+        for waiter in self._waiters:
+            waiter.set()
+
+    def _append(self, channel: str, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        self._sequence += 1
+        record = {
+            "id": f"{self.epoch}:{self._sequence}",
+            "sequence": self._sequence,
+            "channel": channel,
+            "event": event,
+            "data": data,
+        }
+        self._events.append(record)
+        return record
+
+    async def _after(self, channel: str, sequence: int) -> List[Dict[str, Any]]:
+        return [e for e in self._events if e["sequence"] > sequence and e["channel"] == channel]
+
+    async def last_id(self) -> str:
+        """ID of the most recent event (a valid Last-Event-ID even before any event)"""
+        return f"{self.epoch}:{self._sequence}"
+
+    def _sequence_after(self, last_event_id: Optional[str]) -> int:
+        """Sequence number to replay after; 0 (everything buffered) for unknown or stale IDs"""
+        if not last_event_id:
+            return 0
+        epoch, _, sequence = last_event_id.partition(':')
+        if epoch != self.epoch or not sequence.isdigit():
+            return 0
+        return int(sequence)
+
+    async def replay(self, channel: str, last_event_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Buffered events of one channel published after last_event_id"""
+        return await self._after(channel, self._sequence_after(last_event_id))
+
+    async def subscribe(self, channel: str, last_event_id: Optional[str] = None,
+                        heartbeat_seconds: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Replay missed events of a channel, then follow it live
+
+        Yields:
+            Events in publish order, or None after heartbeat_seconds without one
+        """
+        after = self._sequence_after(last_event_id)
+        wait_seconds = min(self.poll_seconds or heartbeat_seconds, heartbeat_seconds)
+        idle = 0.0
+        waiter = asyncio.Event()
+        self._waiters.add(waiter)
+        try:
+            while True:
+                waiter.clear()
+                pending = await self._after(channel, after)
+                for record in pending:
+                    after = record["sequence"]
+                    yield record
+                if pending:
+                    idle = 0.0
+                    continue
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout=wait_seconds)
+                except asyncio.TimeoutError:
+                    idle += wait_seconds
+                    if idle >= heartbeat_seconds:
+                        idle = 0.0
+                        yield None
+        finally:
+            self._waiters.discard(waiter)
+
+
+class SQLiteEventBus(EventBus):
+    """
+    EventBus whose log lives in SQLite, so a subscriber on one API worker process
+    receives events published by any other
+
+    Local publishes wake subscribers at once; other processes' events are picked up
+    every poll_seconds. The epoch is stored with the log, so IDs stay valid across restarts.
+    All reads and writes run on one thread of the bus's own, off the event loop and in
+    publish order: a read sees every event this process published before it.
+    """
+
+    def __init__(self, db_path: str, buffer_size: int = 1000, poll_seconds: float = 0.5):
+        super().__init__(buffer_size)
+        self.buffer_size = buffer_size
+        self.poll_seconds = poll_seconds
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="events")
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        conn.execute("INSERT OR IGNORE INTO event_log_meta (key, value) VALUES ('epoch', ?)", (self.epoch,))
+        conn.commit()
+        self.epoch = conn.execute("SELECT value FROM event_log_meta WHERE key = 'epoch'").fetchone()[0]
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def publish(self, channel: str, event: str, data: Dict[str, Any]) -> None:
+        self._submit(self._append, channel, event, json_codec.dumps(data).decode('utf-8'))
+
+    def copy_channel(self, source: str, target: str) -> None:
+        self._submit(self._copy_channel, source, target)
+
+    def _submit(self, fn, *args) -> None:
+        """Queue a write; subscribers of this process are woken once it is committed"""
+        future = self._io.submit(fn, *args)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        def done(future) -> None:
+            if future.exception() is not None:
+                logger.error(f"Failed to store event: {future.exception()}")
+            elif loop is not None and not loop.is_closed():
+                loop.call_soon_threadsafe(self._wake)
+
+        future.add_done_callback(done)
+
+    async def _run(self, fn, *args):
+        return await asyncio.wrap_future(self._io.submit(fn, *args))
+
+    def _append(self, channel: str, event: str, data: str) -> None:
+        conn = self._connection()
+        with conn:
+            sequence = conn.execute(
+                "INSERT INTO event_log (channel, event, data) VALUES (?, ?, ?)",
+                (channel, event, data)
+            ).lastrowid
+            # Trim the log to roughly buffer_size events
+            if sequence % 100 == 0:
+                conn.execute("DELETE FROM event_log WHERE seq <= ?", (sequence - self.buffer_size,))
+
+    def _copy_channel(self, source: str, target: str) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT INTO event_log (channel, event, data) "
+                "SELECT ?, event, data FROM event_log WHERE channel = ? ORDER BY seq",
+                (target, source)
+            )
+
+    async def _after(self, channel: str, sequence: int) -> List[Dict[str, Any]]:
+        return await self._run(self._read_after, channel, sequence)
+
+    def _read_after(self, channel: str, sequence: int) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(
+            "SELECT seq, event, data FROM event_log WHERE channel = ? AND seq > ? ORDER BY seq",
+            (channel, sequence)
+        ).fetchall()
+        return [
+            {
+                "id": f"{self.epoch}:{seq}",
+                "sequence": seq,
+                "channel": channel,
+                "event": event,
+                "data": json_codec.loads(data),
+            }
+            for seq, event, data in rows
+        ]
+
+    async def last_id(self) -> str:
+        row = await self._run(lambda: self._connection().execute("SELECT MAX(seq) FROM event_log").fetchone())
+        return f"{self.epoch}:{row[0] or 0}"
+
+
+def format_sse(event: Optional[Dict[str, Any]]) -> bytes:
+    """Encode an event as a Server-Sent Events message; None becomes a keep-alive comment"""
+    if event is None:
+        return b": keep-alive\n\n"
+    data = json_codec.dumps(event["data"])
+    return f"id: {event['id']}\nevent: {event['event']}\n".encode('utf-8') + b"data: " + data + b"\n\n"
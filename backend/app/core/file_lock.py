@@ -0,0 +1,69 @@
+"""
+Cross-process exclusive lock on a lock file, for state shared by several API workers
+"""
+
+import os
+import threading
+from pathlib import Path
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class InterProcessLock:
+    """
+    Exclusive lock held through a lock file (flock on POSIX, msvcrt.locking on Windows)
+
+    Usable as a context manager from any thread of any process. Holders should keep
+    the critical section short: waiting callers block.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The OS lock is per open file; this serializes threads of the same process first
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        try:
+            self._file = open(self.path, 'a+b')
+            if os.name == 'nt':
+                self._file.seek(0)
+                # LK_LOCK retries for ~10s; keep trying until the other process lets go
+                while True:
+                    try:
+                        msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        except BaseException:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        try:
+            if os.name == 'nt':
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+            self._thread_lock.release()
+
+    def __enter__(self) -> 'InterProcessLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
@@ -0,0 +1,77 @@
+"""
+HTTP validator helpers for conditional requests on comic assets
+"""
+
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+# Cache-Control for a URL pinned to one content version (?v=<hash>)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Cache-Control for unversioned URLs: cache, but revalidate with the ETag
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def hash_bytes(data: bytes) -> str:
+    """Content hash used for strong ETags"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Content hash of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_etag(content_hash: str, variant: str = "") -> str:
+    """Strong ETag for a content hash, optionally qualified by a variant (size/format)"""
+    return f'"{content_hash}-{variant}"' if variant else f'"{content_hash}"'
+
+
+def cache_headers(etag: str, last_modified: float, version: Optional[str],
+                  content_hash: str) -> Dict[str, str]:
+    """
+    Validator and Cache-Control headers for an asset response
+
+    Args:
+        etag: Strong ETag from make_etag
+        last_modified: File modification time (epoch seconds)
+        version: The ?v= query parameter the client used, if any
+        content_hash: Current content hash of the asset
+
+    Returns:
+        Response headers
+    """
+    immutable = version is not None and version == content_hash
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+    }
+
+
+def is_not_modified(if_none_match: Optional[str], if_modified_since: Optional[str],
+                    etag: str, last_modified: float) -> bool:
+    """
+    Evaluate conditional request headers (RFC 9110 section 13.2.2)
+
+    If-None-Match takes precedence; If-Modified-Since is only used without it.
+    """
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(',')]
+        # Weak comparison: W/"x" matches "x"
+        normalized = {tag[2:] if tag.startswith('W/') else tag for tag in candidates}
+        return '*' in normalized or etag in normalized
+
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= int(since)
+
+    return False
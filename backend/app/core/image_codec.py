@@ -0,0 +1,134 @@
+"""
+Image encoding for panel and comic artifacts, with per-stage byte/time accounting
+"""
+
+import io
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from PIL import Image
+
+from .config import config
+
+# Pillow format name -> Content-Type
+MEDIA_TYPES = {
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+}
+
+# File extension (as written by the engine) -> Pillow format name
+EXTENSION_FORMATS = {
+    ".png": "PNG",
+    ".webp": "WEBP",
+    ".jpeg": "JPEG",
+    ".jpg": "JPEG",
+}
+
+
+def encoder_options(image_format: str) -> Dict[str, Any]:
+    """
+    Configured Pillow save() options for a format
+
+    PNG is lossless, so only compress_level applies (speed vs. size);
+    WebP and JPEG use their configured quality.
+
+    Args:
+        image_format: PNG, WEBP or JPEG
+
+    Returns:
+        Keyword arguments for Image.save
+    """
+    image_format = image_format.upper()
+    settings = config.images
+    if image_format == "PNG":
+        return {"compress_level": settings.png_compress_level}
+    if image_format == "WEBP":
+        return {"quality": settings.webp_quality, "method": settings.webp_method}
+    if image_format == "JPEG":
+        return {"quality": settings.jpeg_quality, "optimize": True}
+    raise ValueError(f"Unsupported image format: {image_format}")
+
+
+def encode(image: Image.Image, image_format: str = "PNG",
+           options: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Encode an image with the configured settings for its format
+
+    Args:
+        image: Decoded RGB image
+        image_format: PNG, WEBP or JPEG
+        options: Image.save options (default: encoder_options(image_format))
+
+    Returns:
+        Encoded image
+    """
+    if options is None:
+        options = encoder_options(image_format)
+    output = io.BytesIO()
+    image.save(output, format=image_format.upper(), **options)
+    return output.getvalue()
+
+
+def media_type_for(path_or_format: str) -> str:
+    """Content-Type for a Pillow format name or a file name/extension (PNG if unknown)"""
+    key = path_or_format.upper()
+    if key not in MEDIA_TYPES:
+        suffix = '.' + path_or_format.rsplit('.', 1)[-1].lower()
+        key = EXTENSION_FORMATS.get(suffix, "PNG")
+    return MEDIA_TYPES[key]
+
+
+class ImageStageStats:
+    """
+    Milliseconds and output bytes per image stage (decode, resize, encode, compose...)
+
+    One instance per comic, shared by its panels' worker threads.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, ms: float, nbytes: int = 0) -> None:
+        """Add one run of a stage"""
+        with self._lock:
+            entry = self.stages.setdefault(stage, {"count": 0, "ms": 0.0, "bytes": 0})
+            entry["count"] += 1
+            entry["ms"] += ms
+            entry["bytes"] += nbytes
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[Dict[str, int]]:
+        """
+        Time a block as one run of a stage
+
+        Yields:
+            Dict whose 'bytes' the block may set to the size of what it produced
+        """
+        result = {"bytes": 0}
+        start = time.perf_counter()
+        try:
+            yield result
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000, result["bytes"])
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Stage totals with milliseconds rounded for storage and logs"""
+        with self._lock:
+            return {
+                stage: {"count": entry["count"], "ms": round(entry["ms"], 1), "bytes": entry["bytes"]}
+                for stage, entry in self.stages.items()
+            }
+
+
+@contextmanager
+def timed(stats: Optional[ImageStageStats], stage: str) -> Iterator[Dict[str, int]]:
+    """ImageStageStats.timed that is a no-op when stats is None"""
+    if stats is None:
+        yield {"bytes": 0}
+    else:
+        with stats.timed(stage) as result:
+            yield result
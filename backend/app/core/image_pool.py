@@ -0,0 +1,285 @@
+"""
+Process pool for CPU-heavy image work: panel normalization, comic composition and encoding
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from . import image_codec
+from .config import config
+from .image_codec import ImageStageStats
+from .layout import ComicLayout
+
+logger = logging.getLogger(__name__)
+
+# (mode, (width, height)) of raw pixels
+RawFormat = Tuple[str, Tuple[int, int]]
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+def _normalize_panel(data: bytes, raw_format: Optional[RawFormat], size: Tuple[int, int],
+                     shm_name: str, png_options: Optional[Dict[str, Any]]) -> Tuple[bytes, Dict[str, float]]:
+    """
+    Worker: decode a render, convert it to RGB at size and write its pixels into shared memory
+
+    Args:
+        data: Encoded image, or raw pixels when raw_format is given
+        raw_format: Mode and size of raw pixels in data
+        size: Panel size to resize to
+        shm_name: Block of width * height * 3 bytes that receives the RGB pixels
+        png_options: Encode the result as PNG with these options (None: skip)
+
+    Returns:
+        (PNG bytes or b'', milliseconds per stage)
+    """
+    timings = {}
+    start = time.perf_counter()
+    if raw_format:
+        image = Image.frombytes(raw_format[0], raw_format[1], data)
+    else:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+    timings["decode"] = _elapsed_ms(start)
+
+    start = time.perf_counter()
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    if image.size != size:
+        image = image.resize(size, Image.Resampling.LANCZOS)
+    timings["resize"] = _elapsed_ms(start)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        pixels = image.tobytes()
+        shm.buf[:len(pixels)] = pixels
+    finally:
+        shm.close()
+
+    encoded = b''
+    if png_options is not None:
+        start = time.perf_counter()
+        encoded = image_codec.encode(image, "PNG", png_options)
+        timings["panel_encode"] = _elapsed_ms(start)
+    return encoded, timings
+
+
+def _encode(shm_name: str, size: Tuple[int, int], image_format: str,
+            options: Dict[str, Any], stage: str) -> Tuple[bytes, Dict[str, float]]:
+    """Worker: encode RGB pixels held in shared memory; timed as stage"""
+    start = time.perf_counter()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf[:size[0] * size[1] * 3] as view:
+            image = Image.frombytes('RGB', size, view)
+    finally:
+        shm.close()
+    encoded = image_codec.encode(image, image_format, options)
+    return encoded, {stage: _elapsed_ms(start)}
+
+
+def _paste_panels(shm: shared_memory.SharedMemory, panel_images: List[Image.Image],
+                  layout: ComicLayout) -> None:
+    """Copy each panel straight into its place on a white canvas held in shared memory"""
+    width, height = layout.canvas_size
+    canvas = np.ndarray((height, width, 3), dtype=np.uint8, buffer=shm.buf)
+    try:
+        canvas.fill(255)
+        for image, (x, y) in zip(panel_images, layout.positions):
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            canvas[y:y + image.height, x:x + image.width] = np.asarray(image)
+    finally:
+        # The block can only be closed once no array points into it
+        del canvas
+
+
+@contextmanager
+def _shared_block(size: int) -> Iterator[shared_memory.SharedMemory]:
+    """Shared memory owned by the calling process, removed on exit"""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+    try:
+        yield shm
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _record(stats: Optional[ImageStageStats], timings: Dict[str, float],
+            sizes: Optional[Dict[str, int]] = None) -> None:
+    if stats is None:
+        return
+    for stage, ms in timings.items():
+        stats.record(stage, ms, (sizes or {}).get(stage, 0))
+
+
+class ImageProcessPool:
+    """
+    Runs resize and encode in worker processes, and composition in a thread, so they
+    neither block the event loop nor serialize on one core
+
+    Pixels cross the process boundary through shared memory, never as pickled PIL
+    images: the caller copies raw RGB into a block it owns and the worker reads (or
+    fills) it. Only encoded files and timings travel back through the pool's pipe.
+    """
+
+    def __init__(self, workers: int = 0):
+        """
+        Args:
+            workers: Worker processes (0: the machine's cores shared among the API workers)
+        """
+        self.workers = workers or max(1, (os.cpu_count() or 1) // max(1, config.server.workers))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Create the workers now rather than on the first image
+
+        Call at startup so the first comic doesn't wait for the workers to boot; after
+        that the pool is (re)started lazily, from a worker thread. Workers never come
+        from fork: by then the API process runs threads (to_thread, SQLite, the pool's
+        own manager thread), and a forked child can inherit one of their locks held
+        forever. They come from a forkserver (spawn where there is none) instead.
+        """
+        with self._lock:
+            if self._executor is not None:
+                return
+            if os.name == 'posix':
+                # Workers must share this process's resource tracker; with trackers of
+                # their own, every block they open would be "leaked" when they exit
+                resource_tracker.ensure_running()
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            # Each submit with no idle worker boots one, so this starts them all now
+            for _ in range(self.workers):
+                executor.submit(os.getpid)
+            self._executor = executor
+            logger.info(f"🧮 Image process pool started with {self.workers} workers")
+
+    def shutdown(self) -> None:
+        """Stop the workers (waits for running tasks)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _executor_started(self) -> ProcessPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            # Booting workers blocks until they are up
+            await asyncio.to_thread(self.start)
+            executor = self._executor
+        return executor
+
+    async def _run(self, fn, *args):
+        executor = await self._executor_started()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); replace the pool and retry once
+            with self._lock:
+                replaced = self._executor is executor
+                if replaced:
+                    self._executor = None
+            if replaced:
+                logger.warning("Image process pool broke, restarting it")
+                executor.shutdown(wait=False, cancel_futures=True)
+            executor = await self._executor_started()
+            return await loop.run_in_executor(executor, fn, *args)
+
+    async def normalize_panel(self, data: bytes, size: Tuple[int, int],
+                              raw_format: Optional[RawFormat] = None, encode: bool = True,
+                              stats: Optional[ImageStageStats] = None) -> Tuple[Image.Image, bytes]:
+        """
+        Decode a panel render, convert it to RGB at size and encode it as PNG
+
+        Args:
+            data: Encoded image, or raw pixels when raw_format is given
+            size: Panel size
+            raw_format: Mode and size of raw pixels in data
+            encode: Produce the PNG (False when data already is the normalized PNG)
+            stats: Collects bytes and milliseconds per image stage
+
+        Returns:
+            (RGB panel image, PNG bytes; data itself when encode is False)
+        """
+        options = image_codec.encoder_options("PNG") if encode else None
+        with _shared_block(size[0] * size[1] * 3) as shm:
+            encoded, timings = await self._run(_normalize_panel, data, raw_format, size, shm.name, options)
+            image = Image.frombytes('RGB', size, bytes(shm.buf[:size[0] * size[1] * 3]))
+
+        if not encode:
+            encoded = data
+        _record(stats, timings, {"panel_encode": len(encoded)})
+        return image, encoded
+
+    async def compose(self, panel_images: List[Image.Image], layout: ComicLayout, image_format: str,
+                      stats: Optional[ImageStageStats] = None) -> bytes:
+        """
+        Place panels on a white canvas per the layout and encode the result
+
+        The canvas is one preallocated shared memory block: each panel is copied once,
+        straight into its place, and the worker encodes the block without composing
+        anything of its own.
+
+        Args:
+            panel_images: Panel images, one per layout position
+            layout: Canvas size and panel positions
+            image_format: PNG, WEBP or JPEG
+            stats: Collects bytes and milliseconds per image stage
+
+        Returns:
+            The encoded comic
+        """
+        width, height = layout.canvas_size
+        with _shared_block(width * height * 3) as shm:
+            start = time.perf_counter()
+            # NumPy copies release the GIL, so a thread keeps this off the event loop
+            await asyncio.to_thread(_paste_panels, shm, panel_images, layout)
+            compose_ms = _elapsed_ms(start)
+
+            encoded, timings = await self._run(
+                _encode, shm.name, layout.canvas_size, image_format,
+                image_codec.encoder_options(image_format), "comic_encode"
+            )
+
+        _record(stats, {"compose": compose_ms, **timings}, {"comic_encode": len(encoded)})
+        return encoded
+
+    async def encode(self, image: Image.Image, image_format: str = "PNG",
+                     stats: Optional[ImageStageStats] = None) -> bytes:
+        """Encode an image in a worker process with the configured settings"""
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        with _shared_block(image.size[0] * image.size[1] * 3) as shm:
+            pixels = image.tobytes()
+            shm.buf[:len(pixels)] = pixels
+            encoded, timings = await self._run(
+                _encode, shm.name, image.size, image_format,
+                image_codec.encoder_options(image_format), "panel_encode"
+            )
+
+        _record(stats, timings, {"panel_encode": len(encoded)})
+        return encoded
+
+
+# Global pool used by the artwork service
+image_pool = ImageProcessPool(config.server.image_workers)
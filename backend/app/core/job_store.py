@@ -0,0 +1,247 @@
+"""
+SQLite-backed store for batch generation jobs and their per-topic progress
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Job statuses (as reported by GET /api/comics/batch/{task_id})
+JOB_STARTED = "started"
+JOB_IN_PROGRESS = "in_progress"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Topic statuses
+TOPIC_QUEUED = "queued"
+TOPIC_RUNNING = "running"
+TOPIC_DONE = "done"
+TOPIC_FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    tone TEXT NOT NULL,
+    visual_style TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    completed_at TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_batch_jobs_status ON batch_jobs (status);
+CREATE TABLE IF NOT EXISTS batch_topics (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    topic TEXT NOT NULL,
+    status TEXT NOT NULL,
+    comic_id TEXT,
+    error TEXT,
+    started_at TEXT,
+    finished_at TEXT,
+    PRIMARY KEY (job_id, position)
+);
+CREATE TABLE IF NOT EXISTS leases (
+    resource TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteJobStore:
+    """
+    Durable record of batch jobs, so a restart can resume unfinished topics
+
+    Same connection model as SQLiteMetadataStore: WAL mode, one connection per thread.
+    The store is shared by every API worker process; leases decide which process runs
+    a job, and expire when their owner stops renewing them (crash, restart).
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def create_job(self, topics: List[str], tone: str, visual_style: str) -> str:
+        """
+        Record a new batch with every topic queued
+
+        Args:
+            topics: Topics in request order
+            tone: Tone applied to every topic
+            visual_style: Visual style applied to every topic
+
+        Returns:
+            The new job ID (batch_<timestamp>, suffixed if that ID is taken)
+        """
+        now = datetime.now()
+        base_id = f"batch_{now.strftime('%Y%m%d_%H%M%S')}"
+        conn = self._connection()
+
+        suffix = 1
+        job_id = base_id
+        while True:
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT INTO batch_jobs (job_id, status, tone, visual_style, created_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (job_id, JOB_STARTED, tone, visual_style, now.isoformat())
+                    )
+                    conn.executemany(
+                        "INSERT INTO batch_topics (job_id, position, topic, status) VALUES (?, ?, ?, ?)",
+                        [(job_id, i, topic, TOPIC_QUEUED) for i, topic in enumerate(topics)]
+                    )
+                return job_id
+            except sqlite3.IntegrityError:
+                suffix += 1
+                job_id = f"{base_id}_{suffix}"
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        One job with its topics
+
+        Returns:
+            Dict with the job columns plus 'topics' (in request order), or None
+        """
+        conn = self._connection()
+        row = conn.execute("SELECT * FROM batch_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        topics = conn.execute(
+            "SELECT position, topic, status, comic_id, error, started_at, finished_at "
+            "FROM batch_topics WHERE job_id = ? ORDER BY position",
+            (job_id,)
+        ).fetchall()
+        return {**dict(row), "topics": [dict(topic) for topic in topics]}
+
+    def set_job_status(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        """Update a job's status; completed/failed also stamp completed_at"""
+        completed_at = datetime.now().isoformat() if status in (JOB_COMPLETED, JOB_FAILED) else None
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "UPDATE batch_jobs SET status = ?, error = ?, completed_at = ? WHERE job_id = ?",
+                (status, error, completed_at, job_id)
+            )
+
+    def set_topic_status(self, job_id: str, position: int, status: str,
+                         comic_id: Optional[str] = None, error: Optional[str] = None) -> None:
+        """
+        Update one topic's progress
+
+        Args:
+            job_id: Batch job ID
+            position: Index of the topic in the request
+            status: queued, running, done or failed
+            comic_id: Comic produced for the topic (done)
+            error: Failure message (failed)
+        """
+        now = datetime.now().isoformat()
+        conn = self._connection()
+        with conn:
+            if status == TOPIC_RUNNING:
+                conn.execute(
+                    "UPDATE batch_topics SET status = ?, started_at = ?, error = NULL "
+                    "WHERE job_id = ? AND position = ?",
+                    (status, now, job_id, position)
+                )
+            else:
+                finished_at = now if status in (TOPIC_DONE, TOPIC_FAILED) else None
+                conn.execute(
+                    "UPDATE batch_topics SET status = ?, comic_id = ?, error = ?, finished_at = ? "
+                    "WHERE job_id = ? AND position = ?",
+                    (status, comic_id, error, finished_at, job_id, position)
+                )
+
+    def requeue_interrupted(self, job_id: str) -> int:
+        """
+        Put topics left 'running' by a crash or restart back in the queue
+
+        Returns:
+            Number of topics requeued
+        """
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE batch_topics SET status = ?, started_at = NULL WHERE job_id = ? AND status = ?",
+                (TOPIC_QUEUED, job_id, TOPIC_RUNNING)
+            )
+        return cursor.rowcount
+
+    def acquire_lease(self, resource: str, owner: str, ttl_seconds: float) -> bool:
+        """
+        Take (or extend) the lease on a resource such as 'batch:<job_id>'
+
+        Succeeds when the resource is unleased, its lease expired, or owner already holds it.
+
+        Returns:
+            True if owner now holds the lease
+        """
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO leases (resource, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(resource) DO UPDATE SET
+                    owner = excluded.owner,
+                    expires_at = excluded.expires_at
+                WHERE leases.owner = excluded.owner OR leases.expires_at < ?
+                """,
+                (resource, owner, now + ttl_seconds, now)
+            )
+            row = conn.execute("SELECT owner FROM leases WHERE resource = ?", (resource,)).fetchone()
+        return row is not None and row['owner'] == owner
+
+    def renew_leases(self, owner: str, ttl_seconds: float) -> int:
+        """Extend every lease held by owner; returns how many were renewed"""
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE leases SET expires_at = ? WHERE owner = ?",
+                (time.time() + ttl_seconds, owner)
+            )
+        return cursor.rowcount
+
+    def release_lease(self, resource: str, owner: str) -> None:
+        """Drop a lease if owner holds it"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM leases WHERE resource = ? AND owner = ?", (resource, owner))
+
+    def release_leases(self, owner: str) -> None:
+        """Drop every lease held by owner (on shutdown)"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM leases WHERE owner = ?", (owner,))
+
+    def unfinished_jobs(self) -> List[str]:
+        """IDs of jobs that were started but never completed or failed, oldest first"""
+        rows = self._connection().execute(
+            "SELECT job_id FROM batch_jobs WHERE status IN (?, ?) ORDER BY created_at",
+            (JOB_STARTED, JOB_IN_PROGRESS)
+        ).fetchall()
+        return [row['job_id'] for row in rows]
@@ -0,0 +1,26 @@
+"""
+Fast JSON encoding for API responses and stored comic data (orjson)
+"""
+
+from typing import Any
+
+import orjson
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes
+
+    Args:
+        obj: Value to serialize (dicts, lists, str, numbers, datetimes)
+        indent: Pretty-print with two-space indentation, as used for files on disk
+
+    Returns:
+        Encoded JSON
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from bytes or str"""
+    return orjson.loads(data)
@@ -0,0 +1,108 @@
+"""
+Comic page layouts: canvas size and panel placements for any number of panels
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Size = Tuple[int, int]
+Cell = Tuple[int, int]  # (column, row)
+
+# Built-in layout modes; any other name refers to a custom template
+GRID = "grid"  # Rows of ceil(sqrt(n)) panels, or the configured column count
+STRIP = "strip"  # One row
+VERTICAL = "vertical"  # One column, for long-form (webtoon) comics
+
+
+@dataclass(frozen=True)
+class ComicLayout:
+    """Where every panel goes on the composed comic"""
+    canvas_size: Size
+    positions: Tuple[Tuple[int, int], ...]  # Top-left corner of each panel, in panel order
+
+
+def compute_layout(panel_sizes: Sequence[Size], mode: str = GRID, margin: int = 15,
+                   columns: int = 0, templates: Optional[Dict[str, List[List[int]]]] = None) -> ComicLayout:
+    """
+    Lay out panels of the given sizes
+
+    Panels are placed on a grid of cells; each column is as wide as its widest panel
+    and each row as tall as its tallest, and a smaller panel is centered in its cell.
+    Results are cached by (panel sizes, mode, margin, columns, template).
+
+    Args:
+        panel_sizes: (width, height) of each panel, in panel order
+        mode: 'grid', 'strip', 'vertical' or the name of a template
+        margin: Gutter between panels and around the page, in pixels
+        columns: Grid columns (0: ceil(sqrt(panel count)))
+        templates: Custom templates: name -> [column, row] of each slot. Panels
+            past the last slot repeat the template below the previous copy.
+
+    Returns:
+        The layout
+
+    Raises:
+        ValueError: No panels, or an unknown mode
+    """
+    if not panel_sizes:
+        raise ValueError("No panels to lay out")
+
+    template = None
+    if mode not in (GRID, STRIP, VERTICAL):
+        if not templates or mode not in templates:
+            raise ValueError(f"Unknown comic layout: {mode}")
+        template = tuple((int(column), int(row)) for column, row in templates[mode])
+        if not template or len(set(template)) != len(template):
+            raise ValueError(f"Comic layout template {mode} needs at least one slot and no repeated cells")
+
+    sizes = tuple((int(width), int(height)) for width, height in panel_sizes)
+    return _cached_layout(sizes, mode, margin, columns, template)
+
+
+def _cells(count: int, mode: str, columns: int, template: Optional[Tuple[Cell, ...]]) -> List[Cell]:
+    if template:
+        # Each repetition of the template starts below the previous one
+        template_rows = max(row for _, row in template) + 1
+        return [
+            (template[i % len(template)][0], template[i % len(template)][1] + (i // len(template)) * template_rows)
+            for i in range(count)
+        ]
+    if mode == STRIP:
+        return [(i, 0) for i in range(count)]
+    if mode == VERTICAL:
+        return [(0, i) for i in range(count)]
+    columns = columns or math.ceil(math.sqrt(count))
+    return [(i % columns, i // columns) for i in range(count)]
+
+
+@lru_cache(maxsize=128)
+def _cached_layout(sizes: Tuple[Size, ...], mode: str, margin: int, columns: int,
+                   template: Optional[Tuple[Cell, ...]]) -> ComicLayout:
+    cells = _cells(len(sizes), mode, columns, template)
+
+    column_widths: Dict[int, int] = {}
+    row_heights: Dict[int, int] = {}
+    for (width, height), (column, row) in zip(sizes, cells):
+        column_widths[column] = max(column_widths.get(column, 0), width)
+        row_heights[row] = max(row_heights.get(row, 0), height)
+
+    # Empty template columns/rows take no space
+    column_x = {}
+    x = margin
+    for column in sorted(column_widths):
+        column_x[column] = x
+        x += column_widths[column] + margin
+    row_y = {}
+    y = margin
+    for row in sorted(row_heights):
+        row_y[row] = y
+        y += row_heights[row] + margin
+
+    positions = tuple(
+        (column_x[column] + (column_widths[column] - width) // 2,
+         row_y[row] + (row_heights[row] - height) // 2)
+        for (width, height), (column, row) in zip(sizes, cells)
+    )
+    return ComicLayout(canvas_size=(x, y), positions=positions)
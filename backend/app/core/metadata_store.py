@@ -0,0 +1,255 @@
+"""
+SQLite-backed comic metadata store
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import ComicMetadata
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS comics (
+    comic_id TEXT PRIMARY KEY,
+    generated_at TEXT NOT NULL,
+    video_status TEXT,
+    tone TEXT,
+    visual_style TEXT,
+    data TEXT NOT NULL,
+    source_dir TEXT NOT NULL,
+    source_mtime REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_comics_generated_at ON comics (generated_at);
+CREATE INDEX IF NOT EXISTS idx_comics_video_status ON comics (video_status, generated_at);
+CREATE INDEX IF NOT EXISTS idx_comics_tone ON comics (tone, generated_at);
+CREATE INDEX IF NOT EXISTS idx_comics_visual_style ON comics (visual_style, generated_at);
+CREATE INDEX IF NOT EXISTS idx_comics_source_dir ON comics (source_dir);
+"""
+
+
+class SQLiteMetadataStore:
+    """
+    Stores ComicMetadata rows with indexed columns for the common filters
+
+    The database runs in WAL mode so readers never block the writer. Each thread
+    gets its own connection; writes are serialized by SQLite's own locking.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def upsert(self, metadata: ComicMetadata, source_mtime: float = 0.0,
+               source_dir: Optional[str] = None) -> None:
+        """
+        Insert or replace one comic's metadata
+
+        Args:
+            metadata: Comic metadata
+            source_mtime: mtime of the metadata.json the row mirrors
+            source_dir: Name of the comic's directory (defaults to comic_id)
+        """
+        params = metadata.generation_params or {}
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO comics (comic_id, generated_at, video_status, tone, visual_style, data,
+                                    source_dir, source_mtime)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(comic_id) DO UPDATE SET
+                    generated_at = excluded.generated_at,
+                    video_status = excluded.video_status,
+                    tone = excluded.tone,
+                    visual_style = excluded.visual_style,
+                    data = excluded.data,
+                    source_dir = excluded.source_dir,
+                    source_mtime = excluded.source_mtime
+                """,
+                (
+                    metadata.comic_id,
+                    metadata.generated_at,
+                    metadata.video_status,
+                    params.get('tone'),
+                    params.get('visual_style'),
+                    json_codec.dumps(metadata.to_dict()).decode('utf-8'),
+                    source_dir or metadata.comic_id,
+                    source_mtime
+                )
+            )
+
+    def delete_source(self, source_dir: str) -> None:
+        """Remove the comic stored from the given directory"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM comics WHERE source_dir = ?", (source_dir,))
+
+    def get(self, comic_id: str) -> Optional[ComicMetadata]:
+        """Look up one comic by ID"""
+        row = self._connection().execute(
+            "SELECT data FROM comics WHERE comic_id = ?", (comic_id,)
+        ).fetchone()
+        return ComicMetadata.from_dict(json_codec.loads(row['data'])) if row else None
+
+    def source_of(self, comic_id: str) -> Optional[Tuple[str, float]]:
+        """(directory name, metadata.json mtime) one comic was last imported from or exported to"""
+        row = self._connection().execute(
+            "SELECT source_dir, source_mtime FROM comics WHERE comic_id = ?", (comic_id,)
+        ).fetchone()
+        return (row['source_dir'], row['source_mtime']) if row else None
+
+    def source_mtimes(self) -> Dict[str, float]:
+        """metadata.json mtime per comic directory, as of the last import or export"""
+        rows = self._connection().execute("SELECT source_dir, source_mtime FROM comics").fetchall()
+        return {row['source_dir']: row['source_mtime'] for row in rows}
+
+    def comic_mtimes(self) -> Dict[str, float]:
+        """Source metadata.json mtime per comic_id; it changes with every save"""
+        rows = self._connection().execute("SELECT comic_id, source_mtime FROM comics").fetchall()
+        return {row['comic_id']: row['source_mtime'] for row in rows}
+
+    def list_comics(self, tone: Optional[str] = None,
+                    visual_style: Optional[str] = None,
+                    video_status: Optional[str] = None,
+                    generated_after: Optional[str] = None,
+                    generated_before: Optional[str] = None) -> List[ComicMetadata]:
+        """
+        List comics newest first, optionally filtered on the indexed columns
+
+        Args:
+            tone: Exact generation_params tone
+            visual_style: Exact generation_params visual_style
+            video_status: Exact video_status
+            generated_after: Inclusive lower bound on generated_at (ISO 8601)
+            generated_before: Exclusive upper bound on generated_at (ISO 8601)
+
+        Returns:
+            Matching ComicMetadata
+        """
+        where, args = self._filters(tone, visual_style, video_status, generated_after, generated_before)
+        rows = self._connection().execute(
+            f"SELECT data FROM comics {where} ORDER BY generated_at DESC, comic_id DESC", args
+        ).fetchall()
+        return [ComicMetadata.from_dict(json_codec.loads(row['data'])) for row in rows]
+
+    def list_page(self, limit: int, after: Optional[Tuple[str, str]] = None,
+                  tone: Optional[str] = None,
+                  visual_style: Optional[str] = None,
+                  video_status: Optional[str] = None,
+                  generated_after: Optional[str] = None,
+                  generated_before: Optional[str] = None) -> List[ComicMetadata]:
+        """
+        One page of comics newest first, using keyset pagination on (generated_at, comic_id)
+
+        Args:
+            limit: Maximum number of comics to return
+            after: (generated_at, comic_id) of the last comic on the previous page
+
+        Returns:
+            Matching ComicMetadata
+        """
+        where, args = self._filters(tone, visual_style, video_status, generated_after, generated_before)
+        if after is not None:
+            keyset = "(generated_at < ? OR (generated_at = ? AND comic_id < ?))"
+            where = f"{where} AND {keyset}" if where else f"WHERE {keyset}"
+            args.extend([after[0], after[0], after[1]])
+
+        rows = self._connection().execute(
+            f"SELECT data FROM comics {where} ORDER BY generated_at DESC, comic_id DESC LIMIT ?",
+            args + [limit]
+        ).fetchall()
+        return [ComicMetadata.from_dict(json_codec.loads(row['data'])) for row in rows]
+
+    def count(self, tone: Optional[str] = None,
+              visual_style: Optional[str] = None,
+              video_status: Optional[str] = None,
+              generated_after: Optional[str] = None,
+              generated_before: Optional[str] = None) -> int:
+        """Number of comics matching the filters"""
+        where, args = self._filters(tone, visual_style, video_status, generated_after, generated_before)
+        return self._connection().execute(f"SELECT COUNT(*) FROM comics {where}", args).fetchone()[0]
+
+    @staticmethod
+    def _filters(tone, visual_style, video_status, generated_after, generated_before):
+        clauses: List[str] = []
+        args: List[Any] = []
+        for column, value in (('tone', tone), ('visual_style', visual_style), ('video_status', video_status)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        if generated_after:
+            clauses.append("generated_at >= ?")
+            args.append(generated_after)
+        if generated_before:
+            clauses.append("generated_at < ?")
+            args.append(generated_before)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def import_directory(self, output_dir: Path) -> int:
+        """
+        Import every comic directory's metadata.json that is new or changed since the last import
+
+        Args:
+            output_dir: Directory containing one sub-directory per comic
+
+        Returns:
+            Number of comics imported
+        """
+        known = self.source_mtimes()
+        imported = 0
+
+        for comic_dir in Path(output_dir).iterdir():
+            metadata_file = comic_dir / "metadata.json"
+            try:
+                mtime = metadata_file.stat().st_mtime
+            except OSError:
+                continue
+            if known.get(comic_dir.name) == mtime:
+                continue
+
+            try:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = ComicMetadata.from_dict(json_codec.loads(f.read()))
+            except Exception as e:
+                logger.warning("Could not read metadata for %s: %s", comic_dir.name, str(e))
+                continue
+
+            self.upsert(metadata, source_mtime=mtime, source_dir=comic_dir.name)
+            imported += 1
+
+        if imported:
+            logger.info(f"🗄️ Imported {imported} comics from {output_dir}")
+        return imported
+
+
+if __name__ == "__main__":
+    # One-shot import: python -m app.core.metadata_store [output_dir] [db_path]
+    import sys
+    from .config import config
+
+    logging.basicConfig(level=logging.INFO)
+    source_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "output/comics")
+    database = sys.argv[2] if len(sys.argv) > 2 else config.comic.metadata_db_path
+    count = SQLiteMetadataStore(database).import_directory(source_dir)
+    print(f"Imported {count} comics into {database}")
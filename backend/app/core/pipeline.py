@@ -0,0 +1,134 @@
+"""
+Staged worker pipeline with bounded queues between stages
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+StageHandler = Callable[[Any], Awaitable[Any]]
+
+
+class PipelineStage:
+    """A named stage with its own worker pool and bounded input queue"""
+
+    def __init__(self, name: str, handler: StageHandler, workers: int, queue_size: int):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.active = 0
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Current queue depth and worker utilization for this stage"""
+        end = self.finished_at or time.monotonic()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        capacity = elapsed * self.workers
+        return {
+            'workers': self.workers,
+            'queue_depth': self.queue.qsize(),
+            'queue_capacity': self.queue.maxsize,
+            'active': self.active,
+            'processed': self.processed,
+            'failed': self.failed,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'utilization': round(self.busy_seconds / capacity, 3) if capacity else 0.0
+        }
+
+
+class StagedPipeline:
+    """
+    Run items through a sequence of stages so different items overlap in different stages
+
+    Each stage's workers pull from that stage's queue and push their output into the
+    next stage's queue; a full queue blocks the upstream stage (backpressure). A
+    handler that raises drops the item and reports it through ``on_error``; errors
+    raised by ``on_error`` itself are logged and never stop a worker.
+    """
+
+    def __init__(self, stages: Sequence[Tuple[str, StageHandler, int]], queue_size: int = 4,
+                 on_error: Optional[Callable[[Any, str, Exception], None]] = None):
+        self.stages = [PipelineStage(name, handler, workers, queue_size)
+                       for name, handler, workers in stages]
+        self.on_error = on_error
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage queue depth and utilization"""
+        return {stage.name: stage.stats() for stage in self.stages}
+
+    async def run(self, items: List[Any]) -> List[Any]:
+        """
+        Push all items through the pipeline
+
+        Returns:
+            Final-stage outputs in input order; None for items that failed
+        """
+        results: List[Any] = [None] * len(items)
+        now = time.monotonic()
+        for stage in self.stages:
+            stage.started_at = now
+
+        workers = [
+            asyncio.create_task(self._worker(index, stage, results))
+            for index, stage in enumerate(self.stages)
+            for _ in range(stage.workers)
+        ]
+
+        try:
+            for position, item in enumerate(items):
+                await self.stages[0].queue.put((position, item))
+
+            # Each stage forwards before marking done, so joining in order drains everything
+            for stage in self.stages:
+                await stage.queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            finished = time.monotonic()
+            for stage in self.stages:
+                stage.finished_at = finished
+
+        return results
+
+    async def _worker(self, index: int, stage: PipelineStage, results: List[Any]) -> None:
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        while True:
+            position, item = await stage.queue.get()
+            try:
+                stage.active += 1
+                started = time.monotonic()
+                try:
+                    output = await stage.handler(item)
+                    stage.processed += 1
+                except Exception as e:
+                    stage.failed += 1
+                    logger.error("❌ Pipeline stage '%s' failed: %s", stage.name, str(e))
+                    if self.on_error:
+                        try:
+                            self.on_error(item, stage.name, e)
+                        except Exception as callback_error:
+                            # A dead worker would leave its queue undrained and run() waiting forever
+                            logger.error("❌ Pipeline stage '%s' error handler failed: %s",
+                                         stage.name, str(callback_error))
+                    continue
+                finally:
+                    # Busy time excludes any wait on a full downstream queue
+                    stage.busy_seconds += time.monotonic() - started
+                    stage.active -= 1
+
+                if next_stage is not None:
+                    await next_stage.queue.put((position, output))
+                else:
+                    results[position] = output
+            finally:
+                stage.queue.task_done()
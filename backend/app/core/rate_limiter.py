@@ -0,0 +1,139 @@
+"""
+Shared token-bucket rate limiters for upstream AI services
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class TokenBucketRateLimiter:
+    """Async token bucket that spaces requests to a requests-per-minute budget"""
+
+    def __init__(self, name: str, requests_per_minute: int, burst: int = 1):
+        self.name = name
+        self.enabled = requests_per_minute > 0
+        self.rate = requests_per_minute / 60.0  # tokens per second
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent; callers are served in arrival order"""
+        if not self.enabled:
+            return
+
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                wait_seconds = (1 - self._tokens) / self.rate
+                logger.info(f"⏳ {self.name} rate limit reached, waiting {wait_seconds:.1f}s")
+                await asyncio.sleep(wait_seconds)
+                self._refill()
+            self._tokens -= 1
+
+
+class SQLiteTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """
+    Token bucket kept in SQLite, so every API worker process draws from one quota
+
+    A caller takes its token in a short write transaction, letting the bucket go
+    negative, and then sleeps off the deficit. Tokens are never handed out twice, and
+    callers are served in the order they reserved across all processes. Refills use
+    wall-clock time, which all the processes share.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int, burst: int, db_path: str):
+        super().__init__(name, requests_per_minute, burst)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        # Not kept: the connection must not outlive the thread that opened it
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; _reserve opens its own write transaction
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _reserve(self) -> float:
+        """Take one token; returns the seconds to wait until it is actually available"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limits WHERE name = ?", (self.name,)
+            ).fetchone()
+            tokens = self.capacity
+            if row is not None:
+                tokens = min(self.capacity, row[0] + max(0.0, now - row[1]) * self.rate)
+            tokens -= 1
+            conn.execute(
+                "INSERT INTO rate_limits (name, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (self.name, tokens, now)
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return max(0.0, -tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent; callers in every process are served in reservation order"""
+        if not self.enabled:
+            return
+
+        wait_seconds = await asyncio.to_thread(self._reserve)
+        if wait_seconds > 0:
+            logger.info(f"⏳ {self.name} rate limit reached, waiting {wait_seconds:.1f}s")
+            await asyncio.sleep(wait_seconds)
+
+
+def _create_limiter(name: str, requests_per_minute: int) -> TokenBucketRateLimiter:
+    """In-process bucket, or with several API worker processes one shared through SQLite"""
+    if config.server.workers > 1 and requests_per_minute > 0:
+        return SQLiteTokenBucketRateLimiter(
+            name, requests_per_minute, config.rate_limits.burst, config.comic.jobs_db_path
+        )
+    return TokenBucketRateLimiter(name, requests_per_minute, config.rate_limits.burst)
+
+
+# Shared limiters so every service instance (and, under gunicorn, every worker) draws from the same quota
+gemini_rate_limiter = _create_limiter("Gemini", config.rate_limits.gemini_requests_per_minute)
+imagen_rate_limiter = _create_limiter("Imagen", config.rate_limits.imagen_requests_per_minute)
@@ -50,10 +50,13 @@ class ComicMetadata:
     generation_completed_at: Optional[str] = None
     video_url: Optional[str] = None
     video_status: Optional[str] = None  # 'generating', 'completed', 'failed'
+    video_error: Optional[str] = None  # Failure message of the last video job
     video_generated_at: Optional[str] = None
     video_processing_time_seconds: Optional[float] = None
     panel_video_uris: Optional[List[str]] = None  # Array of panel video URIs
     panel_image_paths: Optional[List[str]] = None  # Array of individual panel image paths
+    file_hashes: Optional[Dict[str, str]] = None  # SHA-256 per file key ('image', 'script', 'video')
+    image_stats: Optional[Dict[str, Dict[str, float]]] = None  # count, ms and bytes per image stage
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ComicMetadata':
@@ -71,10 +74,13 @@ class ComicMetadata:
             generation_completed_at=data.get('generation_completed_at'),
             video_url=data.get('video_url'),
             video_status=data.get('video_status'),
+            video_error=data.get('video_error'),
             video_generated_at=data.get('video_generated_at'),
             video_processing_time_seconds=data.get('video_processing_time_seconds'),
             panel_video_uris=data.get('panel_video_uris'),
-            panel_image_paths=data.get('panel_image_paths')
+            panel_image_paths=data.get('panel_image_paths'),
+            file_hashes=data.get('file_hashes'),
+            image_stats=data.get('image_stats')
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -92,8 +98,11 @@ class ComicMetadata:
             'generation_completed_at': self.generation_completed_at,
             'video_url': self.video_url,
             'video_status': self.video_status,
+            'video_error': self.video_error,
             'video_generated_at': self.video_generated_at,
             'video_processing_time_seconds': self.video_processing_time_seconds,
             'panel_video_uris': self.panel_video_uris,
-            'panel_image_paths': self.panel_image_paths
+            'panel_image_paths': self.panel_image_paths,
+            'file_hashes': self.file_hashes,
+            'image_stats': self.image_stats
         }
@@ -4,5 +4,6 @@ External service integrations
 
 from .script_generator import ScriptGeneratorService
 from .artwork_generator import ArtworkGeneratorService
+from .image_derivatives import ImageDerivativeService
 
-__all__ = ["ScriptGeneratorService", "ArtworkGeneratorService"]
+__all__ = ["ScriptGeneratorService", "ArtworkGeneratorService", "ImageDerivativeService"]
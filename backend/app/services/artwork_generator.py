@@ -3,19 +3,107 @@ Comic artwork generation service using Imagen AI
 """
 
 from google import genai
+import asyncio
 import os
-from typing import List, Dict, Optional
-import io
-from PIL import Image, ImageDraw, ImageFont
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Dict, Optional
+from functools import lru_cache
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 import logging
 
+import numpy as np
+
 from pympler import panels
 
+from ..core import image_codec
 from ..core.config import config
+from ..core.disk_cache import DiskLRUCache
+from ..core.image_codec import ImageStageStats
+from ..core.image_pool import image_pool
+from ..core.layout import compute_layout
+from ..core.rate_limiter import imagen_rate_limiter
 import base64
 
 logger = logging.getLogger(__name__)
 
+# Every panel is normalized to this size (width, height)
+PANEL_SIZE = (1024, 1024)
+
+# Side of the locally drawn fallback panel, in pixels
+FALLBACK_PANEL_SIZE = PANEL_SIZE[0]
+
+
+@lru_cache(maxsize=4)
+def _panel_template(size: int) -> Image.Image:
+    """
+    Static background of a fallback panel: border plus banded gradient
+
+    Built once per size with NumPy and copied for every panel, instead of
+    redrawing the gradient one line at a time. Callers must not modify it.
+    """
+    background = np.empty((size, size, 3), dtype=np.uint8)
+    background[:, :] = ImageColor.getrgb('#f0f8ff')
+
+    # Four horizontal bands across the inner content area
+    inner_margin = 30
+    x1, y1, x2, y2 = inner_margin, inner_margin, size - inner_margin, size - inner_margin
+    colors = np.array([ImageColor.getrgb(c) for c in ('#e3f2fd', '#bbdefb', '#90caf9', '#64b5f6')],
+                      dtype=np.uint8)
+    height = y2 - y1
+    bands = np.minimum(np.arange(height) * len(colors) // height, len(colors) - 1)
+    background[y1:y2, x1:x2 + 1] = colors[bands][:, np.newaxis, :]
+
+    img = Image.fromarray(background, 'RGB')
+    ImageDraw.Draw(img).rectangle([0, 0, size, size], outline='#2c3e50', width=12)
+    return img
+
+
+@lru_cache(maxsize=None)
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Arial at the given size, or Pillow's default font; loaded once per size"""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _wrap_text(text: str, font: ImageFont.ImageFont, max_width: float) -> List[str]:
+    """
+    Greedy word wrap using the font's rendered widths
+
+    Each word is measured once; a line's width is its words plus the spaces between them.
+
+    Args:
+        text: Text to wrap
+        font: Font the text will be drawn with
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Lines of text; a single word wider than max_width gets a line of its own
+    """
+    space_width = font.getlength(' ')
+    lines = []
+    current_line: List[str] = []
+    line_width = 0.0
+    for word in text.split():
+        word_width = font.getlength(word)
+        if current_line and line_width + space_width + word_width > max_width:
+            lines.append(' '.join(current_line))
+            current_line, line_width = [], 0.0
+        line_width += (space_width if current_line else 0.0) + word_width
+        current_line.append(word)
+    if current_line:
+        lines.append(' '.join(current_line))
+    return lines
+
+
+@dataclass
+class PanelArtwork:
+    """A rendered panel, decoded and encoded exactly once"""
+    image: Image.Image  # Passed on to composition as-is
+    data: bytes  # PNG written to panel_<n>_image.png and the render cache
+
 
 class ArtworkGeneratorService:
     """Service for generating comic artwork using Imagen AI"""
@@ -36,16 +124,32 @@ class ArtworkGeneratorService:
             self.use_imagen = False
             self.image_model = None
 
-    async def generate_panel_artwork(self, panel: Dict, style_prompt: str = "") -> bytes:
+        # Content-addressed cache of Imagen renders, shared across comics
+        self.image_cache = None
+        if config.imagen.cache_enabled:
+            try:
+                self.image_cache = DiskLRUCache(
+                    config.imagen.cache_dir,
+                    max_bytes=config.imagen.cache_max_mb * 1024 * 1024,
+                    suffix=".png"
+                )
+            except Exception as e:
+                logger.warning(f"Imagen render cache disabled: {e}")
+
+    async def generate_panel_artwork(self, panel: Dict, style_prompt: str = "",
+                                     use_cache: bool = True,
+                                     stats: Optional[ImageStageStats] = None) -> PanelArtwork:
         """
         Generate artwork for a single comic panel
 
         Args:
             panel: Panel dictionary with scene description and art direction
             style_prompt: Additional style specifications
+            use_cache: Reuse a cached render for an identical prompt
+            stats: Collects bytes and milliseconds per image stage
 
         Returns:
-            Image bytes for the generated panel
+            The panel image and its PNG encoding
         """
         try:
             logger.info(f"🎨 Generating artwork for panel {panel.get('panel_number', '?')}")
@@ -53,9 +157,9 @@ class ArtworkGeneratorService:
             prompt = self._build_image_prompt(panel, style_prompt)
 
             if self.use_imagen:
-                return await self._generate_with_imagen(prompt)
+                return await self._generate_with_imagen(prompt, use_cache=use_cache, stats=stats)
             else:
-                return self._create_visual_comic_panel(panel, prompt)
+                return await self._create_visual_comic_panel(panel, prompt, stats)
 
         except Exception as e:
             logger.error(f"❌ Failed to generate panel artwork: {e}")
@@ -70,11 +174,13 @@ class ArtworkGeneratorService:
                 "dialogue": [],
                 "visual_focus": "Scene"
             }
-            return self._create_visual_comic_panel(safe_panel, "fallback comic panel")
+            return await self._create_visual_comic_panel(safe_panel, "fallback comic panel", stats)
 
     async def generate_complete_comic(self, panels: List[Dict],
                                     style_theme: str = "modern digital comic",
-                                    comic_id: str = None) -> bytes:
+                                    comic_id: str = None,
+                                    use_cache: bool = True,
+                                    stats: Optional[ImageStageStats] = None) -> bytes:
         """
         Generate complete comic with all panels
 
@@ -82,124 +188,298 @@ class ArtworkGeneratorService:
             panels: List of panel dictionaries
             style_theme: Overall visual style theme
             comic_id: Comic ID for saving individual panel images
+            use_cache: Reuse cached renders for identical prompts
+            stats: Collects bytes and milliseconds per image stage
 
         Returns:
             Complete comic image as bytes
         """
-        panel_images = []
+        panel_images = await self.render_panels(panels, style_theme, comic_id, use_cache, stats=stats)
+        return await self.compose_comic(panel_images, stats)
+
+    async def render_panels(self, panels: List[Dict],
+                            style_theme: str = "modern digital comic",
+                            comic_id: str = None,
+                            use_cache: bool = True,
+                            on_panel_rendered: Optional[Callable[[int, int], None]] = None,
+                            stats: Optional[ImageStageStats] = None) -> List[Image.Image]:
+        """
+        Render every panel of a comic, in panel order
+
+        Args:
+            panels: List of panel dictionaries
+            style_theme: Overall visual style theme
+            comic_id: Comic ID for saving individual panel images
+            use_cache: Reuse cached renders for identical prompts
+            on_panel_rendered: Called with (panel index, panel count) as each panel finishes
+            stats: Collects bytes and milliseconds per image stage
+
+        Returns:
+            List of decoded panel images, ready to compose
+        """
+        async def render(i: int, panel: Dict) -> Image.Image:
+            image = await self._render_panel(i, panel, len(panels), style_theme, comic_id, use_cache, stats)
+            if on_panel_rendered:
+                on_panel_rendered(i, len(panels))
+            return image
+
+        if config.imagen.concurrent_panels and len(panels) > 1:
+            # Panels are independent, so render them together under a per-comic limit
+            semaphore = asyncio.Semaphore(max(1, config.imagen.max_concurrent_panels))
+
+            async def render_limited(i: int, panel: Dict) -> Image.Image:
+                async with semaphore:
+                    return await render(i, panel)
+
+            # gather preserves input order, so panel positions are unchanged
+            return list(await asyncio.gather(
+                *(render_limited(i, panel) for i, panel in enumerate(panels))
+            ))
 
+        panel_images = []
         for i, panel in enumerate(panels):
+            panel_images.append(await render(i, panel))
+        return panel_images
+
+    async def compose_comic(self, panel_images: List[Image.Image],
+                            stats: Optional[ImageStageStats] = None,
+                            image_format: Optional[str] = None) -> bytes:
+        """
+        Combine rendered panels into the final comic image, in the image process pool
+
+        Args:
+            panel_images: Decoded panel images in panel order
+            stats: Collects bytes and milliseconds per image stage
+            image_format: PNG, WEBP or JPEG (default: config.comic.output_format)
+
+        Returns:
+            Complete comic image, encoded once
+        """
+        if not panel_images:
+            raise ValueError("No panels to combine")
+
+        layout = compute_layout(
+            [image.size for image in panel_images],
+            mode=config.comic.layout,
+            margin=config.comic.panel_margin,
+            columns=config.comic.layout_columns,
+            templates=config.comic.layout_templates
+        )
+        comic_bytes = await image_pool.compose(
+            panel_images, layout, image_format or config.comic.output_format, stats
+        )
+
+        logger.info(f"Complete comic generated with {len(panel_images)} panels")
+        return comic_bytes
+
+    async def rerender_panel(self, panel: Dict, panel_number: int, style_theme: str, comic_id: str,
+                             use_cache: bool = False,
+                             stats: Optional[ImageStageStats] = None) -> Image.Image:
+        """
+        Render one panel of a saved comic again and save it over panel_<n>_image.png
+
+        Unlike render_panels there is no local fallback: if Imagen fails, this raises
+        and the saved panel is kept.
+
+        Args:
+            panel: Panel dictionary from the comic's script
+            panel_number: 1-based panel number
+            style_theme: Overall visual style theme
+            comic_id: Comic the panel belongs to
+            use_cache: Reuse a cached render of the same prompt (which would be the
+                same image); the new render is cached either way
+            stats: Collects bytes and milliseconds per image stage
+
+        Returns:
+            The new panel image
+        """
+        if not self.use_imagen:
+            raise RuntimeError("Imagen is not available")
+
+        prompt = self._build_image_prompt(panel, style_theme)
+        artwork = await self._generate_with_imagen(prompt, use_cache=use_cache, stats=stats)
+        if not await asyncio.to_thread(self._save_panel_image, artwork.data, panel_number, comic_id):
+            raise RuntimeError(f"Could not save panel {panel_number} of comic {comic_id}")
+        return artwork.image
+
+    async def load_saved_panels(self, comic_dir: Path, panels: List[Dict],
+                                stats: Optional[ImageStageStats] = None,
+                                loaded: Optional[Dict[int, Image.Image]] = None) -> List[Image.Image]:
+        """
+        Decode a comic's saved panel_<n>_image.png files, in panel order
+
+        Panels that were never saved (their render failed) are drawn locally again.
+
+        Args:
+            comic_dir: Directory of the comic
+            panels: Panel dictionaries from the comic's script
+            stats: Collects bytes and milliseconds per image stage
+            loaded: Panel images already in memory, by 1-based panel number; not read again
+
+        Returns:
+            Panel images, ready to compose
+        """
+        loaded = loaded or {}
+
+        async def load(i: int, panel: Dict) -> Image.Image:
+            if i + 1 in loaded:
+                return loaded[i + 1]
+            path = comic_dir / f"panel_{i+1}_image.png"
             try:
-                # Validate panel is a dictionary
-                if not isinstance(panel, dict):
-                    logger.error(f"Panel {i+1} is not a dictionary: {type(panel)} - {panel}")
-                    # Create a basic panel structure
-                    panel = {
-                        "panel_number": i+1,
-                        "scene_description": f"Panel {i+1} content",
-                        "characters": ["Character"],
-                        "dialogue": [{"character": "Character", "text": "Panel content"}],
-                        "visual_focus": "Main scene"
-                    }
-
-                logger.info(f"🎨 Processing panel {i+1}: {panel.get('scene_description', 'No description')[:50]}")
-
-                panel_bytes = await self.generate_panel_artwork(panel, style_theme)
-                panel_image = Image.open(io.BytesIO(panel_bytes))
-                panel_images.append(panel_image)
-
-                # Save individual panel image if comic_id is provided
-                if comic_id:
-                    self._save_panel_image(panel_bytes, i+1, comic_id)
-                    logger.info(f"Attempting to save panel {i+1} image with comic_id: {comic_id}")
-
-                logger.info(f"✅ Panel {i+1}/{len(panels)} completed")
-            except Exception as e:
-                logger.error(f"❌ Failed to generate panel {i+1}: {e}")
-                # Create fallback panel with safe data
-                safe_panel = {
+                data = await asyncio.to_thread(path.read_bytes)
+            except FileNotFoundError:
+                logger.warning(f"Panel {i+1} image missing in {comic_dir}, drawing it locally")
+                with image_codec.timed(stats, "fallback_render"):
+                    return await asyncio.to_thread(self._render_visual_comic_panel, panel)
+            image, _ = await image_pool.normalize_panel(data, PANEL_SIZE, encode=False, stats=stats)
+            return image
+
+        return list(await asyncio.gather(*(load(i, panel) for i, panel in enumerate(panels))))
+
+    async def _render_panel(self, i: int, panel: Dict, total_panels: int,
+                            style_theme: str, comic_id: Optional[str],
+                            use_cache: bool = True,
+                            stats: Optional[ImageStageStats] = None) -> Image.Image:
+        """
+        Render a single panel, falling back to a local panel on failure
+
+        Args:
+            i: Zero-based panel index
+            panel: Panel dictionary
+            total_panels: Number of panels in the comic (for logging)
+            style_theme: Overall visual style theme
+            comic_id: Comic ID for saving the individual panel image
+            use_cache: Reuse a cached render for an identical prompt
+            stats: Collects bytes and milliseconds per image stage
+
+        Returns:
+            Panel image
+        """
+        try:
+            # Validate panel is a dictionary
+            if not isinstance(panel, dict):
+                logger.error(f"Panel {i+1} is not a dictionary: {type(panel)} - {panel}")
+                # Create a basic panel structure
+                panel = {
                     "panel_number": i+1,
-                    "scene_description": f"Panel {i+1}",
+                    "scene_description": f"Panel {i+1} content",
                     "characters": ["Character"],
-                    "dialogue": [],
-                    "visual_focus": "Scene"
+                    "dialogue": [{"character": "Character", "text": "Panel content"}],
+                    "visual_focus": "Main scene"
                 }
-                try:
-                    fallback_bytes = self._create_visual_comic_panel(safe_panel, "fallback")
-                    fallback_image = Image.open(io.BytesIO(fallback_bytes))
-                    panel_images.append(fallback_image)
-                except Exception as e2:
-                    logger.error(f"❌ Even fallback failed for panel {i+1}: {e2}")
-                    # Create minimal placeholder
-                    placeholder_image = self._create_minimal_placeholder(i+1)
-                    panel_images.append(placeholder_image)
-
-        # Combine panels into final comic
-        comic_image = self._combine_panels(panel_images)
-
-        output = io.BytesIO()
-        comic_image.save(output, format=config.comic.output_format, quality=95)
-        output.seek(0)
-
-        logger.info(f"Complete comic generated with {len(panels)} panels")
-        return output.getvalue()
-
-    async def _generate_with_imagen(self, prompt: str) -> bytes:
-        """Generate image using Imagen 4 model"""
+
+            logger.info(f"🎨 Processing panel {i+1}: {panel.get('scene_description', 'No description')[:50]}")
+
+            artwork = await self.generate_panel_artwork(panel, style_theme, use_cache=use_cache, stats=stats)
+
+            # Save individual panel image if comic_id is provided
+            if comic_id:
+                await asyncio.to_thread(self._save_panel_image, artwork.data, i+1, comic_id)
+                logger.info(f"Attempting to save panel {i+1} image with comic_id: {comic_id}")
+
+            logger.info(f"✅ Panel {i+1}/{total_panels} completed")
+            return artwork.image
+        except Exception as e:
+            logger.error(f"❌ Failed to generate panel {i+1}: {e}")
+            # Create fallback panel with safe data
+            safe_panel = {
+                "panel_number": i+1,
+                "scene_description": f"Panel {i+1}",
+                "characters": ["Character"],
+                "dialogue": [],
+                "visual_focus": "Scene"
+            }
+            try:
+                # Not saved to disk, so there is nothing to encode
+                with image_codec.timed(stats, "fallback_render"):
+                    return await asyncio.to_thread(self._render_visual_comic_panel, safe_panel)
+            except Exception as e2:
+                logger.error(f"❌ Even fallback failed for panel {i+1}: {e2}")
+                # Create minimal placeholder
+                return self._create_minimal_placeholder(i+1)
+
+    async def _generate_with_imagen(self, prompt: str, use_cache: bool = True,
+                                    stats: Optional[ImageStageStats] = None) -> PanelArtwork:
+        """Generate image using Imagen 4 model, reusing cached renders of identical prompts"""
         if not self.image_model:
             raise ValueError("No image model configured")
 
+        cache_key = None
+        if self.image_cache is not None:
+            cache_key = DiskLRUCache.make_key(
+                model=self.image_model,
+                prompt=prompt,
+                aspect_ratio=config.imagen.aspect_ratio,
+                size=config.imagen.image_size
+            )
+            if use_cache:
+                cached = await asyncio.to_thread(self.image_cache.get, cache_key)
+                if cached is not None:
+                    logger.info(f"💾 Imagen cache hit for prompt: {prompt[:60]}...")
+                    try:
+                        # Cached renders are already normalized PNGs: decode only
+                        image, _ = await image_pool.normalize_panel(
+                            cached, PANEL_SIZE, encode=False, stats=stats
+                        )
+                        return PanelArtwork(image=image, data=cached)
+                    except Exception as e:
+                        # A damaged entry must not fail the panel: drop it and render afresh
+                        logger.warning(f"Discarding unreadable cached render: {e}")
+                        await asyncio.to_thread(self.image_cache.discard, cache_key)
+
         try:
             logger.info(f"🎨 Generating image with {self.image_model}")
             logger.info(f"   Prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
 
-            # Use Imagen 4 API pattern
-            response = self.client.models.generate_images(
+            await imagen_rate_limiter.acquire()
+
+            # Use Imagen 4 API pattern via the async client so the event loop is not blocked
+            response = await self.client.aio.models.generate_images(
                 model=self.image_model,
                 prompt=prompt,
                 config={
                     "number_of_images": 1,
-                    "aspect_ratio": "1:1"
+                    "aspect_ratio": config.imagen.aspect_ratio
                 }
             )
 
             logger.info(f"   📥 Response received from {self.image_model}")
 
-            # Process response
-            img = None
+            # Process response: the encoded image, or raw pixels if the SDK already decoded it
+            source = None
+            raw_format = None
 
             if hasattr(response, 'images') and response.images:
                 img_data = response.images[0]
 
-                if hasattr(img_data, '_pil_image'):
-                    img = img_data._pil_image
+                if getattr(img_data, '_pil_image', None) is not None:
+                    pil_image = img_data._pil_image
+                    source, raw_format = pil_image.tobytes(), (pil_image.mode, pil_image.size)
                 elif hasattr(img_data, 'data'):
-                    try:
-                        if isinstance(img_data.data, str):
-                            img = Image.open(io.BytesIO(base64.b64decode(img_data.data)))
-                        else:
-                            img = Image.open(io.BytesIO(img_data.data))
-                    except Exception as e:
-                        logger.warning(f"Failed to process image data: {e}")
-
-            if img:
-                # Ensure RGB mode
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-
-                # Standardize size
-                if img.size != (1024, 1024):
-                    img = img.resize((1024, 1024), Image.Resampling.LANCZOS)
+                    if isinstance(img_data.data, str):
+                        source = base64.b64decode(img_data.data)
+                    else:
+                        source = img_data.data
 
-                # Convert to bytes
-                img_bytes = io.BytesIO()
-                img.save(img_bytes, format='PNG', quality=95)
-                img_bytes.seek(0)
+            if source:
+                # Decode, convert to RGB, standardize size and encode the panel's one PNG
+                # (saved as the panel image and cached as-is) in the image process pool
+                img, panel_bytes = await image_pool.normalize_panel(
+                    source, PANEL_SIZE, raw_format=raw_format, stats=stats
+                )
 
                 logger.info(f"🎉 SUCCESS! Image generated with {self.image_model}")
                 logger.info(f"   📐 Final image size: {img.size}")
-                logger.info(f"   💾 Image bytes size: {len(img_bytes.getvalue())} bytes")
-                return img_bytes.getvalue()
+                logger.info(f"   💾 Image bytes size: {len(panel_bytes)} bytes")
+
+                # Bypassed requests still refresh the cache with the new render
+                if cache_key is not None:
+                    try:
+                        await asyncio.to_thread(self.image_cache.put, cache_key, panel_bytes)
+                    except Exception as e:
+                        logger.warning(f"Failed to cache Imagen render: {e}")
+
+                return PanelArtwork(image=img, data=panel_bytes)
 
             raise ValueError(f"No usable image data from {self.image_model}")
 
@@ -207,7 +487,7 @@ class ArtworkGeneratorService:
             logger.error(f"❌ Image generation failed with {self.image_model}: {e}")
             raise
 
-    def _save_panel_image(self, panel_bytes: bytes, panel_number: int, comic_id: str) -> None:
+    def _save_panel_image(self, panel_bytes: bytes, panel_number: int, comic_id: str) -> bool:
         """
         Save individual panel image to comic directory
 
@@ -215,10 +495,11 @@ class ArtworkGeneratorService:
             panel_bytes: Panel image bytes
             panel_number: Panel number for filename
             comic_id: Comic ID for directory location
+
+        Returns:
+            True if the image was saved
         """
         try:
-            from pathlib import Path
-
             logger.info(f"Saving panel {panel_number} image for comic_id: {comic_id}")
             logger.info(f"Panel bytes length: {len(panel_bytes) if panel_bytes else 0}")
 
@@ -235,67 +516,50 @@ class ArtworkGeneratorService:
 
             logger.info(f"Saving to path: {panel_path}")
 
-            with open(panel_path, 'wb') as f:
+            # Write atomically: a regenerated panel replaces a file that may be being served
+            tmp_path = panel_path.with_name(f".{panel_filename}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
                 f.write(panel_bytes)
+            os.replace(tmp_path, panel_path)
 
             logger.info(f"✅ Successfully saved panel {panel_number} image to: {panel_path}")
+            return True
 
         except Exception as e:
             logger.error(f"❌ Failed to save panel {panel_number} image: {str(e)}")
             import traceback
             traceback.print_exc()
+            return False
 
-    def _create_visual_comic_panel(self, panel: Dict, prompt: str) -> bytes:
+    async def _create_visual_comic_panel(self, panel: Dict, prompt: str,
+                                         stats: Optional[ImageStageStats] = None) -> PanelArtwork:
         """Create a visually appealing comic panel with text and graphics"""
-        img = Image.new('RGB', (1024, 1024), '#f0f8ff')
-        draw = ImageDraw.Draw(img)
-
-        # Add comic border
-        border_color = '#2c3e50'
-        border_width = 12
-        draw.rectangle([0, 0, 1024, 1024], outline=border_color, width=border_width)
-
-        # Add inner content area
-        inner_margin = 30
-        content_area = [inner_margin, inner_margin, 1024-inner_margin, 1024-inner_margin]
+        with image_codec.timed(stats, "fallback_render"):
+            img = await asyncio.to_thread(self._render_visual_comic_panel, panel)
 
-        # Add gradient background
-        self._add_gradient_background(img, draw, content_area)
-
-        # Add comic elements
-        self._add_comic_content(draw, panel, content_area)
-
-        # Convert to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG', quality=95)
-        img_bytes.seek(0)
+        panel_bytes = await image_pool.encode(img, "PNG", stats)
 
         logger.info("Visual comic panel created")
-        return img_bytes.getvalue()
+        return PanelArtwork(image=img, data=panel_bytes)
 
-    def _add_gradient_background(self, img: Image.Image, draw: ImageDraw.Draw, area: List[int]):
-        """Add gradient background"""
-        x1, y1, x2, y2 = area
-        colors = ['#e3f2fd', '#bbdefb', '#90caf9', '#64b5f6']
+    def _render_visual_comic_panel(self, panel: Dict) -> Image.Image:
+        """Draw a fallback panel's text on a copy of the shared background template"""
+        img = _panel_template(FALLBACK_PANEL_SIZE).copy()
+        draw = ImageDraw.Draw(img)
 
-        height = y2 - y1
-        for i in range(height):
-            color_idx = min(int(i / height * len(colors)), len(colors) - 1)
-            y = y1 + i
-            draw.line([(x1, y), (x2, y)], fill=colors[color_idx])
+        inner_margin = 30
+        content_area = [inner_margin, inner_margin,
+                        FALLBACK_PANEL_SIZE - inner_margin, FALLBACK_PANEL_SIZE - inner_margin]
+        self._add_comic_content(draw, panel, content_area)
+        return img
 
     def _add_comic_content(self, draw: ImageDraw.Draw, panel: Dict, area: List[int]):
         """Add comic content to the panel"""
         x1, y1, x2, y2 = area
 
         try:
-            # Load fonts
-            try:
-                title_font = ImageFont.truetype("arial.ttf", 32)
-                text_font = ImageFont.truetype("arial.ttf", 20)
-            except:
-                title_font = ImageFont.load_default()
-                text_font = ImageFont.load_default()
+            title_font = _load_font(32)
+            text_font = _load_font(20)
 
             # Panel title
             panel_num = panel.get('panel_number', '?')
@@ -307,22 +571,8 @@ class ArtworkGeneratorService:
             if len(scene) > 80:
                 scene = scene[:80] + "..."
 
-            # Wrap and draw scene text
-            words = scene.split()
-            lines = []
-            current_line = []
-
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                if len(test_line) < 40:  # Simple character-based wrapping
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    current_line = [word]
-
-            if current_line:
-                lines.append(' '.join(current_line))
+            # Wrap scene text to the width of the content area
+            lines = _wrap_text(scene, text_font, (x2 - x1) - 40)
 
             y_offset = y1 + 80
             for line in lines[:5]:  # Max 5 lines
@@ -433,33 +683,6 @@ class ArtworkGeneratorService:
             # Return safe fallback prompt
             return f"Comic book panel, {config.comic.comic_style}, professional comic book illustration"
 
-    def _combine_panels(self, panel_images: List[Image.Image]) -> Image.Image:
-        """Combine panels into 2x2 comic layout"""
-        if not panel_images:
-            raise ValueError("No panels to combine")
-
-        panel_size = 1024
-        margin = 15
-
-        # Create 2x2 grid
-        comic_width = (panel_size * 2) + (margin * 3)
-        comic_height = (panel_size * 2) + (margin * 3)
-
-        comic = Image.new('RGB', (comic_width, comic_height), 'white')
-
-        positions = [
-            (margin, margin),                           # Top-left
-            (margin + panel_size + margin, margin),     # Top-right
-            (margin, margin + panel_size + margin),     # Bottom-left
-            (margin + panel_size + margin, margin + panel_size + margin)  # Bottom-right
-        ]
-
-        for i, panel in enumerate(panel_images[:4]):
-            if i < len(positions):
-                comic.paste(panel, positions[i])
-
-        return comic
-
     def _create_minimal_placeholder(self, panel_num: int) -> Image.Image:
         """Create minimal placeholder when everything else fails"""
         img = Image.new('RGB', (1024, 1024), '#f0f0f0')
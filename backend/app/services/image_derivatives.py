@@ -0,0 +1,142 @@
+"""
+Resized and re-encoded derivatives of comic images, cached on disk next to the comic
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PIL import Image, features
+
+from ..core.config import config
+
+logger = logging.getLogger(__name__)
+
+# Output format per negotiated media type, in order of preference
+FORMATS = {
+    'image/avif': ('AVIF', 'avif'),
+    'image/webp': ('WEBP', 'webp'),
+    'image/jpeg': ('JPEG', 'jpg'),
+}
+
+
+class ImageDerivativeService:
+    """Service for producing thumbnail/medium/full variants of comic images"""
+
+    def __init__(self):
+        self.sizes = config.derivatives.sizes
+        self.avif_supported = 'avif' in features.get_supported_modules()
+
+    def resolve_size(self, size: Optional[str] = None, width: Optional[int] = None) -> str:
+        """
+        Pick a named size preset
+
+        Args:
+            size: Preset name ('thumb', 'medium' or 'full')
+            width: Requested width in pixels; the smallest preset at least this wide is used
+
+        Returns:
+            Preset name
+
+        Raises:
+            ValueError: If the preset name is unknown
+        """
+        if size:
+            if size != 'full' and size not in self.sizes:
+                raise ValueError(f"Unknown size '{size}'")
+            return size
+        if width:
+            for name, preset_width in sorted(self.sizes.items(), key=lambda item: item[1]):
+                if preset_width >= width:
+                    return name
+        return 'full'
+
+    def negotiate_format(self, accept: Optional[str], size: str) -> Optional[str]:
+        """
+        Choose the output media type from the Accept header
+
+        AVIF is preferred over WebP when both are listed; types with q=0 are refused.
+        Wildcards are not enough: the client has to name the type.
+
+        Returns:
+            Media type, or None to serve the original file unchanged
+        """
+        accepted = {}
+        for part in (accept or '').split(','):
+            media_type, *params = [item.strip() for item in part.split(';')]
+            quality = 1.0
+            for param in params:
+                if param.lower().startswith('q='):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        quality = 0.0
+            accepted[media_type.lower()] = quality
+
+        if self.avif_supported and accepted.get('image/avif', 0.0) > 0:
+            return 'image/avif'
+        if accepted.get('image/webp', 0.0) > 0:
+            return 'image/webp'
+        # Scaled-down variants are always worth re-encoding; full size falls back to the original
+        return 'image/jpeg' if size != 'full' else None
+
+    def get_derivative(self, source_path: Path, size: str, media_type: str) -> Path:
+        """
+        Return the cached derivative for source_path, creating it if missing or stale
+
+        Args:
+            source_path: Original comic image
+            size: Preset name from resolve_size
+            media_type: Media type from negotiate_format
+
+        Returns:
+            Path of the derivative file
+        """
+        pil_format, extension = FORMATS[media_type]
+        derived_dir = source_path.parent / "derived"
+        target = derived_dir / f"{source_path.stem}_{size}.{extension}"
+
+        try:
+            if target.stat().st_mtime >= source_path.stat().st_mtime:
+                return target
+        except OSError:
+            pass
+
+        derived_dir.mkdir(exist_ok=True)
+        with Image.open(source_path) as img:
+            img = img.convert('RGB')
+            max_width = self.sizes.get(size)
+            if max_width and img.width > max_width:
+                height = round(img.height * max_width / img.width)
+                img = img.resize((max_width, height), Image.Resampling.LANCZOS)
+
+            tmp_target = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            img.save(tmp_target, format=pil_format, **self._encoder_options(pil_format))
+            os.replace(tmp_target, target)
+
+        logger.info(f"🖼️ Created {size} {pil_format} derivative: {target} ({target.stat().st_size} bytes)")
+        return target
+
+    def pregenerate(self, source_path: Path) -> None:
+        """Create the default derivatives right after a comic is saved"""
+        for size in config.derivatives.pregenerate_sizes:
+            for media_type in ('image/webp', 'image/jpeg'):
+                try:
+                    self.get_derivative(source_path, size, media_type)
+                except Exception as e:
+                    logger.warning(f"Failed to pregenerate {size} derivative for {source_path}: {e}")
+
+    def invalidate(self, source_path: Path) -> None:
+        """Delete all cached derivatives of source_path"""
+        derived_dir = source_path.parent / "derived"
+        for path in derived_dir.glob(f"{source_path.stem}_*"):
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _encoder_options(pil_format: str) -> dict:
+        if pil_format == 'WEBP':
+            return {'quality': config.derivatives.webp_quality, 'method': 4}
+        if pil_format == 'AVIF':
+            return {'quality': config.derivatives.avif_quality}
+        return {'quality': config.derivatives.jpeg_quality, 'optimize': True, 'progressive': True}
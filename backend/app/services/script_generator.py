@@ -4,13 +4,19 @@ Comic script generation service using Gemini AI
 
 from google import genai
 import os
+import copy
 import json
 import logging
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from ..core.config import config
+from ..core.memory_cache import TTLCache
+from ..core.rate_limiter import gemini_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever _build_script_prompt changes so cached scripts from the old prompt are not reused
+PROMPT_TEMPLATE_VERSION = 1
+
 
 class ScriptGeneratorService:
     """Service for generating comic scripts using Gemini AI"""
@@ -24,8 +30,16 @@ class ScriptGeneratorService:
             logger.error(f"Failed to initialize script generator: {e}")
             raise
 
+        self.script_cache = None
+        if config.gemini.script_cache_enabled:
+            self.script_cache = TTLCache(
+                max_entries=config.gemini.script_cache_max_entries,
+                ttl_seconds=config.gemini.script_cache_ttl_seconds
+            )
+
     async def generate_comic_script(self, topic: str, tone: str = "humorous", 
-                                  target_audience: str = "general") -> Dict:
+                                  target_audience: str = "general",
+                                  use_cache: bool = True) -> Dict:
         """
         Generate a comic script based on the topic and parameters
 
@@ -33,6 +47,7 @@ class ScriptGeneratorService:
             topic: The main topic/theme for the comic
             tone: Comic tone (humorous, educational, dramatic, etc.)
             target_audience: Target audience (general, kids, technical, etc.)
+            use_cache: Reuse a recent script for the same inputs instead of calling Gemini
 
         Returns:
             Dictionary containing the complete comic script
@@ -40,9 +55,20 @@ class ScriptGeneratorService:
         try:
             logger.info(f"📝 Generating script for topic: {topic}")
 
+            cache_key = self._script_cache_key(topic, tone, target_audience)
+            if self.script_cache is not None and use_cache:
+                cached = self.script_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"💾 Script cache hit for topic: {topic}")
+                    # Validation mutates the script, so work on a copy of the cached response
+                    return self._validate_character_consistency(copy.deepcopy(cached))
+
             prompt = self._build_script_prompt(topic, tone, target_audience)
 
-            response = self.client.models.generate_content(
+            await gemini_rate_limiter.acquire()
+
+            # Use the async client so the event loop keeps serving other requests
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt,
                 config={
@@ -55,6 +81,10 @@ class ScriptGeneratorService:
             # Parse the JSON response
             script_data = json.loads(response.text)
 
+            # Cache the raw response; fallback scripts are never cached
+            if self.script_cache is not None:
+                self.script_cache.put(cache_key, copy.deepcopy(script_data))
+
             # Validate and enhance character consistency
             script_data = self._validate_character_consistency(script_data)
 
@@ -66,6 +96,20 @@ class ScriptGeneratorService:
             # Return fallback script
             return self._create_fallback_script(topic, tone)
 
+    def _script_cache_key(self, topic: str, tone: str, target_audience: str) -> Tuple:
+        """Build the script cache key from normalized inputs and generation settings"""
+        def normalize(value: str) -> str:
+            return ' '.join(str(value).lower().split())
+
+        return (
+            normalize(topic),
+            normalize(tone),
+            normalize(target_audience),
+            self.model,
+            config.gemini.temperature,
+            PROMPT_TEMPLATE_VERSION
+        )
+
     def _build_script_prompt(self, topic: str, tone: str, target_audience: str) -> str:
         """Build the prompt for comic script generation"""
 
@@ -6,7 +6,7 @@ import os
 import time
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional
 
 from google import genai
 from google.genai.types import GenerateVideosConfig, Image
@@ -15,6 +15,17 @@ from ..core.config import config
 logger = logging.getLogger(__name__)
 
 
+class VideoTimeoutError(TimeoutError):
+    """Veo operations still running when config.video.max_wait_seconds ran out"""
+
+    def __init__(self, panel_numbers, max_wait_seconds: float):
+        self.panel_numbers = list(panel_numbers)
+        super().__init__(
+            f"Veo operations for panels {', '.join(map(str, self.panel_numbers))} "
+            f"did not finish within {max_wait_seconds:.0f}s"
+        )
+
+
 class VideoGenerationService:
     """Service for generating videos using Google Veo 3"""
 
@@ -32,7 +43,8 @@ class VideoGenerationService:
 
         logger.info(f"Using GCS bucket: {self.gcs_bucket}")
 
-    async def generate_video_from_script(self, comic_script: Dict[str, Any], comic_title: str, comic_id: str) -> Optional[str]:
+    async def generate_video_from_script(self, comic_script: Dict[str, Any], comic_title: str, comic_id: str,
+                                         on_panel_done: Optional[Callable[[int, int], None]] = None) -> Optional[str]:
         """
         Generate a video from comic script using Veo 3 - creates 8-second video per panel and joins them
 
@@ -40,9 +52,13 @@ class VideoGenerationService:
             comic_script: The comic script data
             comic_title: Title of the comic
             comic_id: The comic ID for directory organization
+            on_panel_done: Called with (panel number, panel count) as each panel's video is ready
 
         Returns:
             URL of the final joined video or None if generation failed
+
+        Raises:
+            VideoTimeoutError: Some panel operations did not finish within config.video.max_wait_seconds
         """
         try:
             start_time = time.time()
@@ -59,28 +75,50 @@ class VideoGenerationService:
             # Extract consistent character descriptions from all panels
             character_descriptions = self._extract_character_descriptions(comic_script, panels)
 
-            # Generate video for each panel with consistent character descriptions
-            panel_video_uris = []
-            panel_video_files = []
-
-            for i, panel in enumerate(panels):
-                panel_prompt = self._create_consistent_panel_video_prompt(
-                    panel, i + 1, comic_title, character_descriptions
-                )
-                logger.info(f"Generating video for panel {i + 1}/{len(panels)}")
-
-                panel_video_uri = self._generate_single_panel_video(panel_prompt, i + 1, comic_id)
-                if panel_video_uri:
-                    panel_video_uris.append(panel_video_uri)
-
+            # Submit every panel's Veo operation up front so they render in parallel
+            prompts = [
+                self._create_consistent_panel_video_prompt(panel, i + 1, comic_title, character_descriptions)
+                for i, panel in enumerate(panels)
+            ]
+            submitted = await asyncio.gather(*(
+                self._submit_panel_video(prompt, i + 1, comic_id) for i, prompt in enumerate(prompts)
+            ))
+            operations = {i + 1: op for i, op in enumerate(submitted) if op is not None}
+            for panel_number in range(1, len(panels) + 1):
+                if panel_number not in operations:
+                    logger.warning(f"Failed to generate video for panel {panel_number}")
+
+            # Start each panel's download as soon as its operation finishes
+            panel_uris_by_number = {}
+            download_tasks = {}
+            try:
+                async for panel_number, operation in self._poll_operations(operations):
+                    panel_video_uri = self._extract_video_uri(operation, panel_number)
+                    if not panel_video_uri:
+                        logger.warning(f"Failed to generate video for panel {panel_number}")
+                        continue
+
+                    panel_uris_by_number[panel_number] = panel_video_uri
+                    if on_panel_done:
+                        on_panel_done(panel_number, len(panels))
                     # Download the video file directly to comic directory (parallel to script.json)
-                    video_file_path = self._download_video_to_comic_dir(panel_video_uri, i + 1, comic_id)
-                    if video_file_path:
-                        panel_video_files.append(video_file_path)
-                    else:
-                        logger.warning(f"Failed to download video file for panel {i + 1}")
+                    download_tasks[panel_number] = asyncio.create_task(asyncio.to_thread(
+                        self._download_video_to_comic_dir, panel_video_uri, panel_number, comic_id
+                    ))
+            finally:
+                # Threads cannot be interrupted: if polling times out, let started downloads
+                # finish before the job is failed, so no panel video is written afterwards
+                await asyncio.gather(*download_tasks.values(), return_exceptions=True)
+
+            # Keep panel order for metadata and for joining
+            panel_video_uris = [panel_uris_by_number[n] for n in sorted(panel_uris_by_number)]
+            panel_video_files = []
+            for panel_number in sorted(download_tasks):
+                video_file_path = await download_tasks[panel_number]
+                if video_file_path:
+                    panel_video_files.append(video_file_path)
                 else:
-                    logger.warning(f"Failed to generate video for panel {i + 1}")
+                    logger.warning(f"Failed to download video file for panel {panel_number}")
 
             if not panel_video_uris:
                 logger.error("No panel videos were generated successfully")
@@ -88,7 +126,7 @@ class VideoGenerationService:
 
             # Join all downloaded panel videos together
             logger.info(f"Joining {len(panel_video_files)} panel videos")
-            final_video_path = self._join_downloaded_videos(panel_video_files, comic_id)
+            final_video_path = await asyncio.to_thread(self._join_downloaded_videos, panel_video_files, comic_id)
 
             if final_video_path:
                 processing_time = time.time() - start_time
@@ -104,6 +142,10 @@ class VideoGenerationService:
                 logger.error("Failed to join panel videos")
                 return None
 
+        except VideoTimeoutError as e:
+            # The job fails with the timeout as its error instead of a generic "no result"
+            logger.error(f"Error generating panel-based video: {str(e)}")
+            raise
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -149,9 +191,9 @@ class VideoGenerationService:
         logger.info(f"Created character descriptions for: {list(character_descriptions.keys())}")
         return character_descriptions
 
-    def _generate_single_panel_video(self, prompt: str, panel_number: int, comic_id: str) -> Optional[str]:
+    async def _submit_panel_video(self, prompt: str, panel_number: int, comic_id: str):
         """
-        Generate a single 8-second video for one panel
+        Submit the Veo operation for one panel without waiting for it to finish
 
         Args:
             prompt: The video generation prompt for this panel
@@ -159,16 +201,22 @@ class VideoGenerationService:
             comic_id: Comic ID for locating the panel image
 
         Returns:
-            URL of the generated panel video or None if failed
+            The pending operation or None if submission failed
         """
         try:
-            logger.info(f"Generating 8-second video for panel {panel_number}")
+            logger.info(f"Submitting 8-second video for panel {panel_number}")
             logger.info(f"Prompt for panel {panel_number}: {prompt}")
 
-            # Generate video operation
-            operation = self.client.models.generate_videos(
+            # Image.from_file reads the PNG from disk
+            image = await asyncio.to_thread(
+                Image.from_file,
+                location=f"output/comics/{comic_id}/panel_{panel_number}_image.png",
+                mime_type="image/png",
+            )
+            # Generate video operation via the async client so the event loop is not blocked
+            return await self.client.aio.models.generate_videos(
                 model=self.model_name,
-                image=Image.from_file(location=f"output/comics/{comic_id}/panel_{panel_number}_image.png", mime_type="image/png"),
+                image=image,
                 prompt=prompt,
                 config=GenerateVideosConfig(
                     aspect_ratio=config.video.aspect_ratio,
@@ -176,35 +224,97 @@ class VideoGenerationService:
                 )
             )
 
-            # Wait for this panel's video to complete using recommended pattern
-            logger.info(f"Waiting for panel {panel_number} video generation to complete...")
-
-            while not operation.done:
-                time.sleep(15)
-                operation = self.client.operations.get(operation)
-                print(operation)
-
-            # Operation is complete, check response and get the result
-            if operation.response:
-                try:
-                    video_uri = operation.result.generated_videos[0].video.uri
-                    logger.info(f"Panel {panel_number} video completed with URI: {video_uri}")
-                    return video_uri
-                except Exception as e:
-                    logger.error(f"Error getting video URI for panel {panel_number}: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    return None
-            else:
-                logger.error(f"Panel {panel_number} operation completed but no response")
-                return None
-
         except Exception as e:
             logger.error(f"Error generating video for panel {panel_number}: {str(e)}")
             import traceback
             traceback.print_exc()
             return None
 
+    async def _poll_operations(self, operations: Dict[int, Any]):
+        """
+        Poll all outstanding Veo operations from a single loop with adaptive backoff
+
+        The interval starts at config.video.poll_initial_interval, grows by
+        config.video.poll_backoff while nothing finishes, and resets whenever an
+        operation completes. Operations get config.video.max_wait_seconds in total.
+
+        Args:
+            operations: Mapping of panel number to pending operation
+
+        Yields:
+            (panel_number, operation) tuples as each operation completes
+
+        Raises:
+            VideoTimeoutError: Operations were still pending at the deadline
+        """
+        pending = dict(operations)
+        interval = config.video.poll_initial_interval
+        max_wait_seconds = config.video.max_wait_seconds
+        deadline = time.monotonic() + max_wait_seconds if max_wait_seconds > 0 else None
+
+        logger.info(f"Waiting for {len(pending)} panel video operations to complete...")
+
+        while pending:
+            finished = [n for n, op in pending.items() if op.done]
+            for panel_number in finished:
+                yield panel_number, pending.pop(panel_number)
+
+            if not pending:
+                break
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # Never finishing would hold a video worker forever
+                    raise VideoTimeoutError(sorted(pending), max_wait_seconds)
+                # Wake at the deadline for one last poll
+                interval = min(interval, remaining)
+
+            await asyncio.sleep(interval)
+
+            panel_numbers = list(pending)
+            refreshed = await asyncio.gather(
+                *(self.client.aio.operations.get(pending[n]) for n in panel_numbers),
+                return_exceptions=True
+            )
+            for panel_number, operation in zip(panel_numbers, refreshed):
+                if isinstance(operation, Exception):
+                    # Keep the previous handle and retry on the next tick
+                    logger.warning(f"Error polling panel {panel_number} operation: {operation}")
+                    continue
+                logger.debug(f"Panel {panel_number} operation status: {operation}")
+                pending[panel_number] = operation
+
+            if any(op.done for op in pending.values()):
+                interval = config.video.poll_initial_interval
+            else:
+                interval = min(interval * config.video.poll_backoff, config.video.poll_max_interval)
+
+    def _extract_video_uri(self, operation, panel_number: int) -> Optional[str]:
+        """
+        Get the generated video URI from a completed Veo operation
+
+        Args:
+            operation: The completed operation
+            panel_number: Panel number for logging
+
+        Returns:
+            URI of the panel video or None if the operation failed
+        """
+        if operation.response:
+            try:
+                video_uri = operation.result.generated_videos[0].video.uri
+                logger.info(f"Panel {panel_number} video completed with URI: {video_uri}")
+                return video_uri
+            except Exception as e:
+                logger.error(f"Error getting video URI for panel {panel_number}: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                return None
+        else:
+            logger.error(f"Panel {panel_number} operation completed but no response")
+            return None
+
     def _download_video_to_comic_dir(self, video_uri: str, panel_number: int, comic_id: str) -> Optional[str]:
         """
         Download video file from GCS URI and save directly to comic directory (parallel to script.json)
@@ -302,11 +412,14 @@ class VideoGenerationService:
                 for video_file in video_files:
                     f.write(f"file '{video_file}'\n")
 
-            # Join videos using ffmpeg and save final video in comic directory
+            # Join videos using ffmpeg and save final video in comic directory.
+            # +faststart moves the moov atom to the front so playback and seeking
+            # can begin before the whole file has downloaded.
             output_file = comic_dir / "final_video.mp4"
             ffmpeg_cmd = [
                 "ffmpeg", "-f", "concat", "-safe", "0", 
-                "-i", str(concat_file), "-c", "copy", str(output_file), "-y"
+                "-i", str(concat_file), "-c", "copy", "-movflags", "+faststart",
+                str(output_file), "-y"
             ]
 
             logger.info(f"Running ffmpeg to join downloaded videos to {output_file}")
@@ -363,7 +476,7 @@ class VideoGenerationService:
             output_file = f"/tmp/final_comic_video_{comic_title.replace(' ', '_')}.mp4"
             ffmpeg_cmd = [
                 "ffmpeg", "-f", "concat", "-safe", "0", 
-                "-i", concat_file, "-c", "copy", output_file, "-y"
+                "-i", concat_file, "-c", "copy", "-movflags", "+faststart", output_file, "-y"
             ]
 
             logger.info("Running ffmpeg to join videos")
@@ -0,0 +1,101 @@
+"""
+Microbenchmark for the local fallback panel renderer
+
+Compares the original renderer (gradient drawn one line at a time, fonts loaded
+per panel) with ArtworkGeneratorService's template-cached renderer, with and
+without the PNG encode.
+
+Usage (from backend/): python -m benchmarks.fallback_panel [panels]
+"""
+
+import io
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.core import image_codec
+from app.services.artwork_generator import ArtworkGeneratorService
+
+PANEL = {
+    "panel_number": 1,
+    "scene_description": "A curious robot explains photosynthesis to a group of sunflowers in a garden",
+    "characters": ["Robot", "Sunflower"],
+    "dialogue": [{"character": "Robot", "text": "Light goes in, sugar comes out!"}],
+    "visual_focus": "The robot pointing at the sun"
+}
+
+
+def legacy_render(panel):
+    """The renderer before the background template and font cache"""
+    img = Image.new('RGB', (1024, 1024), '#f0f8ff')
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0, 0, 1024, 1024], outline='#2c3e50', width=12)
+
+    x1, y1, x2, y2 = 30, 30, 994, 994
+    colors = ['#e3f2fd', '#bbdefb', '#90caf9', '#64b5f6']
+    height = y2 - y1
+    for i in range(height):
+        color_idx = min(int(i / height * len(colors)), len(colors) - 1)
+        draw.line([(x1, y1 + i), (x2, y1 + i)], fill=colors[color_idx])
+
+    try:
+        title_font = ImageFont.truetype("arial.ttf", 32)
+        text_font = ImageFont.truetype("arial.ttf", 20)
+    except OSError:
+        title_font = ImageFont.load_default()
+        text_font = ImageFont.load_default()
+
+    draw.text((x1 + 20, y1 + 20), f"Panel {panel['panel_number']}", fill='#1a237e', font=title_font)
+    words = panel['scene_description'][:80].split()
+    lines, current_line = [], []
+    for word in words:
+        if len(' '.join(current_line + [word])) < 40:
+            current_line.append(word)
+        else:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+    lines.append(' '.join(current_line))
+    y_offset = y1 + 80
+    for line in lines[:5]:
+        draw.text((x1 + 20, y_offset), line, fill='#37474f', font=text_font)
+        y_offset += 25
+    bubble_y = y_offset + 40
+    draw.ellipse([x1 + 50, bubble_y, x2 - 50, bubble_y + 120], fill='white', outline='#455a64', width=3)
+    draw.text((x1 + 70, bubble_y + 20), "Robot:", fill='#1565c0', font=text_font)
+    draw.text((x1 + 70, bubble_y + 45), panel['dialogue'][0]['text'], fill='#424242', font=text_font)
+    draw.text((x1 + 20, y2 - 40), f"Focus: {panel['visual_focus'][:50]}...", fill='#78909c', font=text_font)
+    return img
+
+
+def encode(img):
+    output = io.BytesIO()
+    img.save(output, format='PNG')
+    return output.getvalue()
+
+
+def measure(label, render, panels):
+    render()  # warm-up (builds the template and loads fonts once)
+    start = time.perf_counter()
+    for _ in range(panels):
+        render()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed / panels * 1000:8.2f} ms/panel {panels / elapsed:8.1f} panels/s")
+    return elapsed
+
+
+def main():
+    panels = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    # The renderer only needs the instance, not an Imagen client
+    service = ArtworkGeneratorService.__new__(ArtworkGeneratorService)
+
+    legacy = measure("legacy render", lambda: legacy_render(PANEL), panels)
+    cached = measure("template render", lambda: service._render_visual_comic_panel(PANEL), panels)
+    legacy_png = measure("legacy render + PNG", lambda: encode(legacy_render(PANEL)), panels)
+    cached_png = measure("template render + PNG", lambda: image_codec.encode(service._render_visual_comic_panel(PANEL)), panels)
+
+    print(f"render speedup: {legacy / cached:.1f}x, with PNG encode: {legacy_png / cached_png:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
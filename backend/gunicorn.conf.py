@@ -0,0 +1,31 @@
+"""
+Production server settings: several uvicorn worker processes under gunicorn
+
+    WEB_CONCURRENCY=4 gunicorn -c gunicorn.conf.py main:app
+
+Workers share batch jobs, video jobs, progress events and comic metadata through
+the SQLite stores in output/ (see ServerConfig in app/core/config.py), so all of
+them must run on the same host and see the same output/ directory.
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# WEB_CONCURRENCY is also read by the app: with more than one worker it switches
+# progress events to the shared SQLite log
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Each worker imports main.py itself; preloading would share SQLite connections across fork()
+preload_app = False
+
+# Progress streams (SSE) stay open for minutes; only the keep-alive comments flow while idle
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -1,20 +1,26 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Request
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import asyncio
 import os
-import json
-import time
 from pathlib import Path
 import logging
 from datetime import datetime
 import uvicorn
 
 # Import our comic generation logic
-from app.comic_generator import ComicGenerationEngine
+from app.comic_generator import ComicBusyError, ComicGenerationEngine
+from app.core import image_codec, json_codec
+from app.core.compression import compress, ensure_precompressed, negotiate_encoding
+from app.core.config import config
+from app.core.events import format_sse
+from app.core.http_cache import make_etag, cache_headers, is_not_modified
+from app.core.byte_ranges import (
+    RangeNotSatisfiable, parse_range_header, iter_file_range, multipart_byteranges
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,6 +46,8 @@ class ComicRequest(BaseModel):
     tone: str = "humorous"
     target_audience: str = "general"
     visual_style: str = "modern digital comic"
+    use_cache: bool = True
+    progress_id: Optional[str] = None  # Client-chosen key; progress is published on channel request:<progress_id>
 
 class BatchComicRequest(BaseModel):
     topics: List[str]
@@ -55,8 +63,128 @@ class ComicResponse(BaseModel):
     files: Dict[str, str]
     generation_params: Dict[str, Any]
 
-# In-memory storage for generation status
-generation_tasks: Dict[str, Dict] = {}
+@app.on_event("startup")
+async def start_background_workers():
+    """Start video workers and take over batch/video jobs orphaned by a restart or another worker"""
+    comic_engine.start_background_workers()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    """Release this worker's jobs so the remaining workers resume them"""
+    await comic_engine.stop_background_workers()
+
+def conditional_headers(request: Request, content_hash: str, path: Path,
+                        variant: str = "", version: Optional[str] = None,
+                        vary: Optional[str] = None):
+    """
+    Build validator headers for an asset and check the request's conditional headers
+
+    Only the file's stat() is used, so a 304 never opens the file.
+
+    Returns:
+        (headers, not_modified_response) - the response is None unless the client copy is current
+    """
+    last_modified = path.stat().st_mtime
+    etag = make_etag(content_hash, variant)
+    headers = cache_headers(etag, last_modified, version, content_hash)
+    if vary:
+        # Also sent on 304s, so caches keep variants apart
+        headers["Vary"] = vary
+
+    if is_not_modified(request.headers.get("if-none-match"),
+                       request.headers.get("if-modified-since"),
+                       etag, last_modified):
+        return headers, Response(status_code=304, headers=headers)
+    return headers, None
+
+def json_response(request: Request, payload: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Serialize with orjson and gzip/brotli-compress large bodies the client accepts
+    """
+    body = json_codec.dumps(payload)
+    headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+
+    if len(body) >= config.compression.min_size:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding:
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def ranged_file_response(request: Request, path: Path, media_type: str,
+                         headers: Dict[str, str], filename: Optional[str] = None) -> Response:
+    """
+    Serve a file honoring Range requests with 206 (single range) or multipart/byteranges
+
+    If-Range is respected: when it does not match the current ETag or Last-Modified,
+    the full file is sent instead.
+    """
+    size = path.stat().st_size
+    headers = {**headers, "Accept-Ranges": "bytes"}
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and if_range and if_range.strip() not in (headers.get("ETag"), headers.get("Last-Modified")):
+        range_header = None
+
+    try:
+        ranges = parse_range_header(range_header, size)
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    if not ranges:
+        response = FileResponse(path, media_type=media_type, filename=filename, headers=headers)
+        if not request.headers.get("range"):
+            return response
+        # Newer Starlette versions apply the Range header in FileResponse themselves (and reject
+        # malformed ones with a 400), so a range ignored here is answered by streaming the whole file
+        return StreamingResponse(
+            iter_file_range(path, 0, size - 1),
+            media_type=media_type,
+            headers={**response.headers, "Content-Length": str(size)}
+        )
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        return StreamingResponse(
+            iter_file_range(path, start, end),
+            status_code=206,
+            media_type=media_type,
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1)
+            }
+        )
+
+    content_type, content_length, body = multipart_byteranges(path, ranges, size, media_type)
+    return StreamingResponse(
+        body,
+        status_code=206,
+        media_type=content_type,
+        headers={**headers, "Content-Length": str(content_length)}
+    )
+
+def parse_generated_at(name: str, value: Optional[str]) -> Optional[str]:
+    """
+    Normalize a generated_at filter bound to how comics store it (naive local ISO 8601)
+
+    The store compares generated_at as text, so a bound in any other form (a UTC
+    offset, a 'Z' suffix, a space instead of 'T') would filter wrongly rather than fail.
+
+    Raises:
+        HTTPException: 400 if value is not an ISO 8601 date or datetime
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} must be an ISO 8601 date or datetime")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
 
 @app.get("/api/health")
 async def health_check():
@@ -72,7 +200,9 @@ async def generate_comic(request: ComicRequest, background_tasks: BackgroundTask
             topic=request.topic,
             tone=request.tone,
             target_audience=request.target_audience,
-            visual_style=request.visual_style
+            visual_style=request.visual_style,
+            use_cache=request.use_cache,
+            event_channels=[f"request:{request.progress_id}"] if request.progress_id else None
         )
 
         # Convert ComicMetadata to dict for response
@@ -86,74 +216,126 @@ async def generate_comic(request: ComicRequest, background_tasks: BackgroundTask
         raise HTTPException(status_code=500, detail=f"Failed to generate comic: {str(e)}")
 
 @app.post("/api/comics/generate/batch")
-async def generate_batch_comics(request: BatchComicRequest, background_tasks: BackgroundTasks):
-    """Generate multiple comics (async)"""
-    task_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-    generation_tasks[task_id] = {
-        "status": "started",
-        "total": len(request.topics),
-        "completed": 0,
-        "comics": [],
-        "started_at": datetime.now().isoformat(),
-        "errors": []
-    }
-
-    async def generate_batch():
-        try:
-            comics_metadata = await comic_engine.generate_batch_comics(
-                topics=request.topics,
-                tone=request.tone,
-                visual_style=request.visual_style
-            )
-
-            # Convert ComicMetadata objects to dicts
-            comics_dicts = [comic.to_dict() for comic in comics_metadata]
-
-            generation_tasks[task_id]["status"] = "completed"
-            generation_tasks[task_id]["completed"] = len(comics_dicts)
-            generation_tasks[task_id]["comics"] = comics_dicts
-            generation_tasks[task_id]["completed_at"] = datetime.now().isoformat()
-
-        except Exception as e:
-            logger.error(f"Batch generation failed: {str(e)}")
-            generation_tasks[task_id]["status"] = "failed"
-            generation_tasks[task_id]["error"] = str(e)
-
-    background_tasks.add_task(generate_batch)
+async def generate_batch_comics(request: BatchComicRequest):
+    """Generate multiple comics (async); progress is persisted and resumed after a restart"""
+    task_id = comic_engine.create_batch_job(request.topics, request.tone, request.visual_style)
+    comic_engine.start_batch_job(task_id)
 
     return {"task_id": task_id, "status": "started", "message": "Batch generation started"}
 
 @app.get("/api/comics/batch/{task_id}")
 async def get_batch_status(task_id: str):
-    """Get status of batch generation"""
-    if task_id not in generation_tasks:
+    """Get status of batch generation, including each topic's progress"""
+    status = comic_engine.get_batch_job(task_id)
+    if status is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return generation_tasks[task_id]
+    return status
+
+@app.get("/api/events")
+async def stream_events(request: Request, channel: str, last_event_id: Optional[str] = None):
+    """
+    Stream progress events as Server-Sent Events
+
+    Channels: comic:<comic_id> (generation stages and video), batch:<task_id> and
+    request:<progress_id>. Reconnects resume after the Last-Event-ID header (or
+    ?last_event_id=). A fresh batch or comic subscription starts with the current status.
+    """
+    kind, _, key = channel.partition(":")
+    if kind not in ("comic", "batch", "request") or not key:
+        raise HTTPException(status_code=400, detail="Unknown event channel")
+
+    events = comic_engine.events
+    resume_from = request.headers.get("last-event-id") or last_event_id
+    snapshot = None
+    if resume_from is None:
+        resume_from = await events.last_id()
+        if kind == "batch":
+            status = comic_engine.get_batch_job(key)
+            if status is None:
+                raise HTTPException(status_code=404, detail="Task not found")
+            snapshot = {"id": resume_from, "event": "batch_status", "data": status}
+        elif kind == "comic":
+            comic = await comic_engine.get_comic(key)
+            if comic is None:
+                raise HTTPException(status_code=404, detail="Comic not found")
+            snapshot = {"id": resume_from, "event": "video_status", "data": comic_engine.get_video_job(comic)}
+        else:
+            # Progress keys are chosen by the client before it starts the request; replay everything
+            resume_from = None
+
+    async def stream():
+        if snapshot:
+            yield format_sse(snapshot)
+        async for event in events.subscribe(channel, resume_from, config.events.heartbeat_seconds):
+            if await request.is_disconnected():
+                break
+            yield format_sse(event)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/api/pipeline/stats")
+async def get_pipeline_stats():
+    """Get per-stage queue depth and utilization of the batch pipeline"""
+    return {"stages": comic_engine.get_pipeline_stats()}
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Get hit/miss counters for the upstream result caches"""
+    return comic_engine.get_cache_stats()
 
 @app.get("/api/comics")
-async def list_comics():
-    """List all generated comics"""
+async def list_comics(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    tone: Optional[str] = None,
+    visual_style: Optional[str] = None,
+    video_status: Optional[str] = None,
+    generated_from: Optional[str] = None,
+    generated_to: Optional[str] = None
+):
+    """List generated comics, newest first, one page at a time"""
+    generated_from = parse_generated_at("generated_from", generated_from)
+    generated_to = parse_generated_at("generated_to", generated_to)
     try:
-        comics_metadata = comic_engine.list_generated_comics()
-        comics_dicts = [comic.to_dict() for comic in comics_metadata]
-        return {"comics": comics_dicts}
+        # Filtered SQLite queries; keep them off the event loop
+        page = await asyncio.to_thread(
+            comic_engine.list_comics_page,
+            limit,
+            cursor=cursor,
+            tone=tone,
+            visual_style=visual_style,
+            video_status=video_status,
+            generated_from=generated_from,
+            generated_to=generated_to
+        )
+        return json_response(request, {
+            "comics": [comic.to_dict() for comic in page["comics"]],
+            "total": page["total"],
+            "next_cursor": page["next_cursor"],
+            "limit": limit
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list comics: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to list comics")
 
 @app.get("/api/comics/{comic_id}")
-async def get_comic(comic_id: str):
+async def get_comic(comic_id: str, request: Request):
     """Get specific comic details"""
     try:
-        comics_metadata = comic_engine.list_generated_comics()
-        comic = next((c for c in comics_metadata if c.comic_id == comic_id), None)
+        comic = await comic_engine.get_comic(comic_id)
 
         if not comic:
             raise HTTPException(status_code=404, detail="Comic not found")
 
-        return comic.to_dict()
+        return json_response(request, comic.to_dict())
     except HTTPException:
         raise
     except Exception as e:
@@ -161,11 +343,13 @@ async def get_comic(comic_id: str):
         raise HTTPException(status_code=500, detail="Failed to get comic")
 
 @app.get("/api/comics/{comic_id}/image")
-async def get_comic_image(comic_id: str):
-    """Serve comic image"""
+async def get_comic_image(comic_id: str, request: Request,
+                          size: Optional[str] = None,
+                          w: Optional[int] = Query(None, ge=1),
+                          v: Optional[str] = None):
+    """Serve comic image, optionally as a resized WebP/AVIF/JPEG derivative (?size= or ?w=)"""
     try:
-        comics_metadata = comic_engine.list_generated_comics()
-        comic = next((c for c in comics_metadata if c.comic_id == comic_id), None)
+        comic = await comic_engine.get_comic(comic_id)
 
         if not comic:
             raise HTTPException(status_code=404, detail="Comic not found")
@@ -174,10 +358,37 @@ async def get_comic_image(comic_id: str):
         if not image_path.exists():
             raise HTTPException(status_code=404, detail="Image file not found")
 
+        derivatives = comic_engine.derivative_service
+        try:
+            size_name = derivatives.resolve_size(size, w)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Without ?size/?w the original is served, so downloads keep their format
+        media_type = None
+        if size or w:
+            media_type = derivatives.negotiate_format(request.headers.get("accept"), size_name)
+
+        # Derivatives are validated against the source image, qualified by size and format
+        image_hash = await comic_engine.ensure_file_hash(comic, "image", image_path)
+        variant = f"{size_name}-{media_type.split('/')[1]}" if media_type else ""
+        headers, not_modified = conditional_headers(request, image_hash, image_path, variant, v, vary="Accept")
+        if not_modified:
+            return not_modified
+
+        if media_type is None:
+            return FileResponse(
+                image_path, 
+                media_type=image_codec.media_type_for(image_path.name),
+                filename=f"{comic_id}{image_path.suffix}",
+                headers=headers
+            )
+
+        derived_path = await asyncio.to_thread(derivatives.get_derivative, image_path, size_name, media_type)
         return FileResponse(
-            image_path, 
-            media_type="image/png",
-            filename=f"{comic_id}.png"
+            derived_path,
+            media_type=media_type,
+            headers=headers
         )
 
     except HTTPException:
@@ -187,11 +398,10 @@ async def get_comic_image(comic_id: str):
         raise HTTPException(status_code=500, detail="Failed to serve image")
 
 @app.get("/api/comics/{comic_id}/video")
-async def get_comic_video(comic_id: str):
+async def get_comic_video(comic_id: str, request: Request, v: Optional[str] = None):
     """Serve comic video"""
     try:
-        comics_metadata = comic_engine.list_generated_comics()
-        comic = next((c for c in comics_metadata if c.comic_id == comic_id), None)
+        comic = await comic_engine.get_comic(comic_id)
 
         if not comic:
             raise HTTPException(status_code=404, detail="Comic not found")
@@ -210,16 +420,19 @@ async def get_comic_video(comic_id: str):
                 logger.error(f"Video file not found for comic {comic_id}: {video_path}")
                 raise HTTPException(status_code=404, detail="Video file not found")
 
+        video_hash = await comic_engine.ensure_file_hash(comic, "video", video_path)
+        headers, not_modified = conditional_headers(request, video_hash, video_path, version=v)
+        if not_modified:
+            return not_modified
+
         logger.info(f"Serving video file: {video_path}")
 
-        return FileResponse(
-            video_path, 
+        return ranged_file_response(
+            request,
+            video_path,
             media_type="video/mp4",
-            filename=f"{comic_id}_video.mp4",
-            headers={
-                "Accept-Ranges": "bytes",
-                "Content-Type": "video/mp4"
-            }
+            headers=headers,
+            filename=f"{comic_id}_video.mp4"
         )
 
     except HTTPException:
@@ -228,12 +441,91 @@ async def get_comic_video(comic_id: str):
         logger.error(f"Failed to serve comic video {comic_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to serve video")
 
+@app.get("/api/comics/{comic_id}/panels")
+async def get_comic_panels(comic_id: str, request: Request):
+    """List each panel's image and video with byte size, dimensions and content hash"""
+    try:
+        comic = await comic_engine.get_comic(comic_id)
+
+        if not comic:
+            raise HTTPException(status_code=404, detail="Comic not found")
+
+        return json_response(request, {"comic_id": comic_id, "panels": await comic_engine.get_panel_manifest(comic)})
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to list panels for comic {comic_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to list panels")
+
+@app.get("/api/comics/{comic_id}/panels/{panel_number}/image")
+async def get_panel_image(comic_id: str, panel_number: int, request: Request, v: Optional[str] = None):
+    """Serve one panel's image"""
+    return await serve_panel_asset(comic_id, panel_number, "image", request, v)
+
+@app.get("/api/comics/{comic_id}/panels/{panel_number}/video")
+async def get_panel_video(comic_id: str, panel_number: int, request: Request, v: Optional[str] = None):
+    """Serve one panel's video"""
+    return await serve_panel_asset(comic_id, panel_number, "video", request, v)
+
+async def serve_panel_asset(comic_id: str, panel_number: int, kind: str,
+                            request: Request, v: Optional[str]) -> Response:
+    """Serve a panel image or video with the same validators and range handling as the main assets"""
+    try:
+        comic = await comic_engine.get_comic(comic_id)
+
+        if not comic:
+            raise HTTPException(status_code=404, detail="Comic not found")
+
+        path = comic_engine.get_panel_asset_path(comic, panel_number, kind)
+        if path is None:
+            raise HTTPException(status_code=404, detail=f"Panel {kind} not found")
+
+        content_hash = await comic_engine.ensure_file_hash(comic, f"panel_{panel_number}_{kind}", path)
+        headers, not_modified = conditional_headers(request, content_hash, path, version=v)
+        if not_modified:
+            return not_modified
+
+        extension = "png" if kind == "image" else "mp4"
+        return ranged_file_response(
+            request,
+            path,
+            media_type="image/png" if kind == "image" else "video/mp4",
+            headers=headers,
+            filename=f"{comic_id}_panel_{panel_number}.{extension}"
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to serve panel {panel_number} {kind} for comic {comic_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to serve panel {kind}")
+
+@app.post("/api/comics/{comic_id}/panels/{panel_number}/regenerate")
+async def regenerate_panel(comic_id: str, panel_number: int, request: Request):
+    """Render one panel again from the stored script and recompose the comic from the saved panels"""
+    try:
+        comic = await comic_engine.regenerate_panel(comic_id, panel_number)
+
+        if not comic:
+            raise HTTPException(status_code=404, detail="Comic not found")
+
+        return json_response(request, comic.to_dict())
+    except HTTPException:
+        raise
+    except ComicBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to regenerate panel {panel_number} of comic {comic_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to regenerate panel")
+
 @app.get("/api/comics/{comic_id}/script")
-async def get_comic_script(comic_id: str):
-    """Get comic script"""
+async def get_comic_script(comic_id: str, request: Request, v: Optional[str] = None):
+    """Get comic script, served from its pre-compressed copy when the client accepts gzip/brotli"""
     try:
-        comics_metadata = comic_engine.list_generated_comics()
-        comic = next((c for c in comics_metadata if c.comic_id == comic_id), None)
+        comic = await comic_engine.get_comic(comic_id)
 
         if not comic:
             raise HTTPException(status_code=404, detail="Comic not found")
@@ -242,10 +534,23 @@ async def get_comic_script(comic_id: str):
         if not script_path.exists():
             raise HTTPException(status_code=404, detail="Script file not found")
 
-        with open(script_path, 'r', encoding='utf-8') as f:
-            script = json.load(f)
+        # Each encoding is a distinct representation, so it gets its own ETag
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        script_hash = await comic_engine.ensure_file_hash(comic, "script", script_path)
+        headers, not_modified = conditional_headers(request, script_hash, script_path, encoding or "",
+                                                    v, vary="Accept-Encoding")
+        if not_modified:
+            return not_modified
 
-        return script
+        if encoding is None:
+            return FileResponse(script_path, media_type="application/json", headers=headers)
+
+        compressed_path = await asyncio.to_thread(ensure_precompressed, script_path, encoding)
+        return FileResponse(
+            compressed_path,
+            media_type="application/json",
+            headers={**headers, "Content-Encoding": encoding}
+        )
 
     except HTTPException:
         raise
@@ -253,103 +558,44 @@ async def get_comic_script(comic_id: str):
         logger.error(f"Failed to get comic script {comic_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get script")
 
-@app.post("/api/comics/{comic_id}/generate-video")
+@app.post("/api/comics/{comic_id}/generate-video", status_code=202)
 async def generate_comic_video(comic_id: str):
-    """Generate video from comic script using Veo 3 - synchronous operation"""
+    """Queue video generation from the comic script using Veo 3 and return the job immediately"""
     try:
-        # Import video service here to avoid circular imports
-        from app.services.video_service import VideoGenerationService
-
-        # Get comic metadata and script
-        comics_metadata = comic_engine.list_generated_comics()
-        comic = next((c for c in comics_metadata if c.comic_id == comic_id), None)
+        comic = await comic_engine.get_comic(comic_id)
 
         if not comic:
             raise HTTPException(status_code=404, detail="Comic not found")
 
-        # Check if video already exists
-        if comic.video_status == "completed" and comic.video_url:
-            return {
-                "message": "Video already exists", 
-                "status": "completed",
-                "video_url": comic.video_url,
-                "generated_at": comic.video_generated_at,
-                "processing_time_seconds": comic.video_processing_time_seconds
-            }
-
-        # Get comic script
-        script_path = Path(comic.files["script"])
-        if not script_path.exists():
+        if not Path(comic.files["script"]).exists():
             raise HTTPException(status_code=404, detail="Script file not found")
 
-        with open(script_path, 'r', encoding='utf-8') as f:
-            script = json.load(f)
+        job = await comic_engine.submit_video_job(comic)
+        if job["status"] == "completed":
+            return JSONResponse(content={**job, "message": "Video already exists"})
 
-        # Update status to generating
-        comic.video_status = "generating"
-        comic_engine.update_comic_metadata(comic)
-
-        try:
-            # Generate video synchronously
-            video_service = VideoGenerationService()
-            start_time = time.time()
-            logger.info(f"Starting synchronous video generation for comic {comic_id}")
-
-            video_result = await video_service.generate_video_from_script(script, comic.title, comic_id)
-
-            processing_time = time.time() - start_time
-
-            if video_result and isinstance(video_result, dict):
-                final_video_path = video_result.get('final_video_path')
-                panel_video_uris = video_result.get('panel_video_uris', [])
-
-                if final_video_path:
-                    # Video is already in the comic directory, no need to move
-                    # Update comic metadata with video information
-                    comic.video_url = final_video_path
-                    comic.video_status = "completed"
-                    comic.video_generated_at = datetime.now().isoformat()
-                    comic.video_processing_time_seconds = processing_time
-
-                    # Store panel video URIs in metadata (new field)
-                    comic.panel_video_uris = panel_video_uris
-
-                    # Update files dict to include video
-                    comic.files["video"] = final_video_path
-
-                    comic_engine.update_comic_metadata(comic)
-
-                    logger.info(f"Video generated successfully for comic {comic_id} in {processing_time:.2f}s")
-
-                    return {
-                        "message": "Video generated successfully", 
-                        "status": "completed",
-                        "video_url": final_video_path,
-                        "panel_video_uris": panel_video_uris,
-                        "generated_at": comic.video_generated_at,
-                        "processing_time_seconds": processing_time
-                    }
-                else:
-                    comic.video_status = "failed"
-                    comic_engine.update_comic_metadata(comic)
-                    raise HTTPException(status_code=500, detail="Video generation failed - no final video path")
-            else:
-                comic.video_status = "failed"
-                comic_engine.update_comic_metadata(comic)
-                raise HTTPException(status_code=500, detail="Video generation failed - no video result returned")
-
-        except Exception as e:
-            logger.error(f"Video generation failed for comic {comic_id}: {str(e)}")
-            comic.video_status = "failed"
-            comic_engine.update_comic_metadata(comic)
-            raise HTTPException(status_code=500, detail=f"Video generation failed: {str(e)}")
+        return JSONResponse(
+            status_code=202,
+            content={**job, "message": "Video generation started"},
+            headers={"Location": f"/api/comics/{comic_id}/video/status"}
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to generate video for {comic_id}: {str(e)}")
+        logger.error(f"Failed to queue video for {comic_id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to generate video")
 
+@app.get("/api/comics/{comic_id}/video/status")
+async def get_video_status(comic_id: str):
+    """Get the status of a comic's video job"""
+    comic = await comic_engine.get_comic(comic_id)
+
+    if not comic:
+        raise HTTPException(status_code=404, detail="Comic not found")
+
+    return comic_engine.get_video_job(comic)
+
 # Mount static files for frontend
 static_path = Path(__file__).parent / "static"
 if static_path.exists():
@@ -0,0 +1,42 @@
+"""
+Shared test setup: import the backend from any working directory without real credentials
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# app.core.config requires these at import time; no test talks to Google
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "test-project")
+# Upstream calls are fakes; the process-wide rate limits would only make later tests wait
+os.environ.setdefault("GEMINI_REQUESTS_PER_MINUTE", "0")
+os.environ.setdefault("IMAGEN_REQUESTS_PER_MINUTE", "0")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """ComicGenerationEngine whose output/ (comics, stores, caches) lives in tmp_path"""
+    # Every path in the engine is relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    from app.comic_generator import ComicGenerationEngine
+    from app.core.image_pool import image_pool
+
+    yield ComicGenerationEngine()
+    image_pool.shutdown()
+
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    """TestClient for the API, served by the engine fixture (no startup, so no background workers)"""
+    from fastapi.testclient import TestClient
+
+    import main
+
+    monkeypatch.setattr(main, "comic_engine", engine)
+    return TestClient(main.app)
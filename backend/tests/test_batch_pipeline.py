@@ -0,0 +1,35 @@
+"""
+Pipelined batches clean up after topics that fail, whatever the stage
+"""
+
+import pytest
+
+from app.core import job_store
+
+
+@pytest.mark.asyncio
+async def test_failed_script_stage_releases_the_comic_directory_and_reports_the_failure(engine, monkeypatch):
+    async def failing_script_stage(job):
+        raise RuntimeError("Gemini is down")
+
+    monkeypatch.setattr(engine, "_script_stage", failing_script_stage)
+    progress = []
+
+    comics = await engine.generate_batch_comics(
+        ["first topic", "second topic"],
+        pipelined=True,
+        on_progress=lambda i, status, comic, error: progress.append((i, status, error)),
+        event_channels=["batch:test"],
+    )
+
+    assert comics == []
+    # Reserved IDs are forgotten and their empty directories removed
+    assert engine._active_comic_ids == set()
+    assert list(engine.output_dir.iterdir()) == []
+
+    failed = [event["data"] for event in await engine.events.replay("batch:test") if event["event"] == "failed"]
+    assert sorted(data["topic"] for data in failed) == ["first topic", "second topic"]
+    assert all(data["error"] == "Gemini is down" for data in failed)
+    assert sorted((i, status) for i, status, _ in progress if status == job_store.TOPIC_FAILED) == [
+        (0, job_store.TOPIC_FAILED), (1, job_store.TOPIC_FAILED)
+    ]
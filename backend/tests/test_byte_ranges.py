@@ -0,0 +1,128 @@
+"""
+Range requests on comic videos: parsing, 206 bodies, multipart/byteranges, 416 and If-Range
+"""
+
+import pytest
+
+from app.core.byte_ranges import RangeNotSatisfiable, parse_range_header
+from app.models import ComicMetadata
+
+SIZE = 10_000
+CONTENT = bytes(i % 251 for i in range(SIZE))
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-99", [(0, 99)]),
+    ("bytes=9990-", [(9990, 9999)]),
+    ("bytes=-100", [(9900, 9999)]),
+    ("bytes=-20000", [(0, 9999)]),
+    ("bytes=9000-20000", [(9000, 9999)]),
+    # Overlapping and adjacent ranges are merged, in order
+    ("bytes=50-99, 0-49, 200-299, 250-260", [(0, 99), (200, 299)]),
+    # Unsatisfiable parts are dropped when others overlap the file
+    ("bytes=0-9, 20000-", [(0, 9)]),
+    # Malformed or unsupported: the full body is sent
+    (None, None),
+    ("items=0-9", None),
+    ("bytes=abc-def", None),
+    ("bytes=9-0", None),
+    ("bytes=0-9,,20-29", None),
+    (",".join(["bytes=0-0"] + [f"{i * 10}-{i * 10}" for i in range(1, 20)]), None),
+])
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, SIZE) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=10000-", "bytes=20000-30000", "bytes=-0"])
+def test_unsatisfiable_ranges_raise(header):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range_header(header, SIZE)
+
+
+@pytest.fixture
+def video(engine):
+    """A comic with a finished video of SIZE known bytes"""
+    comic_dir = engine.output_dir / "video_comic"
+    comic_dir.mkdir()
+    video_path = comic_dir / "final_video.mp4"
+    video_path.write_bytes(CONTENT)
+    engine.catalog.save(ComicMetadata(
+        comic_id="video_comic",
+        title="Video",
+        theme="",
+        generated_at="2026-01-01T10:00:00",
+        panel_count=1,
+        generation_params={},
+        files={"image": str(comic_dir / "comic.png"), "script": str(comic_dir / "script.json"),
+               "video": str(video_path)},
+        video_url=str(video_path),
+        video_status="completed",
+    ))
+    return "/api/comics/video_comic/video"
+
+
+@pytest.mark.parametrize("header, start, end", [
+    ("bytes=100-199", 100, 199),
+    ("bytes=-500", 9500, 9999),
+    ("bytes=9000-", 9000, 9999),
+])
+def test_single_range_is_a_206(client, video, header, start, end):
+    response = client.get(video, headers={"Range": header})
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes {start}-{end}/{SIZE}"
+    assert response.headers["content-length"] == str(end - start + 1)
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.content == CONTENT[start:end + 1]
+
+
+def test_several_ranges_are_multipart_byteranges(client, video):
+    response = client.get(video, headers={"Range": "bytes=0-9, 5000-5009, -10"})
+
+    assert response.status_code == 206
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=")[1].encode()
+    assert int(response.headers["content-length"]) == len(response.content)
+
+    body = response.content
+    assert body.endswith(b"\r\n--" + boundary + b"--\r\n")
+    parts = body[:-len(b"\r\n--" + boundary + b"--\r\n")].split(b"\r\n--" + boundary)
+    parts[0] = parts[0][len(b"--" + boundary):]
+    expected = [(0, 9), (5000, 5009), (9990, 9999)]
+    assert len(parts) == len(expected)
+    for part, (start, end) in zip(parts, expected):
+        head, _, data = part.partition(b"\r\n\r\n")
+        assert b"Content-Type: video/mp4" in head
+        assert f"Content-Range: bytes {start}-{end}/{SIZE}".encode() in head
+        assert data == CONTENT[start:end + 1]
+
+
+def test_unsatisfiable_range_is_a_416(client, video):
+    response = client.get(video, headers={"Range": "bytes=10000-"})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{SIZE}"
+
+
+def test_malformed_range_sends_the_full_body(client, video):
+    response = client.get(video, headers={"Range": "bytes=oops"})
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_if_range_only_honors_the_range_for_the_current_version(client, video):
+    full = client.get(video)
+    etag, last_modified = full.headers["etag"], full.headers["last-modified"]
+
+    for validator in (etag, last_modified):
+        response = client.get(video, headers={"Range": "bytes=0-9", "If-Range": validator})
+        assert response.status_code == 206
+        assert response.content == CONTENT[:10]
+
+    # The client's partial copy is of another version: send the whole file
+    for stale in ('"stale"', "W/" + etag, "Thu, 01 Jan 2015 00:00:00 GMT"):
+        response = client.get(video, headers={"Range": "bytes=0-9", "If-Range": stale})
+        assert response.status_code == 200
+        assert response.content == CONTENT
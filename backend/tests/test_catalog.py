@@ -0,0 +1,112 @@
+"""
+Comic lookups are served from memory; refresh() picks up saves by other workers and edits on disk
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.catalog import ComicCatalog
+from app.core.metadata_store import SQLiteMetadataStore
+from app.models import ComicMetadata
+
+
+def _metadata(comic_id: str, title: str = "Title") -> ComicMetadata:
+    return ComicMetadata(
+        comic_id=comic_id,
+        title=title,
+        theme="",
+        generated_at="2026-01-01T10:00:00",
+        panel_count=1,
+        generation_params={},
+        files={},
+    )
+
+
+def _catalog(tmp_path) -> ComicCatalog:
+    """A catalog as one worker process would open it; every call shares the same output dir and db"""
+    catalog = ComicCatalog(tmp_path / "comics", SQLiteMetadataStore(str(tmp_path / "comics.db")))
+    catalog.output_dir.mkdir(exist_ok=True)
+    catalog.build()
+    return catalog
+
+
+def _edit_on_disk(catalog: ComicCatalog, comic_id: str, **changes) -> None:
+    metadata_file = catalog.output_dir / comic_id / "metadata.json"
+    data = json.loads(metadata_file.read_text(encoding="utf-8"))
+    data.update(changes)
+    metadata_file.write_text(json.dumps(data), encoding="utf-8")
+    # Make sure the mtime moves even on coarse-grained filesystems
+    mtime = metadata_file.stat().st_mtime + 10
+    os.utime(metadata_file, (mtime, mtime))
+
+
+def test_a_cached_lookup_neither_stats_nor_queries(tmp_path, monkeypatch):
+    catalog = _catalog(tmp_path)
+    catalog.save(_metadata("first"))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit touched the disk")
+
+    monkeypatch.setattr(Path, "stat", fail)
+    monkeypatch.setattr(catalog.store, "get", fail)
+    monkeypatch.setattr(catalog.store, "source_of", fail)
+
+    assert catalog.get("first").title == "Title"
+    assert catalog.cached("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_engine_get_comic_only_loads_on_a_miss(engine, monkeypatch):
+    engine.catalog.save(_metadata("first"))
+    engine.catalog._cache.clear()
+    loads = []
+    load = engine.catalog.load
+    monkeypatch.setattr(engine.catalog, "load", lambda comic_id: loads.append(comic_id) or load(comic_id))
+
+    assert (await engine.get_comic("first")).comic_id == "first"
+    assert (await engine.get_comic("first")).comic_id == "first"
+    assert loads == ["first"]
+
+
+def test_refresh_picks_up_another_workers_save(tmp_path):
+    ours, theirs = _catalog(tmp_path), _catalog(tmp_path)
+    ours.save(_metadata("shared", title="Before"))
+    assert theirs.get("shared").title == "Before"
+
+    ours.save(_metadata("shared", title="After"))
+    # Two saves can land in the same mtime tick; move this one on and let ours record it
+    _edit_on_disk(ours, "shared")
+    ours.load("shared")
+    assert theirs.get("shared").title == "Before"
+
+    theirs.refresh()
+    assert theirs.get("shared").title == "After"
+
+
+def test_refresh_imports_out_of_band_edits(tmp_path):
+    catalog = _catalog(tmp_path)
+    catalog.save(_metadata("edited", title="Before"))
+    assert catalog.get("edited").title == "Before"
+
+    _edit_on_disk(catalog, "edited", title="After")
+    assert catalog.get("edited").title == "Before"
+
+    catalog.refresh()
+    assert catalog.get("edited").title == "After"
+    assert catalog.store.get("edited").title == "After"
+
+
+def test_refresh_forgets_deleted_comics(tmp_path):
+    catalog = _catalog(tmp_path)
+    catalog.save(_metadata("gone"))
+    assert catalog.get("gone") is not None
+
+    (catalog.output_dir / "gone" / "metadata.json").unlink()
+    catalog.refresh()
+
+    assert catalog.cached("gone") is None
+    assert catalog.get("gone") is None
+    assert catalog.count() == 0
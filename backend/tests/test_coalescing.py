@@ -0,0 +1,123 @@
+"""
+Identical concurrent generate requests share one generation; repeats within one batch do not
+"""
+
+import asyncio
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+# Long enough for every caller to arrive while the first generation runs
+SCRIPT_SECONDS = 0.3
+
+
+def _script(topic: str) -> dict:
+    return {
+        "title": topic,
+        "theme": "",
+        "panels": [
+            {"panel_number": i + 1, "scene_description": f"Scene {i + 1}", "dialogue": [], "characters": ["Hero"]}
+            for i in range(2)
+        ],
+    }
+
+
+def _png() -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (64, 64), "gray").save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def fake_engine(engine, monkeypatch):
+    """Engine with a slow fake Gemini that counts its calls, and an instant fake Imagen"""
+    engine.script_calls = 0
+
+    async def generate_content(**kwargs):
+        engine.script_calls += 1
+        await asyncio.sleep(SCRIPT_SECONDS)
+        return SimpleNamespace(text=json.dumps(_script("Shared")))
+
+    async def generate_images(**kwargs):
+        return SimpleNamespace(images=[SimpleNamespace(data=_png())])
+
+    monkeypatch.setattr(engine.script_service.client.aio.models, "generate_content", generate_content)
+    monkeypatch.setattr(engine.artwork_service.client.aio.models, "generate_images", generate_images)
+    engine.artwork_service.use_imagen = True
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_generation(fake_engine):
+    first = asyncio.create_task(fake_engine.generate_comic("cats", event_channels=["request:first"]))
+    await asyncio.sleep(0.05)
+    second = asyncio.create_task(fake_engine.generate_comic("  cats ", event_channels=["request:second"]))
+    different = asyncio.create_task(fake_engine.generate_comic("cats", tone="dramatic"))
+
+    comics = await asyncio.gather(first, second, different)
+
+    assert comics[0].comic_id == comics[1].comic_id != comics[2].comic_id
+    assert fake_engine.script_calls == 2
+    assert fake_engine._inflight == {}
+
+    # The caller that attached late still sees the whole progress, from the start
+    events = [[event["event"] for event in await fake_engine.events.replay(channel)]
+              for channel in ("request:first", "request:second")]
+    assert events[0] == events[1]
+    assert events[0][0] == "started" and events[0][-1] == "saved"
+
+
+@pytest.mark.asyncio
+async def test_no_coalescing_without_the_cache(fake_engine):
+    comics = await asyncio.gather(
+        fake_engine.generate_comic("cats", use_cache=False),
+        fake_engine.generate_comic("cats", use_cache=False),
+    )
+
+    assert comics[0].comic_id != comics[1].comic_id
+    assert fake_engine.script_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_repeated_batch_topics_get_a_comic_each(fake_engine):
+    outside = asyncio.create_task(fake_engine.generate_comic("cats"))
+    await asyncio.sleep(0.05)
+
+    comics = await fake_engine.generate_batch_comics(["cats", "dogs", "cats "], pipelined=False)
+    outside_comic = await outside
+
+    assert len({comic.comic_id for comic in comics}) == 3
+    # Only the first occurrence joins the identical request already running
+    assert comics[0].comic_id == outside_comic.comic_id
+    assert outside_comic.comic_id not in (comics[1].comic_id, comics[2].comic_id)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_generation(fake_engine):
+    leaving = asyncio.create_task(fake_engine.generate_comic("cats"))
+    await asyncio.sleep(0.05)
+    staying = asyncio.create_task(fake_engine.generate_comic("cats"))
+    await asyncio.sleep(0.05)
+
+    leaving.cancel()
+    comic = await staying
+
+    assert leaving.cancelled()
+    assert await fake_engine.get_comic(comic.comic_id) is not None
+    assert fake_engine.script_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_generation_finishes_even_if_its_only_caller_leaves(fake_engine):
+    leaving = asyncio.create_task(fake_engine.generate_comic("cats"))
+    await asyncio.sleep(0.05)
+    (task, job), = fake_engine._inflight.values()
+
+    leaving.cancel()
+    comic = await task
+
+    assert comic.comic_id == job.comic_id
+    assert await fake_engine.get_comic(comic.comic_id) is not None
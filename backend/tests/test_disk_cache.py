@@ -0,0 +1,113 @@
+"""
+DiskLRUCache keeps its byte count exact, evicts least recently used entries and drops damaged ones
+"""
+
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from app.core.config import config
+from app.core.disk_cache import DiskLRUCache
+
+
+def _png(color) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (64, 64), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_sizes_are_counted_across_puts_overwrites_and_restarts(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=100)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 20)
+    cache.put("a", b"x" * 30)  # Replaces, not adds to, the old size
+
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] == 50
+    assert cache.get("a") == b"x" * 30
+
+    reopened = DiskLRUCache(str(tmp_path), max_bytes=100)
+    assert (reopened.stats()["entries"], reopened.stats()["bytes"]) == (2, 50)
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=30)
+    for key in ("a", "b", "c"):
+        cache.put(key, b"x" * 10)
+    assert cache.get("a") is not None  # Now b is the oldest
+
+    cache.put("d", b"x" * 10)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+    assert not (tmp_path / "b.bin").exists()
+    assert (cache.stats()["bytes"], cache.stats()["evictions"]) == (30, 1)
+
+
+def test_recency_survives_a_restart(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=20)
+    cache.put("old", b"x" * 10)
+    cache.put("new", b"x" * 10)
+    os.utime(tmp_path / "old.bin", (1, 1))
+    os.utime(tmp_path / "new.bin", (2, 2))
+
+    reopened = DiskLRUCache(str(tmp_path), max_bytes=20)
+    reopened.put("newest", b"x" * 10)
+
+    assert reopened.get("old") is None
+    assert reopened.get("new") is not None
+
+
+def test_entries_larger_than_the_cache_are_not_stored(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=10)
+    cache.put("small", b"x" * 5)
+    cache.put("huge", b"x" * 11)
+
+    assert cache.get("huge") is None
+    assert cache.get("small") is not None
+    assert cache.stats()["bytes"] == 5
+
+
+def test_missing_and_discarded_entries_are_dropped_from_the_count(tmp_path):
+    cache = DiskLRUCache(str(tmp_path), max_bytes=100)
+    cache.put("vanished", b"x" * 10)
+    cache.put("damaged", b"x" * 20)
+    (tmp_path / "vanished.bin").unlink()
+
+    assert cache.get("vanished") is None
+    cache.discard("damaged")
+    cache.discard("never stored")
+
+    assert not (tmp_path / "damaged.bin").exists()
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_an_unreadable_cached_render_is_discarded_and_rendered_again(engine, monkeypatch):
+    artwork = engine.artwork_service
+    renders = []
+
+    async def generate_images(**kwargs):
+        renders.append(kwargs["prompt"])
+        return SimpleNamespace(images=[SimpleNamespace(data=_png("red"))])
+
+    monkeypatch.setattr(artwork.client.aio.models, "generate_images", generate_images)
+    key = DiskLRUCache.make_key(
+        model=artwork.image_model,
+        prompt="a castle",
+        aspect_ratio=config.imagen.aspect_ratio,
+        size=config.imagen.image_size
+    )
+    artwork.image_cache.put(key, b"truncated png")
+
+    panel = await artwork._generate_with_imagen("a castle")
+
+    assert renders == ["a castle"]
+    assert panel.image.getpixel((0, 0)) == (255, 0, 0)
+    # The fresh render replaced the damaged entry
+    assert artwork.image_cache.get(key) == panel.data
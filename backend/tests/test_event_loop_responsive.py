@@ -0,0 +1,100 @@
+"""
+Generation must never block the event loop: Gemini and Imagen go through the
+async genai client, and file, lock and image work runs in threads or the image pool
+"""
+
+import asyncio
+import io
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+# Seconds each fake Gemini/Imagen call takes
+CALL_SECONDS = 0.5
+# Heartbeat period, and the most any tick may be late
+TICK_SECONDS = 0.01
+MAX_LAG_SECONDS = 0.2
+
+SCRIPT = {
+    "title": "Loop Test",
+    "theme": "responsiveness",
+    "panels": [
+        {
+            "panel_number": i + 1,
+            "scene_description": f"Scene {i + 1}",
+            "dialogue": [],
+            "characters": ["Hero"],
+        }
+        for i in range(4)
+    ],
+}
+
+
+def _png(color) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (256, 256), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def slow_engine(engine, monkeypatch):
+    """Engine whose Gemini and Imagen calls are slow fakes that count heartbeat ticks while they run"""
+    engine.ticks = 0
+    engine.ticks_per_call = {"generate_content": [], "generate_images": []}
+
+    async def upstream_call(name):
+        ticks_before = engine.ticks
+        await asyncio.sleep(CALL_SECONDS)
+        engine.ticks_per_call[name].append(engine.ticks - ticks_before)
+
+    async def generate_content(**kwargs):
+        await upstream_call("generate_content")
+        return SimpleNamespace(text=json.dumps(SCRIPT))
+
+    async def generate_images(**kwargs):
+        await upstream_call("generate_images")
+        image = SimpleNamespace(data=_png((30 * len(engine.ticks_per_call["generate_images"]), 90, 160)))
+        return SimpleNamespace(images=[image])
+
+    monkeypatch.setattr(engine.script_service.client.aio.models, "generate_content", generate_content)
+    monkeypatch.setattr(engine.artwork_service.client.aio.models, "generate_images", generate_images)
+    engine.artwork_service.use_imagen = True
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_generate_comic(slow_engine):
+    lags = []
+
+    async def heartbeat(done: asyncio.Event) -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + TICK_SECONDS
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(time.perf_counter() - expected)
+            slow_engine.ticks += 1
+
+    done = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(done))
+    # Let the heartbeat start before anything can block
+    await asyncio.sleep(0)
+    try:
+        comic = await slow_engine.generate_comic("event loop")
+    finally:
+        done.set()
+        await ticker
+
+    # The fakes really ran: no fallback script or locally drawn panels
+    calls = slow_engine.ticks_per_call
+    assert (len(calls["generate_content"]), len(calls["generate_images"])) == (1, 4)
+    assert len(comic.panel_image_paths) == 4
+
+    # The loop kept ticking while every call was in flight; a blocking call sees no ticks
+    expected_ticks = CALL_SECONDS / TICK_SECONDS
+    for name, ticks in calls.items():
+        assert min(ticks) >= expected_ticks / 2, f"{name} blocked the event loop: {ticks} ticks"
+
+    # Nor did saving, composing or recording metadata ever stall it
+    assert max(lags) < MAX_LAG_SECONDS, f"event loop blocked for {max(lags):.3f}s"
@@ -0,0 +1,80 @@
+"""
+Event buses: replay and live delivery in publish order; the SQLite bus never touches the database on the event loop
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.core.events import EventBus, SQLiteEventBus
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def bus(request, tmp_path):
+    if request.param == "memory":
+        return EventBus()
+    return SQLiteEventBus(str(tmp_path / "events.db"), poll_seconds=0.05)
+
+
+async def _next(events):
+    return await asyncio.wait_for(events.__anext__(), timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_replay_and_live_events_keep_publish_order(bus):
+    bus.publish("comic:a", "script_done", {"n": 1})
+    bus.publish("comic:b", "script_done", {"n": 2})
+    bus.publish("comic:a", "panel_done", {"n": 3})
+    bus.copy_channel("comic:a", "request:x")
+    bus.publish("request:x", "done", {"n": 4})
+
+    replayed = await bus.replay("comic:a")
+    assert [(e["event"], e["data"]) for e in replayed] == [("script_done", {"n": 1}), ("panel_done", {"n": 3})]
+    copied = await bus.replay("request:x")
+    assert [e["data"]["n"] for e in copied] == [1, 3, 4]
+
+    events = bus.subscribe("comic:a", replayed[0]["id"], heartbeat_seconds=1)
+    assert (await _next(events))["data"] == {"n": 3}
+    bus.publish("comic:a", "completed", {"n": 5})
+    assert (await _next(events))["data"] == {"n": 5}
+    await events.aclose()
+
+    assert await bus.last_id() != replayed[-1]["id"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bus_reads_and_writes_off_the_event_loop(tmp_path, monkeypatch):
+    bus = SQLiteEventBus(str(tmp_path / "events.db"), poll_seconds=0.05)
+    loop_thread = threading.current_thread()
+    threads = set()
+
+    for name in ("_append", "_read_after"):
+        original = getattr(bus, name)
+
+        def record(*args, original=original):
+            threads.add(threading.current_thread())
+            return original(*args)
+
+        monkeypatch.setattr(bus, name, record)
+
+    bus.publish("batch:1", "batch_status", {"done": 0})
+    assert [e["data"] for e in await bus.replay("batch:1")] == [{"done": 0}]
+    assert threads and loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bus_delivers_events_from_another_process(tmp_path):
+    db_path = str(tmp_path / "events.db")
+    subscriber = SQLiteEventBus(db_path, poll_seconds=0.05)
+    # A second bus on the same log stands in for another API worker
+    publisher = SQLiteEventBus(db_path, poll_seconds=0.05)
+    assert publisher.epoch == subscriber.epoch
+
+    events = subscriber.subscribe("comic:a", await subscriber.last_id(), heartbeat_seconds=1)
+    waiting = asyncio.ensure_future(_next(events))
+    await asyncio.sleep(0.1)
+    publisher.publish("comic:a", "video_status", {"status": "completed"})
+
+    assert (await waiting)["data"] == {"status": "completed"}
+    await events.aclose()
@@ -0,0 +1,137 @@
+"""
+Strong ETags, Last-Modified and 304s on comic assets; missing hashes are filled in with one metadata write
+"""
+
+import hashlib
+import io
+import json
+
+import pytest
+from PIL import Image
+
+from app.core.http_cache import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL
+from app.models import ComicMetadata
+
+
+def _png(color) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (64, 64), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def comic(engine):
+    """A comic saved before file hashes were recorded"""
+    comic_dir = engine.output_dir / "old_comic"
+    comic_dir.mkdir()
+    (comic_dir / "comic.png").write_bytes(_png("white"))
+    (comic_dir / "script.json").write_bytes(json.dumps({"title": "Old", "panels": []}).encode())
+    panel_paths = []
+    for number, color in enumerate(["red", "green", "blue"], start=1):
+        path = comic_dir / f"panel_{number}_image.png"
+        path.write_bytes(_png(color))
+        panel_paths.append(str(path))
+
+    metadata = ComicMetadata(
+        comic_id="old_comic",
+        title="Old",
+        theme="",
+        generated_at="2026-01-01T10:00:00",
+        panel_count=3,
+        generation_params={},
+        files={"image": str(comic_dir / "comic.png"), "script": str(comic_dir / "script.json")},
+        panel_image_paths=panel_paths,
+    )
+    engine.catalog.save(metadata)
+    return metadata
+
+
+def _sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def test_etag_is_the_content_hash_and_the_hash_is_saved(client, engine, comic):
+    response = client.get("/api/comics/old_comic/image")
+
+    content_hash = _sha256(comic.files["image"])
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"{content_hash}"'
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert "last-modified" in response.headers
+    assert engine.catalog.load("old_comic").file_hashes == {"image": content_hash}
+
+    # Pinned to the current version, the URL may be cached for good
+    pinned = client.get("/api/comics/old_comic/image", params={"v": content_hash})
+    assert pinned.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+@pytest.mark.parametrize("if_none_match, status", [
+    (None, 304),
+    ('W/{etag}', 304),
+    ('"other", {etag}', 304),
+    ("*", 304),
+    ('"other"', 200),
+])
+def test_if_none_match(client, comic, if_none_match, status):
+    etag = client.get("/api/comics/old_comic/image").headers["etag"]
+    header = (if_none_match or "{etag}").format(etag=etag)
+
+    response = client.get("/api/comics/old_comic/image", headers={"If-None-Match": header})
+
+    assert response.status_code == status
+    assert response.headers["etag"] == etag
+    if status == 304:
+        assert response.content == b""
+
+
+def test_if_modified_since_only_counts_without_if_none_match(client, comic):
+    first = client.get("/api/comics/old_comic/script")
+    last_modified = first.headers["last-modified"]
+
+    assert client.get("/api/comics/old_comic/script",
+                      headers={"If-Modified-Since": last_modified}).status_code == 304
+    # A stale ETag wins over a current date
+    assert client.get("/api/comics/old_comic/script",
+                      headers={"If-Modified-Since": last_modified,
+                               "If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_each_script_encoding_has_its_own_etag(client, comic):
+    identity = client.get("/api/comics/old_comic/script", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/api/comics/old_comic/script", headers={"Accept-Encoding": "gzip"})
+
+    assert identity.headers["etag"] != gzipped.headers["etag"]
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in gzipped.headers["vary"]
+    revalidated = client.get("/api/comics/old_comic/script",
+                             headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert "Accept-Encoding" in revalidated.headers["vary"]
+
+
+def test_panel_manifest_saves_missing_hashes_in_one_write(client, engine, comic, monkeypatch):
+    writes = []
+    modify_comic_metadata = engine.modify_comic_metadata
+
+    async def counting_modify(comic_id, update):
+        writes.append(comic_id)
+        return await modify_comic_metadata(comic_id, update)
+
+    monkeypatch.setattr(engine, "modify_comic_metadata", counting_modify)
+
+    response = client.get("/api/comics/old_comic/panels")
+    assert response.status_code == 200
+    panels = response.json()["panels"]
+    assert [panel["image"]["hash"] for panel in panels] == [_sha256(path) for path in comic.panel_image_paths]
+    assert [panel["image"]["width"] for panel in panels] == [64, 64, 64]
+    assert writes == ["old_comic"]
+
+    stored = engine.catalog.load("old_comic").file_hashes
+    assert set(stored) == {"panel_1_image", "panel_2_image", "panel_3_image"}
+
+    # Everything is stored now, so nothing else is written
+    client.get("/api/comics/old_comic/panels")
+    panel_etag = client.get("/api/comics/old_comic/panels/2/image").headers["etag"]
+    assert panel_etag == f'"{stored["panel_2_image"]}"'
+    assert writes == ["old_comic"]
@@ -0,0 +1,39 @@
+"""
+Format negotiation for resized comic images
+"""
+
+import pytest
+
+from app.services.image_derivatives import ImageDerivativeService
+
+
+@pytest.fixture
+def service():
+    service = ImageDerivativeService()
+    service.avif_supported = True
+    return service
+
+
+@pytest.mark.parametrize("accept, size, expected", [
+    ("image/avif,image/webp,image/*,*/*;q=0.8", "thumb", "image/avif"),
+    ("image/webp,image/avif", "thumb", "image/avif"),
+    ("image/avif;q=0,image/webp", "thumb", "image/webp"),
+    ("image/avif; q=0.0, image/webp;q=0", "thumb", "image/jpeg"),
+    ("IMAGE/WEBP;Q=0.5", "medium", "image/webp"),
+    ("image/webp;q=oops", "thumb", "image/jpeg"),
+    # Wildcards don't name a format
+    ("image/*,*/*", "thumb", "image/jpeg"),
+    (None, "thumb", "image/jpeg"),
+    # Full size without a named format keeps the original file
+    ("image/*", "full", None),
+    ("image/webp;q=0", "full", None),
+])
+def test_negotiate_format(service, accept, size, expected):
+    assert service.negotiate_format(accept, size) == expected
+
+
+def test_avif_is_skipped_without_an_encoder(service):
+    service.avif_supported = False
+
+    assert service.negotiate_format("image/avif,image/webp", "thumb") == "image/webp"
+    assert service.negotiate_format("image/avif", "full") is None
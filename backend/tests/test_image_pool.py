@@ -0,0 +1,43 @@
+"""
+The image process pool survives its workers dying, without ever forking the threaded API process
+"""
+
+import io
+import os
+import signal
+
+import pytest
+from PIL import Image
+
+from app.core.image_pool import ImageProcessPool
+
+
+def _png(size, color) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", size, color).save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def pool():
+    pool = ImageProcessPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(os.name != 'posix', reason="kills a worker with SIGKILL")
+async def test_pool_restarts_after_a_worker_dies(pool):
+    image, encoded = await pool.normalize_panel(_png((64, 48), "red"), (32, 24))
+    assert image.size == (32, 24) and image.getpixel((0, 0)) == (255, 0, 0)
+    assert encoded.startswith(b"\x89PNG")
+
+    executor = pool._executor
+    # A fork would copy this process's locks while other threads may hold them
+    assert executor._mp_context.get_start_method() != 'fork'
+    for process in list(executor._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+
+    image, _ = await pool.normalize_panel(_png((64, 48), "blue"), (32, 24))
+    assert image.getpixel((0, 0)) == (0, 0, 255)
+    assert pool._executor is not executor
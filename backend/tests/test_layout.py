@@ -0,0 +1,88 @@
+"""
+Page geometry of every layout kind, and startup validation of the layout settings
+"""
+
+import pytest
+
+from app.core.config import AppConfig
+from app.core.layout import GRID, STRIP, VERTICAL, compute_layout
+
+SQUARE = (100, 100)
+
+
+def test_four_full_size_panels_keep_the_original_two_by_two_page():
+    layout = compute_layout([(1024, 1024)] * 4, GRID, margin=15)
+
+    assert layout.canvas_size == (2093, 2093)
+    assert layout.positions == ((15, 15), (1054, 15), (15, 1054), (1054, 1054))
+
+
+def test_grid_wraps_after_ceil_sqrt_columns_or_the_configured_count():
+    layout = compute_layout([SQUARE] * 5, GRID, margin=10)
+    assert layout.canvas_size == (340, 230)
+    assert layout.positions == ((10, 10), (120, 10), (230, 10), (10, 120), (120, 120))
+
+    layout = compute_layout([SQUARE] * 3, GRID, margin=10, columns=1)
+    assert layout.canvas_size == (120, 340)
+    assert layout.positions == ((10, 10), (10, 120), (10, 230))
+
+
+def test_strip_sizes_its_row_to_the_tallest_panel_and_centers_the_rest():
+    layout = compute_layout([(100, 50), (60, 80)], STRIP, margin=10)
+
+    assert layout.canvas_size == (190, 100)
+    assert layout.positions == ((10, 25), (120, 10))
+
+
+def test_vertical_sizes_its_column_to_the_widest_panel_and_centers_the_rest():
+    layout = compute_layout([(100, 50), (60, 80)], VERTICAL, margin=10)
+
+    assert layout.canvas_size == (120, 160)
+    assert layout.positions == ((10, 10), (30, 70))
+
+
+def test_template_repeats_below_itself_and_skips_empty_cells():
+    templates = {"staircase": [[0, 0], [1, 1], [2, 2]], "gap": [[0, 0], [2, 0]]}
+
+    layout = compute_layout([SQUARE] * 4, "staircase", margin=10, templates=templates)
+    assert layout.canvas_size == (340, 450)
+    assert layout.positions == ((10, 10), (120, 120), (230, 230), (10, 340))
+
+    # Column 1 holds no panel, so it takes no space
+    layout = compute_layout([SQUARE] * 2, "gap", margin=10, templates=templates)
+    assert layout.canvas_size == (230, 120)
+    assert layout.positions == ((10, 10), (120, 10))
+
+
+def test_layouts_are_cached():
+    assert compute_layout([SQUARE] * 3, GRID) is compute_layout([SQUARE] * 3, GRID)
+
+
+@pytest.mark.parametrize("panel_sizes, mode, templates", [
+    ([], GRID, None),
+    ([SQUARE], "mosaic", None),
+    ([SQUARE], "mosaic", {"other": [[0, 0]]}),
+    ([SQUARE], "empty", {"empty": []}),
+    ([SQUARE], "overlap", {"overlap": [[0, 0], [0, 0]]}),
+])
+def test_invalid_layouts_are_rejected(panel_sizes, mode, templates):
+    with pytest.raises(ValueError):
+        compute_layout(panel_sizes, mode, templates=templates)
+
+
+@pytest.mark.parametrize("env, message", [
+    ({"COMIC_LAYOUT": "mosaic"}, "Unknown COMIC_LAYOUT: mosaic"),
+    ({"COMIC_LAYOUT_COLUMNS": "-1"}, "COMIC_LAYOUT_COLUMNS must be 0 or more"),
+])
+def test_config_rejects_invalid_layout_settings(monkeypatch, env, message):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValueError, match=message):
+        AppConfig()
+
+
+def test_config_accepts_built_in_and_template_layouts(monkeypatch):
+    for layout in (GRID, STRIP, VERTICAL, "staircase"):
+        monkeypatch.setenv("COMIC_LAYOUT", layout)
+        assert AppConfig().comic.layout == layout
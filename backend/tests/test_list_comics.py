@@ -0,0 +1,106 @@
+"""
+GET /api/comics: keyset pagination over (generated_at, comic_id) and validated date filters
+"""
+
+import base64
+import json
+
+import pytest
+
+from app.models import ComicMetadata
+
+
+def _comic(comic_id: str, generated_at: str, tone: str = "humorous") -> ComicMetadata:
+    return ComicMetadata(
+        comic_id=comic_id,
+        title=comic_id,
+        theme="",
+        generated_at=generated_at,
+        panel_count=4,
+        generation_params={"topic": comic_id, "tone": tone, "visual_style": "modern digital comic"},
+        files={},
+    )
+
+
+@pytest.fixture
+def comics(engine):
+    """Seven comics; four share one generated_at, so only comic_id orders them"""
+    saved = [
+        _comic("a", "2026-01-01T10:00:00"),
+        _comic("b", "2026-01-02T10:00:00", tone="serious"),
+        _comic("c", "2026-01-03T10:00:00"),
+        _comic("d", "2026-01-03T10:00:00"),
+        _comic("e", "2026-01-03T10:00:00", tone="serious"),
+        _comic("f", "2026-01-03T10:00:00"),
+        _comic("g", "2026-01-04T09:30:00.250000"),
+    ]
+    for comic in saved:
+        engine.catalog.save(comic)
+    return saved
+
+
+def _pages(client, **params):
+    ids, cursor = [], None
+    while True:
+        response = client.get("/api/comics", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        page = response.json()
+        ids.append([comic["comic_id"] for comic in page["comics"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, page["total"]
+
+
+def test_pages_walk_ties_on_generated_at_without_gaps_or_repeats(client, comics):
+    pages, total = _pages(client, limit=2)
+
+    # Page boundaries fall inside the tied run (c-f) and comic_id breaks the ties
+    assert pages == [["g", "f"], ["e", "d"], ["c", "b"], ["a"]]
+    assert total == 7
+
+
+def test_filters_apply_to_every_page_and_the_total(client, comics):
+    pages, total = _pages(client, limit=2, tone="humorous")
+
+    assert pages == [["g", "f"], ["d", "c"], ["a"]]
+    assert total == 5
+
+
+def test_date_filters_are_normalized_before_comparing(client, comics):
+    # Compared as raw text, '2026-01-03 10:00:01' would sort before '2026-01-03T10:00:00'
+    pages, total = _pages(client, generated_from="2026-01-03", generated_to="2026-01-03 10:00:01")
+    assert pages == [["f", "e", "d", "c"]]
+    assert total == 4
+
+    pages, _ = _pages(client, generated_from="2026-01-04T09:30:00.25")
+    assert pages == [["g"]]
+
+
+@pytest.mark.parametrize("name", ["generated_from", "generated_to"])
+@pytest.mark.parametrize("value", ["yesterday", "2026-13-01", "2026-01-03T25:00"])
+def test_invalid_dates_are_rejected(client, comics, name, value):
+    response = client.get("/api/comics", params={name: value})
+
+    assert response.status_code == 400
+    assert name in response.json()["detail"]
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    base64.urlsafe_b64encode(b"{}").decode(),
+    base64.urlsafe_b64encode(json.dumps(["2026-01-03T10:00:00"]).encode()).decode(),
+])
+def test_invalid_cursors_are_rejected(client, comics, cursor):
+    response = client.get("/api/comics", params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_tampered_cursor_only_moves_the_keyset(client, comics):
+    # A hand-made cursor can skip ahead, but never leaks rows past its own position
+    cursor = base64.urlsafe_b64encode(json.dumps(["2026-01-03T10:00:00", "e"]).encode()).decode()
+    response = client.get("/api/comics", params={"cursor": cursor, "limit": 10})
+
+    assert response.status_code == 200
+    assert [comic["comic_id"] for comic in response.json()["comics"]] == ["d", "c", "b", "a"]
@@ -0,0 +1,102 @@
+"""
+The SQLite metadata store: WAL round-trips, keyset pages, and the one-shot importer
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from app.core.metadata_store import SQLiteMetadataStore
+from app.models import ComicMetadata
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _metadata(comic_id: str, generated_at: str, tone: str = "funny", video_status=None) -> ComicMetadata:
+    return ComicMetadata(
+        comic_id=comic_id,
+        title=f"Comic {comic_id}",
+        theme="",
+        generated_at=generated_at,
+        panel_count=4,
+        generation_params={"tone": tone, "visual_style": "manga"},
+        files={"image": f"{comic_id}/comic.png"},
+        video_status=video_status,
+    )
+
+
+def test_the_store_runs_in_wal_mode(tmp_path):
+    store = SQLiteMetadataStore(str(tmp_path / "comics.db"))
+
+    assert store._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_upserted_comics_page_back_newest_first(tmp_path):
+    store = SQLiteMetadataStore(str(tmp_path / "comics.db"))
+    # Two comics share a timestamp: comic_id breaks the tie
+    for comic_id, generated_at in [("a", "2026-01-01T10:00:00"), ("b", "2026-01-02T10:00:00"),
+                                   ("c", "2026-01-02T10:00:00"), ("d", "2026-01-03T10:00:00")]:
+        store.upsert(_metadata(comic_id, generated_at))
+
+    pages, after = [], None
+    while True:
+        page = store.list_page(3, after=after)
+        if not page:
+            break
+        pages.append([comic.comic_id for comic in page])
+        after = (page[-1].generated_at, page[-1].comic_id)
+
+    assert pages == [["d", "c", "b"], ["a"]]
+    assert store.get("c") == _metadata("c", "2026-01-02T10:00:00")
+
+
+def test_an_upsert_replaces_the_row_and_its_filter_columns(tmp_path):
+    store = SQLiteMetadataStore(str(tmp_path / "comics.db"))
+    store.upsert(_metadata("a", "2026-01-01T10:00:00"))
+    store.upsert(_metadata("a", "2026-01-01T10:00:00", tone="dark", video_status="completed"),
+                 source_mtime=12.5, source_dir="renamed")
+
+    assert store.count() == 1
+    assert store.count(tone="funny") == 0
+    assert [comic.comic_id for comic in store.list_page(10, tone="dark", video_status="completed")] == ["a"]
+    assert store.source_of("a") == ("renamed", 12.5)
+
+
+def test_writes_are_visible_to_connections_of_other_threads(tmp_path):
+    store = SQLiteMetadataStore(str(tmp_path / "comics.db"))
+    store.upsert(_metadata("a", "2026-01-01T10:00:00"))
+
+    seen = []
+    reader = threading.Thread(target=lambda: seen.append(store.get("a")))
+    reader.start()
+    reader.join()
+
+    assert seen == [_metadata("a", "2026-01-01T10:00:00")]
+
+
+def test_the_importer_command_loads_every_readable_comic_once(tmp_path):
+    comics_dir = tmp_path / "comics"
+    for comic in (_metadata("a", "2026-01-01T10:00:00"), _metadata("b", "2026-01-02T10:00:00")):
+        (comics_dir / comic.comic_id).mkdir(parents=True)
+        (comics_dir / comic.comic_id / "metadata.json").write_text(json.dumps(comic.to_dict()), encoding="utf-8")
+    (comics_dir / "broken").mkdir()
+    (comics_dir / "broken" / "metadata.json").write_text("{", encoding="utf-8")
+    (comics_dir / "no_metadata").mkdir()
+    database = tmp_path / "comics.db"
+
+    def run_importer() -> str:
+        result = subprocess.run(
+            [sys.executable, "-m", "app.core.metadata_store", str(comics_dir), str(database)],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+
+    assert run_importer() == f"Imported 2 comics into {database}"
+    # Unchanged metadata.json files are skipped on the next run
+    assert run_importer() == f"Imported 0 comics into {database}"
+
+    store = SQLiteMetadataStore(str(database))
+    assert [comic.comic_id for comic in store.list_comics()] == ["b", "a"]
+    assert set(store.source_mtimes()) == {"a", "b"}
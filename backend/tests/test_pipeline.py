@@ -0,0 +1,52 @@
+"""
+StagedPipeline keeps draining its queues whatever a stage or its error handler raises
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.pipeline import StagedPipeline
+
+
+async def _double(item):
+    return item * 2
+
+
+async def _fail_on_odd(item):
+    if item % 2:
+        raise ValueError(f"odd item {item}")
+    return item
+
+
+@pytest.mark.asyncio
+async def test_failed_items_are_reported_and_dropped():
+    errors = []
+    pipeline = StagedPipeline(
+        stages=[("check", _fail_on_odd, 2), ("double", _double, 1)],
+        queue_size=1,
+        on_error=lambda item, stage, error: errors.append((item, stage)),
+    )
+
+    results = await asyncio.wait_for(pipeline.run(list(range(6))), timeout=5)
+
+    assert results == [0, None, 4, None, 8, None]
+    assert sorted(errors) == [(1, "check"), (3, "check"), (5, "check")]
+    assert pipeline.stats()["check"]["failed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_raising_error_handler_does_not_hang_the_pipeline():
+    def on_error(item, stage, error):
+        raise RuntimeError("could not record the failure")
+
+    # One worker per stage: had the handler killed it, nothing would drain the queue
+    pipeline = StagedPipeline(
+        stages=[("check", _fail_on_odd, 1), ("double", _double, 1)],
+        queue_size=1,
+        on_error=on_error,
+    )
+
+    results = await asyncio.wait_for(pipeline.run(list(range(6))), timeout=5)
+
+    assert results == [0, None, 4, None, 8, None]
@@ -0,0 +1,48 @@
+"""
+Rate limiters shared through SQLite hold every API worker to one combined quota
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.rate_limiter import SQLiteTokenBucketRateLimiter
+
+REQUESTS_PER_MINUTE = 600  # 10 per second
+BURST = 2
+
+
+@pytest.mark.asyncio
+async def test_workers_share_one_quota(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    # One limiter per worker process, each with its own connection to the same store
+    workers = [
+        SQLiteTokenBucketRateLimiter("Imagen", REQUESTS_PER_MINUTE, BURST, db_path)
+        for _ in range(3)
+    ]
+
+    async def send(limiter, count):
+        for _ in range(count):
+            await limiter.acquire()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(limiter, 4) for limiter in workers))
+    elapsed = time.perf_counter() - start
+
+    # 12 requests: the burst goes at once, the other 10 at 10 per second. Separate
+    # in-process buckets would let each worker send its 4 in 0.2s.
+    assert elapsed >= (12 - BURST) / (REQUESTS_PER_MINUTE / 60) - 0.05
+    assert elapsed < 2.0
+
+
+@pytest.mark.asyncio
+async def test_limiters_with_other_names_do_not_share(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    gemini = SQLiteTokenBucketRateLimiter("Gemini", REQUESTS_PER_MINUTE, BURST, db_path)
+    imagen = SQLiteTokenBucketRateLimiter("Imagen", REQUESTS_PER_MINUTE, BURST, db_path)
+
+    start = time.perf_counter()
+    for limiter in (gemini, imagen, gemini, imagen):
+        await limiter.acquire()
+    assert time.perf_counter() - start < 0.1
@@ -0,0 +1,99 @@
+"""
+Regenerating one panel costs one Imagen call and recomposes the comic from the new render plus the saved panels
+"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from app.core import image_pool as image_pool_module
+from app.core.config import config
+from app.core.layout import compute_layout
+from app.services.artwork_generator import PANEL_SIZE
+
+COLORS = [(200, 40, 40), (40, 200, 40), (40, 40, 200), (200, 200, 40), (40, 200, 200)]
+
+SCRIPT = {
+    "title": "Regenerate",
+    "theme": "fixes",
+    "panels": [
+        {"panel_number": i + 1, "scene_description": f"Scene {i + 1}", "dialogue": [], "characters": ["Hero"]}
+        for i in range(4)
+    ],
+}
+
+
+def _png(color) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (128, 128), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def fake_engine(engine, monkeypatch):
+    """Engine whose Imagen renders are flat colors, a new one per call"""
+    engine.image_calls = 0
+
+    async def generate_content(**kwargs):
+        return SimpleNamespace(text=json.dumps(SCRIPT))
+
+    async def generate_images(**kwargs):
+        color = COLORS[engine.image_calls]
+        engine.image_calls += 1
+        return SimpleNamespace(images=[SimpleNamespace(data=_png(color))])
+
+    monkeypatch.setattr(engine.script_service.client.aio.models, "generate_content", generate_content)
+    monkeypatch.setattr(engine.artwork_service.client.aio.models, "generate_images", generate_images)
+    engine.artwork_service.use_imagen = True
+    return engine
+
+
+def _panel_colors(image_path, count):
+    """Color at the center of each panel of a composed comic"""
+    layout = compute_layout([PANEL_SIZE] * count, mode=config.comic.layout, margin=config.comic.panel_margin,
+                            columns=config.comic.layout_columns, templates=config.comic.layout_templates)
+    with Image.open(image_path) as image:
+        image = image.convert("RGB")
+        return [image.getpixel((x + PANEL_SIZE[0] // 2, y + PANEL_SIZE[1] // 2)) for x, y in layout.positions]
+
+
+@pytest.mark.asyncio
+async def test_regenerate_panel_recomposes_with_the_new_render(fake_engine, monkeypatch):
+    comic = await fake_engine.generate_comic("regenerate", use_cache=False)
+    assert fake_engine.image_calls == 4
+    old_hashes = dict(comic.file_hashes)
+
+    decoded = []
+    normalize_panel = image_pool_module.image_pool.normalize_panel
+
+    async def spy(data, size, raw_format=None, encode=True, stats=None):
+        if not encode:
+            decoded.append(data)
+        return await normalize_panel(data, size, raw_format=raw_format, encode=encode, stats=stats)
+
+    monkeypatch.setattr(image_pool_module.image_pool, "normalize_panel", spy)
+
+    updated = await fake_engine.regenerate_panel(comic.comic_id, 2)
+
+    assert fake_engine.image_calls == 5
+    # Only the untouched panels are read back from disk; the new render is reused as-is
+    assert len(decoded) == 3
+    assert _panel_colors(updated.files["image"], 4) == [COLORS[0], COLORS[4], COLORS[2], COLORS[3]]
+
+    assert updated.file_hashes["panel_2_image"] != old_hashes["panel_2_image"]
+    assert updated.file_hashes["image"] != old_hashes["image"]
+    assert updated.file_hashes["panel_1_image"] == old_hashes["panel_1_image"]
+    assert (await fake_engine.get_comic(comic.comic_id)).file_hashes == updated.file_hashes
+
+
+@pytest.mark.asyncio
+async def test_regenerate_panel_rejects_out_of_range_panels(fake_engine):
+    comic = await fake_engine.generate_comic("regenerate", use_cache=False)
+
+    with pytest.raises(ValueError):
+        await fake_engine.regenerate_panel(comic.comic_id, 5)
+    assert await fake_engine.regenerate_panel("missing", 1) is None
+    assert fake_engine.image_calls == 4
@@ -0,0 +1,40 @@
+"""
+Veo operations that never finish fail with a timeout instead of being polled forever
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import config
+from app.services.video_service import VideoGenerationService, VideoTimeoutError
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Video service whose Veo operations report the done flag they were created with"""
+    monkeypatch.setattr(config.video, "poll_initial_interval", 0.01)
+    monkeypatch.setattr(config.video, "poll_max_interval", 0.02)
+    monkeypatch.setattr(config.video, "max_wait_seconds", 0.1)
+
+    async def get(operation):
+        return operation
+
+    # Skip __init__: it builds a Vertex AI client
+    service = VideoGenerationService.__new__(VideoGenerationService)
+    service.client = SimpleNamespace(aio=SimpleNamespace(operations=SimpleNamespace(get=get)))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_stuck_operations_time_out_after_finished_ones_are_yielded(service):
+    operations = {1: SimpleNamespace(done=True), 2: SimpleNamespace(done=False)}
+
+    finished = []
+    with pytest.raises(VideoTimeoutError) as error:
+        async for panel_number, _ in service._poll_operations(operations):
+            finished.append(panel_number)
+
+    assert finished == [1]
+    assert error.value.panel_numbers == [2]
+
@@ -20,11 +20,23 @@ export const getBatchStatus = async (taskId) => {
   return response.data
 }
 
-export const getComics = async () => {
-  const response = await api.get('/comics')
+// params: { limit, cursor, tone, visual_style, video_status, generated_from, generated_to }
+export const getComics = async (params = {}) => {
+  const response = await api.get('/comics', { params })
   return response.data
 }
 
+// Asset URL pinned to the content hash, so the browser may cache it as immutable
+export const comicAssetUrl = (comic, asset, params = {}) => {
+  const query = new URLSearchParams(params)
+  const version = comic.file_hashes?.[asset]
+  if (version) {
+    query.set('v', version)
+  }
+  const search = query.toString()
+  return `/api/comics/${encodeURIComponent(comic.comic_id)}/${asset}${search ? `?${search}` : ''}`
+}
+
 export const getComic = async (id) => {
   const response = await api.get(`/comics/${id}`)
   return response.data
@@ -40,3 +52,19 @@ export const generateVideo = async (comicId) => {
   const response = await api.post(`/comics/${comicId}/generate-video`)
   return response.data
 }
+
+// Server-Sent Events progress stream. channel: 'comic:<id>', 'batch:<task_id>' or 'request:<progress_id>'.
+// handlers maps event names to callbacks receiving the parsed payload; EventSource reconnects
+// with Last-Event-ID on its own, so no events are missed. Call close() on the result when done.
+export const subscribeEvents = (channel, handlers) => {
+  const source = new EventSource(`/api/events?channel=${encodeURIComponent(channel)}`)
+  Object.entries(handlers).forEach(([event, handler]) => {
+    source.addEventListener(event, (message) => handler(JSON.parse(message.data)))
+  })
+  return source
+}
+
+export const getVideoStatus = async (comicId) => {
+  const response = await api.get(`/comics/${comicId}/video/status`)
+  return response.data
+}
@@ -1,8 +1,8 @@
-import { useState } from 'react'
-import { useMutation, useQuery } from '@tanstack/react-query'
+import { useState, useEffect } from 'react'
+import { useMutation } from '@tanstack/react-query'
 import { Plus, Minus, Zap, Loader, CheckCircle, XCircle } from 'lucide-react'
 import toast from 'react-hot-toast'
-import { generateBatchComics, getBatchStatus } from '../api/comics'
+import { generateBatchComics, subscribeEvents } from '../api/comics'
 
 const BatchGenerate = () => {
   const [topics, setTopics] = useState([''])
@@ -11,6 +11,7 @@ const BatchGenerate = () => {
     visual_style: 'modern digital comic'
   })
   const [taskId, setTaskId] = useState(null)
+  const [batchStatus, setBatchStatus] = useState(null)
 
   const batchMutation = useMutation({
     mutationFn: generateBatchComics,
@@ -23,12 +24,19 @@ const BatchGenerate = () => {
     }
   })
 
-  const { data: batchStatus } = useQuery({
-    queryKey: ['batch-status', taskId],
-    queryFn: () => getBatchStatus(taskId),
-    enabled: !!taskId,
-    refetchInterval: taskId && ['started', 'in_progress'].includes(batchStatus?.status) ? 2000 : false,
-  })
+  // The server pushes the full batch status whenever a topic starts, finishes or fails
+  useEffect(() => {
+    if (!taskId) return
+    const source = subscribeEvents(`batch:${taskId}`, {
+      batch_status: (status) => {
+        setBatchStatus(status)
+        if (['completed', 'failed'].includes(status.status)) {
+          source.close()
+        }
+      }
+    })
+    return () => source.close()
+  }, [taskId])
 
   const addTopic = () => {
     setTopics([...topics, ''])
@@ -61,6 +69,7 @@ const BatchGenerate = () => {
 
   const resetForm = () => {
     setTaskId(null)
+    setBatchStatus(null)
     setTopics([''])
   }
 
@@ -1,17 +1,32 @@
-import { useQuery } from '@tanstack/react-query'
+import { useInfiniteQuery } from '@tanstack/react-query'
 import { Link } from 'react-router-dom'
 import { Loader, Eye, Calendar, Star, Filter, Grid, List, Search, Plus, Heart, Zap, Clock } from 'lucide-react'
 import { useState } from 'react'
-import { getComics } from '../api/comics'
+import { getComics, comicAssetUrl } from '../api/comics'
+
+const PAGE_SIZE = 24
 
 const ComicGallery = () => {
   const [viewMode, setViewMode] = useState('grid')
   const [filterTone, setFilterTone] = useState('all')
   const [searchTerm, setSearchTerm] = useState('')
 
-  const { data: comicsData, isLoading, error } = useQuery({
-    queryKey: ['comics'],
-    queryFn: getComics,
+  const {
+    data: comicsData,
+    isLoading,
+    error,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: ['comics', 'gallery', filterTone],
+    queryFn: ({ pageParam }) => getComics({
+      limit: PAGE_SIZE,
+      cursor: pageParam || undefined,
+      tone: filterTone === 'all' ? undefined : filterTone,
+    }),
+    initialPageParam: null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor || undefined,
   })
 
   if (isLoading) {
@@ -44,15 +59,15 @@ const ComicGallery = () => {
     )
   }
 
-  const comics = comicsData?.comics || []
+  const comics = comicsData?.pages.flatMap(page => page.comics) || []
+  const totalComics = comicsData?.pages[0]?.total ?? 0
+  const hasAnyComics = totalComics > 0 || filterTone !== 'all'
 
-  // Filter and search comics
-  const filteredComics = comics.filter(comic => {
-    const matchesTone = filterTone === 'all' || comic.generation_params?.tone === filterTone
-    const matchesSearch = comic.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         comic.theme.toLowerCase().includes(searchTerm.toLowerCase())
-    return matchesTone && matchesSearch
-  })
+  // Tone is filtered by the server; search applies to the pages loaded so far
+  const filteredComics = comics.filter(comic =>
+    comic.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
+    comic.theme.toLowerCase().includes(searchTerm.toLowerCase())
+  )
 
   const tones = ['all', 'humorous', 'educational', 'dramatic', 'inspirational']
 
@@ -75,7 +90,7 @@ const ComicGallery = () => {
         <div className="flex items-center justify-center space-x-4">
           <div className="flex items-center space-x-2 bg-white/80 backdrop-blur-sm rounded-2xl px-4 py-2 border-2 border-blue-200">
             <Eye className="text-blue-500" size={20} />
-            <span className="font-semibold text-blue-700">{comics.length} Comics</span>
+            <span className="font-semibold text-blue-700">{totalComics} Comics</span>
           </div>
           <div className="flex items-center space-x-2 bg-white/80 backdrop-blur-sm rounded-2xl px-4 py-2 border-2 border-green-200">
             <Zap className="text-green-500" size={20} />
@@ -141,7 +156,7 @@ const ComicGallery = () => {
         {/* Filter Results */}
         {(searchTerm || filterTone !== 'all') && (
           <div className="mt-4 flex items-center space-x-2 text-sm text-gray-600">
-            <span>Showing {filteredComics.length} of {comics.length} comics</span>
+            <span>Showing {filteredComics.length} of {totalComics} comics</span>
             {searchTerm && (
               <span className="bg-blue-100 text-blue-800 px-2 py-1 rounded-full">
                 "{searchTerm}"
@@ -160,14 +175,14 @@ const ComicGallery = () => {
       {filteredComics.length === 0 ? (
         <div className="text-center py-16">
           <div className="w-32 h-32 bg-gradient-to-br from-blue-100 to-purple-100 rounded-3xl flex items-center justify-center mx-auto mb-6">
-            {comics.length === 0 ? (
+            {!hasAnyComics ? (
               <Eye size={60} className="text-gray-400" />
             ) : (
               <Search size={60} className="text-gray-400" />
             )}
           </div>
 
-          {comics.length === 0 ? (
+          {!hasAnyComics ? (
             <>
               <h3 className="text-3xl font-bold text-gray-900 mb-4">No comics yet! 🎨</h3>
               <p className="text-xl text-gray-600 mb-8 max-w-md mx-auto">
@@ -221,7 +236,7 @@ const ComicGallery = () => {
 
                   <div className="aspect-square bg-gradient-to-br from-blue-100 via-purple-100 to-pink-100 rounded-2xl mb-4 overflow-hidden relative">
                     <img
-                      src={`/api/comics/${comic.comic_id}/image`}
+                      src={comicAssetUrl(comic, 'image', { size: 'thumb' })}
                       alt={comic.title}
                       className="w-full h-full object-cover group-hover:scale-110 transition-transform duration-500"
                       onError={(e) => {
@@ -270,7 +285,7 @@ const ComicGallery = () => {
                 <div className="card flex items-center space-x-6 group-hover:bg-gray-50">
                   <div className="w-24 h-24 bg-gradient-to-br from-blue-100 to-purple-100 rounded-xl overflow-hidden flex-shrink-0">
                     <img
-                      src={`/api/comics/${comic.comic_id}/image`}
+                      src={comicAssetUrl(comic, 'image', { size: 'thumb' })}
                       alt={comic.title}
                       className="w-full h-full object-cover group-hover:scale-110 transition-transform duration-300"
                       onError={(e) => {
@@ -300,6 +315,26 @@ const ComicGallery = () => {
         </div>
       )}
 
+      {/* Load More */}
+      {hasNextPage && (
+        <div className="text-center">
+          <button
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+            className="btn-secondary"
+          >
+            {isFetchingNextPage ? (
+              <>
+                <Loader size={20} className="inline mr-2 animate-spin" />
+                Loading...
+              </>
+            ) : (
+              'Load More Comics'
+            )}
+          </button>
+        </div>
+      )}
+
       {/* Create CTA */}
       {filteredComics.length > 0 && (
         <div className="text-center py-12">
@@ -3,13 +3,17 @@ import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { Download, Share, Calendar, User, Palette, Clock, ArrowLeft, Heart, BookOpen, Zap, Star, Copy, Facebook, Twitter, Eye, Video, Play, Loader, AlertCircle } from 'lucide-react'
 import toast from 'react-hot-toast'
 import { useState, useEffect } from 'react'
-import { getComic, getComicScript, generateVideo } from '../api/comics'
+import { getComic, getComicScript, generateVideo, subscribeEvents, comicAssetUrl } from '../api/comics'
+
+// The comic is stored as PNG, WebP or JPEG (COMIC_OUTPUT_FORMAT on the backend)
+const IMAGE_EXTENSIONS = { 'image/png': 'png', 'image/webp': 'webp', 'image/jpeg': 'jpg', 'image/avif': 'avif' }
 
 const ComicView = () => {
   const { id } = useParams()
   const [isLiked, setIsLiked] = useState(false)
   const [showShareMenu, setShowShareMenu] = useState(false)
   const [videoStatus, setVideoStatus] = useState(null)
+  const [videoPanels, setVideoPanels] = useState(null)
   const queryClient = useQueryClient()
 
   const { data: comic, isLoading: comicLoading } = useQuery({
@@ -24,18 +28,13 @@ const ComicView = () => {
     enabled: !!id,
   })
 
-  // Video generation mutation
+  // Video generation runs as a background job; the request only queues it
   const videoGenerationMutation = useMutation({
     mutationFn: () => generateVideo(id),
     onSuccess: (data) => {
+      setVideoStatus(data.status)
       if (data.status === 'completed') {
-        toast.success('Video generated successfully! 🎉')
-        setVideoStatus('completed')
-        // Refresh comic data to get updated video info
         queryClient.invalidateQueries(['comic', id])
-      } else {
-        toast.error('Video generation failed 😞')
-        setVideoStatus('failed')
       }
     },
     onError: (error) => {
@@ -45,6 +44,31 @@ const ComicView = () => {
     }
   })
 
+  // Follow the video job through the comic's event stream until it finishes
+  useEffect(() => {
+    // Wait for the POST to queue the job, so the stream's initial status is not the previous run's
+    if (!id || videoStatus !== 'generating' || videoGenerationMutation.isPending) return
+    const source = subscribeEvents(`comic:${id}`, {
+      video_panel_done: ({ panel, total }) => {
+        setVideoPanels(prev => ({ done: (prev?.done || 0) + 1, total, last: panel }))
+      },
+      video_status: (job) => {
+        if (job.status === 'completed') {
+          toast.success('Video generated successfully! 🎉')
+          setVideoStatus('completed')
+          setVideoPanels(null)
+          // Refresh comic data to get updated video info
+          queryClient.invalidateQueries(['comic', id])
+        } else if (job.status === 'failed') {
+          toast.error('Video generation failed 😞')
+          setVideoStatus('failed')
+          setVideoPanels(null)
+        }
+      }
+    })
+    return () => source.close()
+  }, [id, videoStatus, videoGenerationMutation.isPending])
+
   // Initialize video status from comic data
   useEffect(() => {
     if (comic) {
@@ -52,12 +76,26 @@ const ComicView = () => {
     }
   }, [comic])
 
-  const handleDownload = () => {
-    const link = document.createElement('a')
-    link.href = `/api/comics/${id}/image`
-    link.download = `${comic.title.replace(/[^a-zA-Z0-9]/g, '_')}_comic.png`
-    link.click()
-    toast.success('Comic downloaded! 📥')
+  const handleDownload = async () => {
+    try {
+      const response = await fetch(comicAssetUrl(comic, 'image'))
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`)
+      }
+      // Name the file after the format the server actually sent
+      const mediaType = (response.headers.get('content-type') || '').split(';')[0].trim()
+      const extension = IMAGE_EXTENSIONS[mediaType] || 'png'
+      const url = URL.createObjectURL(await response.blob())
+      const link = document.createElement('a')
+      link.href = url
+      link.download = `${comic.title.replace(/[^a-zA-Z0-9]/g, '_')}_comic.${extension}`
+      link.click()
+      setTimeout(() => URL.revokeObjectURL(url), 0)
+      toast.success('Comic downloaded! 📥')
+    } catch (error) {
+      toast.error('Failed to download comic 😞')
+      console.error('Download error:', error)
+    }
   }
 
   const handleShare = async () => {
@@ -283,7 +321,7 @@ const ComicView = () => {
             <div className="absolute top-0 left-0 w-full h-2 bg-gradient-to-r from-comic-blue via-comic-purple to-comic-red"></div>
 
             <img
-              src={`/api/comics/${id}/image`}
+              src={comicAssetUrl(comic, 'image', { size: 'full' })}
               alt={comic.title}
               className="w-full h-auto rounded-xl shadow-lg"
               onError={(e) => {
@@ -327,7 +365,7 @@ const ComicView = () => {
                     controlsList="nodownload"
                     preload="metadata"
                     playsInline
-                    poster={`/api/comics/${id}/image`}
+                    poster={comicAssetUrl(comic, 'image', { size: 'medium' })}
                     onError={(e) => {
                       console.error('Video loading error:', e.target.error)
                       toast.error('Failed to load video. Please try downloading it instead.')
@@ -341,13 +379,13 @@ const ComicView = () => {
                     }}
                   >
                     <source 
-                      src={`/api/comics/${encodeURIComponent(id)}/video`} 
+                      src={comicAssetUrl(comic, 'video')} 
                       type="video/mp4"
                     />
                     <div className="text-gray-500 text-center py-12 bg-gray-100 rounded-lg">
                       <p className="mb-4">Your browser doesn't support video playback.</p>
                       <a 
-                        href={`/api/comics/${encodeURIComponent(id)}/video`} 
+                        href={comicAssetUrl(comic, 'video')} 
                         className="bg-blue-500 text-white px-4 py-2 rounded-lg inline-block hover:bg-blue-600 transition-colors"
                         target="_blank"
                         rel="noopener noreferrer"
@@ -366,7 +404,7 @@ const ComicView = () => {
                 {/* Video Actions */}
                 <div className="flex flex-col sm:flex-row justify-center gap-4 mt-6">
                   <a
-                    href={`/api/comics/${encodeURIComponent(id)}/video`}
+                    href={comicAssetUrl(comic, 'video')}
                     download={`${comic.title.replace(/[^a-zA-Z0-9]/g, '_')}_video.mp4`}
                     className="btn-primary px-6 py-3 group"
                   >
@@ -377,7 +415,7 @@ const ComicView = () => {
                   </a>
 
                   <a
-                    href={`/api/comics/${encodeURIComponent(id)}/video`}
+                    href={comicAssetUrl(comic, 'video')}
                     target="_blank"
                     rel="noopener noreferrer"
                     className="btn-secondary px-6 py-3"
@@ -410,8 +448,16 @@ const ComicView = () => {
                 <p className="text-blue-600 mb-4">
                   Our AI is working its magic to animate your comic. This may take a few minutes.
                 </p>
+                {videoPanels && (
+                  <p className="text-sm text-blue-700 mb-2">
+                    {videoPanels.done} of {videoPanels.total} panel videos ready
+                  </p>
+                )}
                 <div className="w-full bg-blue-200 rounded-full h-2">
-                  <div className="bg-blue-600 h-2 rounded-full animate-pulse" style={{ width: '60%' }}></div>
+                  <div
+                    className={`bg-blue-600 h-2 rounded-full transition-all duration-300 ${videoPanels ? '' : 'animate-pulse'}`}
+                    style={{ width: videoPanels ? `${(videoPanels.done / videoPanels.total) * 100}%` : '10%' }}
+                  ></div>
                 </div>
               </div>
             )}
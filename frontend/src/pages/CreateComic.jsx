@@ -3,7 +3,7 @@ import { useMutation } from '@tanstack/react-query'
 import { useNavigate } from 'react-router-dom'
 import toast from 'react-hot-toast'
 import { Wand2, Loader, Clock, Sparkles, Brain, Palette, Zap, Lightbulb, Users, Eye, Target } from 'lucide-react'
-import { generateComic } from '../api/comics'
+import { generateComic, subscribeEvents } from '../api/comics'
 
 const CreateComic = () => {
   const navigate = useNavigate()
@@ -16,19 +16,38 @@ const CreateComic = () => {
   const [startTime, setStartTime] = useState(null)
   const [elapsedTime, setElapsedTime] = useState(0)
   const intervalRef = useRef(null)
+  const eventsRef = useRef(null)
+  // Real stage progress pushed by the server: script -> artwork (per panel) -> finalizing
+  const [progress, setProgress] = useState({ stage: 'script', panelsDone: 0, panelTotal: 0 })
+
+  const closeEvents = () => {
+    if (eventsRef.current) {
+      eventsRef.current.close()
+      eventsRef.current = null
+    }
+  }
 
   const generateMutation = useMutation({
     mutationFn: generateComic,
-    onMutate: () => {
+    onMutate: (data) => {
       const now = Date.now()
       setStartTime(now)
       setElapsedTime(0)
+      setProgress({ stage: 'script', panelsDone: 0, panelTotal: 0 })
 
       // Start timer
       intervalRef.current = setInterval(() => {
         setElapsedTime(Date.now() - now)
       }, 1000)
+
+      closeEvents()
+      eventsRef.current = subscribeEvents(`request:${data.progress_id}`, {
+        script_done: ({ panel_count }) => setProgress({ stage: 'artwork', panelsDone: 0, panelTotal: panel_count }),
+        panel_rendered: () => setProgress(prev => ({ ...prev, panelsDone: prev.panelsDone + 1 })),
+        composed: () => setProgress(prev => ({ ...prev, stage: 'finalizing' })),
+      })
     },
+    onSettled: closeEvents,
     onSuccess: (data) => {
       if (intervalRef.current) {
         clearInterval(intervalRef.current)
@@ -51,7 +70,8 @@ const CreateComic = () => {
       toast.error('Please enter a topic for your comic')
       return
     }
-    generateMutation.mutate(formData)
+    const progressId = window.crypto?.randomUUID?.() || `${Date.now()}-${Math.random().toString(36).slice(2)}`
+    generateMutation.mutate({ ...formData, progress_id: progressId })
   }
 
   const handleChange = (e) => {
@@ -319,19 +339,22 @@ const CreateComic = () => {
 
             {/* Progress Steps */}
             <div className="grid grid-cols-3 gap-4 max-w-2xl mx-auto">
-              <div className="text-center">
+              <div className={`text-center ${progress.stage === 'script' ? 'animate-pulse' : ''}`}>
                 <div className="w-12 h-12 bg-blue-100 text-blue-600 rounded-full flex items-center justify-center mx-auto mb-2">
                   <Brain size={20} />
                 </div>
                 <div className="text-sm font-medium text-blue-800">Generating Story</div>
               </div>
-              <div className="text-center">
+              <div className={`text-center ${progress.stage === 'artwork' ? 'animate-pulse' : ''} ${progress.stage === 'script' ? 'opacity-50' : ''}`}>
                 <div className="w-12 h-12 bg-purple-100 text-purple-600 rounded-full flex items-center justify-center mx-auto mb-2">
                   <Palette size={20} />
                 </div>
-                <div className="text-sm font-medium text-purple-800">Creating Artwork</div>
+                <div className="text-sm font-medium text-purple-800">
+                  Creating Artwork
+                  {progress.panelTotal > 0 && ` (${progress.panelsDone}/${progress.panelTotal})`}
+                </div>
               </div>
-              <div className="text-center">
+              <div className={`text-center ${progress.stage === 'finalizing' ? 'animate-pulse' : 'opacity-50'}`}>
                 <div className="w-12 h-12 bg-green-100 text-green-600 rounded-full flex items-center justify-center mx-auto mb-2">
                   <Sparkles size={20} />
                 </div>
@@ -1,15 +1,15 @@
 import { Link } from 'react-router-dom'
 import { Plus, Image, Sparkles, BookOpen, Zap, Brain, Palette, Wand2, Star, ArrowRight, Play } from 'lucide-react'
 import { useQuery } from '@tanstack/react-query'
-import { getComics } from '../api/comics'
+import { getComics, comicAssetUrl } from '../api/comics'
 
 const Home = () => {
   const { data: comicsData } = useQuery({
-    queryKey: ['comics'],
-    queryFn: getComics,
+    queryKey: ['comics', { limit: 3 }],
+    queryFn: () => getComics({ limit: 3 }),
   })
 
-  const recentComics = comicsData?.comics.slice(0, 3) || []
+  const recentComics = comicsData?.comics || []
 
   return (
     <div className="space-y-20 animate-fade-in">
@@ -183,7 +183,7 @@ const Home = () => {
 
                   <div className="aspect-square bg-gradient-to-br from-blue-100 via-purple-100 to-pink-100 rounded-xl mb-4 overflow-hidden relative">
                     <img
-                      src={`/api/comics/${comic.comic_id}/image`}
+                      src={comicAssetUrl(comic, 'image', { size: 'thumb' })}
                       alt={comic.title}
                       className="w-full h-full object-cover group-hover:scale-110 transition-transform duration-500"
                       onError={(e) => {